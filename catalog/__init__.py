@@ -0,0 +1,5 @@
+"""수강편람(엑셀)과 src/data/courses/*.ts 를 다루는 파이썬 도구 모음"""
+from .records import CourseRecord, CourseTable, CourseView, TimeBlock, normalize_id
+from .snapshot import Snapshot, write_snapshot
+from .sheets import SHEET_NAMES, load_sheets, parse_sheet, read_workbook_rows
+from .tsdata import COURSES_DIR, TS_FILES, dedupe_by_id, load_ts_courses, parse_ts_file
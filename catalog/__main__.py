@@ -0,0 +1,89 @@
+"""카탈로그 명령행 도구.
+
+    python -m catalog rooms free 화3-5 --building 06
+    python -m catalog rooms util
+    python -m catalog stats
+    python -m catalog alternatives 13479 --selected 11967-01
+    python -m catalog fill saved.json --category 전선 --year 2
+    python -m catalog plan --department 경영학과 --need 전필=6 교선=3 --require 13479 --max-credits 15
+    python -m catalog timetables exports/ --flagged flagged.jsonl
+    python -m catalog check-blocks
+    python -m catalog watch --excel excel_data.json
+    python -m catalog schema --excel excel_data.json
+    python -m catalog serve --port 8765
+    python -m catalog bench --url http://127.0.0.1:8765 --concurrency 200
+    python -m catalog export --out catalog_export
+    python -m catalog codeshare check
+    python -m catalog microdegrees show 생성형AI
+    python -m catalog startup-bench
+    python -m catalog xlsx check "26-1 수강편람 (4차).xlsx"
+    python -m catalog validate-batch semesters.json
+    python -m catalog online 원격강좌.xlsx check
+    python -m catalog ical --start 2026-03-02 --end 2026-06-19 sections
+    python -m catalog professors load --top 20
+    python -m catalog colleges check
+    python -m catalog feasible 13479 11967 25524
+    python -m catalog --xlsx-engine stream watch --excel "26-1 수강편람 (4차).xlsx"
+"""
+import argparse
+import importlib
+import sys
+
+from . import sheets
+from .tsdata import COURSES_DIR, dedupe_by_id, load_ts_courses
+
+# 서브커맨드 -> 모듈 (각 모듈의 register(subparsers) / run(args, catalog)).
+# 실행할 명령의 모듈만 import 해서 asyncio/numpy/pyarrow 같은 무거운 import 를 다른 명령이 떠안지 않게 한다.
+# 모듈에 NEEDS_CATALOG = False 가 있으면 TS 카탈로그를 읽지 않고 catalog=None 으로 호출한다.
+COMMANDS = {
+    'rooms': 'rooms', 'stats': 'stats', 'conflicts': 'conflicts', 'alternatives': 'alternatives',
+    'fill': 'gaps', 'plan': 'planner', 'timetables': 'timetables', 'check-blocks': 'blockcheck',
+    'watch': 'watch', 'schema': 'schema', 'serve': 'server', 'bench': 'bench', 'export': 'export',
+    'codeshare': 'codeshare', 'microdegrees': 'microdegrees', 'startup-bench': 'startup',
+    'xlsx': 'xlsx', 'validate-batch': 'batch', 'online': 'online',
+    'ical': 'ical', 'professors': 'professors', 'colleges': 'colleges',
+    'feasible': 'feasible',
+}
+# 값을 하나 받는 전역 옵션 (명령 이름을 찾을 때 값까지 건너뛴다)
+GLOBAL_OPTIONS = ('--courses-dir', '--xlsx-engine')
+
+
+def _requested_command(argv):
+    """argv 에서 서브커맨드 이름 (옵션과 전역 옵션 값은 건너뜀). 없으면 None"""
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in GLOBAL_OPTIONS:
+            i += 2
+            continue
+        if not arg.startswith('-'):
+            return arg
+        i += 1
+    return None
+
+
+def main(argv=None):
+    sys.stdout.reconfigure(encoding='utf-8')
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(prog='python -m catalog')
+    parser.add_argument('--courses-dir', default=COURSES_DIR, help='TS 과목 데이터 폴더')
+    parser.add_argument('--xlsx-engine', choices=('openpyxl', 'stream'), default='openpyxl',
+                        help='xlsx 읽기 방식 (stream: openpyxl 없이 zip/XML 직접 스트리밍)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    command = _requested_command(argv)
+    # 알 수 없는 명령이나 도움말이면 전체 목록을 보여 주기 위해 모든 모듈을 등록한다
+    names = [command] if command in COMMANDS else list(COMMANDS)
+    modules = {}
+    for name in names:
+        module = modules[name] = importlib.import_module(f'.{COMMANDS[name]}', __package__)
+        module.register(subparsers)
+    args = parser.parse_args(argv)
+    sheets.XLSX_ENGINE = args.xlsx_engine
+    catalog = None
+    if getattr(modules[args.command], 'NEEDS_CATALOG', True):
+        catalog = dedupe_by_id(load_ts_courses(args.courses_dir))
+    return args.func(args, catalog)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
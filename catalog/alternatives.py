@@ -0,0 +1,124 @@
+"""다른 분반 찾기.
+
+채플(13479-01~08)이나 선형대수학(11967-1/2)처럼 분반이 많은 과목에서 지금 고른 분반이
+다른 강의와 겹칠 때, 현재 선택과 겹치지 않는 같은 과목의 분반을 찾는다.
+
+학수번호 -> 분반 목록 인덱스를 한 번 만들고, 질의마다 해당 학수번호의 분반만
+선택 마스크와 AND 해서 맞는지 본다 (카탈로그 전체를 다시 훑지 않는다).
+"""
+from collections import namedtuple
+
+from .timeslots import DAY_INDEX, SLOT_MINUTES, course_mask
+
+# 변경 정도: (새로 생기는 등교 요일 수, 기존 분반 시간 밖으로 새로 잡히는 5분 슬롯 수)
+Alternative = namedtuple('Alternative', ['record', 'new_days', 'moved_slots'])
+
+
+def _day_set(record):
+    """분반이 수업하는 요일 비트 (월=1, 화=2, ...)"""
+    if record.is_time_confirmed is False:
+        return 0
+    days = 0
+    for b in record.time_blocks:
+        days |= 1 << DAY_INDEX[b.day]
+    return days
+
+
+class SectionIndex:
+    """학수번호 -> ((레코드, 시간 마스크, 요일 비트), ...)"""
+
+    def __init__(self, by_code, equivalents=None):
+        self.by_code = by_code
+        self.equivalents = equivalents or {}
+
+    @classmethod
+    def build(cls, records):
+        by_code = {}
+        names = {}
+        for r in records:
+            by_code.setdefault(r.code, []).append((r, course_mask(r), _day_set(r)))
+            names.setdefault(r.name, set()).add(r.code)
+
+        # 코드쉐어 과목은 다른 학과에서 같은 과목명으로 열린다 ('영미문화' 20981 / 25531).
+        # 코드쉐어 분반이 하나라도 있는 과목명으로 묶인 학수번호끼리를 대체 가능한 과목으로 본다.
+        equivalents = {}
+        for code, entries in by_code.items():
+            if not any(r.is_code_share for r, _, _ in entries):
+                continue
+            group = set()
+            for name in {r.name for r, _, _ in entries}:
+                group |= names[name]
+            for other in group:
+                equivalents.setdefault(other, set()).update(group)
+        for code, group in equivalents.items():
+            group.discard(code)
+        return cls({code: tuple(entries) for code, entries in by_code.items()},
+                   {code: tuple(sorted(group)) for code, group in equivalents.items() if group})
+
+    def sections(self, code):
+        return [r for r, _, _ in self.by_code.get(code, ())]
+
+    def equivalent_codes(self, code):
+        """코드쉐어로 같은 과목을 여는 다른 학수번호"""
+        return self.equivalents.get(code, ())
+
+    def alternatives(self, selection, code, include_equivalent=False):
+        """현재 선택(selection, 레코드 목록)과 겹치지 않는 code 의 분반을 변경이 적은 순으로 반환.
+
+        선택에 이미 들어 있는 code(와 대체 학수번호)의 분반은 바꿀 대상으로 보고 비교에서 뺀다.
+        정렬 기준은 새로 생기는 등교 요일 수, 그다음 기존 분반 시간 밖으로 새로 잡히는 시간(슬롯 수)이다.
+        시간 미확정 분반은 겹침 판정이 불가능하므로 맨 뒤에 둔다.
+        """
+        codes = (code,) + (tuple(self.equivalent_codes(code)) if include_equivalent else ())
+        swapped = {r.id for r in selection if r.code in codes}
+        busy = busy_days = replaced = 0
+        for r in selection:
+            if r.id in swapped:
+                replaced |= course_mask(r)
+            else:
+                busy |= course_mask(r)
+                busy_days |= _day_set(r)
+
+        result = []
+        for c in codes:
+            for r, mask, days in self.by_code.get(c, ()):
+                if r.id in swapped or mask & busy:
+                    continue
+                result.append(Alternative(r, (days & ~busy_days).bit_count(), (mask & ~replaced).bit_count()))
+        result.sort(key=lambda a: (a.record.is_time_confirmed is False, a.new_days, a.moved_slots,
+                                   a.record.code != code, a.record.id))
+        return result
+
+
+def register(subparsers):
+    p = subparsers.add_parser('alternatives', help='현재 선택과 겹치지 않는 다른 분반')
+    p.add_argument('code', help='학수번호 (예: 13479)')
+    p.add_argument('--selected', nargs='*', default=[], metavar='ID',
+                   help='현재 선택한 분반 id 목록 (예: 11967-01 13479-02)')
+    p.add_argument('--codeshare', action='store_true', help='코드쉐어로 같은 과목을 여는 학수번호도 포함')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    selection = []
+    for sid in args.selected:
+        record = catalog.lookup(sid)
+        if record is None:
+            print(f"{sid}: 카탈로그에 없는 분반입니다")
+            return 1
+        selection.append(record)
+
+    index = SectionIndex.build(catalog)
+    if args.code not in index.by_code:
+        print(f"{args.code}: 카탈로그에 없는 학수번호입니다")
+        return 1
+    result = index.alternatives(selection, args.code, args.codeshare)
+    total = len(index.sections(args.code))
+    print(f"{args.code} 분반 {total}개 중 현재 선택과 겹치지 않는 분반 ({len(result)}개):")
+    for a in result:
+        r = a.record
+        if r.is_time_confirmed is False:
+            change = '시간 미정'
+        else:
+            change = f"새 요일 {a.new_days}, 새 시간 {a.moved_slots * SLOT_MINUTES}분"
+        print(f"  {r.id:<10} {r.name}  {r.time_raw or '-'}  ({change})")
@@ -0,0 +1,162 @@
+"""여러 학기/차수 수강편람을 한 번에 검증.
+
+compare_final.py 는 EXCEL_PATH 를 고쳐 가며 수강편람마다 한 번씩 돌려야 했다.
+매니페스트(JSON)에 (수강편람, TS 과목 폴더) 쌍을 적어 두면 각 쌍을 프로세스 풀에서 동시에
+watch 와 같은 비교(COMPARISONS)로 검증하고, 결과를 표 하나로 모아 출력한다.
+
+    [
+      {"label": "26-1 3차", "workbook": "26-1 수강편람 (3차).xlsx", "courses": "src/data/courses"},
+      {"label": "26-1 4차", "workbook": "26-1 수강편람 (4차).xlsx", "courses": "src/data/courses"},
+      {"label": "25-2", "workbook": "25-2/excel_data.json", "courses": "25-2/courses",
+       "online": "25-2/원격강좌.csv"}
+    ]
+
+online(원격강좌 목록)은 선택이고, 있으면 online.ts 비교도 함께 한다. 상대 경로는 매니페스트
+파일 기준이다. 코드쉐어/마이크로디그리처럼 TS 전체와 비교하는 항목은 watch 와 같이 '추가'를 세지 않으므로
+누락/차이만 실패로 친다 (CI 검사로 쓸 수 있게). 출력은 표와 비교마다 예시 id 몇 개(--examples)다.
+TS 과목은 load_ts_courses 의 캐시(.catalog-cache.pickle)에서 읽는데, 같은 폴더를
+여러 작업이 쓰므로 시작 전에 부모 프로세스에서 폴더마다 한 번 캐시를 데워 둔다. 작업들이 동시에 돌므로 전체 시간은 가장 느린 수강편람 하나와 비슷하다.
+"""
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import sheets
+from .tsdata import load_ts_courses
+from .watch import WatchState
+
+NEEDS_CATALOG = False
+
+
+class ManifestError(ValueError):
+    pass
+
+
+def read_manifest(path):
+    """매니페스트 -> [{'label', 'workbook', 'courses', 'online'}] (경로는 매니페스트 기준으로 풀어 둔다)"""
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ManifestError(f"{path}: 작업 목록(JSON 배열)이 필요합니다")
+    base = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    for n, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or 'workbook' not in entry or 'courses' not in entry:
+            raise ManifestError(f"{path}: {n}번째 항목에 workbook, courses 가 필요합니다")
+        workbook = os.path.join(base, entry['workbook'])
+        online = entry.get('online')
+        jobs.append({'label': entry.get('label') or os.path.basename(workbook),
+                     'workbook': workbook, 'courses': os.path.join(base, entry['courses']),
+                     'online': os.path.join(base, online) if online else None})
+    return jobs
+
+
+def validate(job, engine='openpyxl'):
+    """작업 하나를 검증 (프로세스 풀 워커에서 실행). 결과는 JSON 으로 쓸 수 있는 dict"""
+    sheets.XLSX_ENGINE = engine
+    started = time.perf_counter()
+    result = {**job, 'comparisons': [], 'error': None}
+    try:
+        ts = load_ts_courses(job['courses']).by_source()
+        state = WatchState(job['workbook'], job['courses'], ts=ts, online_path=job['online'])
+    except Exception as e:  # 한 작업의 실패가 다른 작업의 결과를 막지 않게 한다
+        result['error'] = f"{type(e).__name__}: {e}"
+    else:
+        for c in state.comparisons:
+            result['comparisons'].append({
+                'name': c.name, 'countsExtra': c.counts_extra,
+                'missing': sorted(c.missing), 'extra': sorted(c.extra),
+                'diffs': [[cid, changes] for cid, changes in sorted(c.diffs.items())],
+            })
+    result['seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_batch(jobs, workers=None, engine='openpyxl'):
+    """jobs 를 동시에 검증해 매니페스트 순서대로 결과 목록을 반환"""
+    for courses in dict.fromkeys(job['courses'] for job in jobs):
+        if os.path.isdir(courses):
+            load_ts_courses(courses)  # 캐시를 한 번만 쓰고 워커는 읽기만 하게
+    workers = workers or min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        return [validate(job, engine) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(validate, jobs, [engine] * len(jobs)))
+
+
+def has_problems(result):
+    return result['error'] is not None or any(
+        c['missing'] or (c['countsExtra'] and c['extra']) or c['diffs'] for c in result['comparisons'])
+
+
+def _examples(ids, limit):
+    shown = ', '.join(ids[:limit])
+    return shown + (f" 외 {len(ids) - limit}개" if len(ids) > limit else '')
+
+
+def print_summary(results, elapsed, examples=5):
+    """작업 x 비교 표 (누락/추가/차이 수) 와, 문제가 있는 비교마다 예시 id 를 examples 개까지"""
+    names = [c['name'] for r in results for c in r['comparisons']]
+    names = list(dict.fromkeys(names))
+    width = max([len(r['label']) for r in results] + [4])
+    print(f"{'수강편람':<{width}}  {'시간':>6}  " + '  '.join(f"{n:<14}" for n in names))
+    for r in results:
+        line = f"{r['label']:<{width}}  {r['seconds']:>5.1f}s  "
+        if r['error']:
+            print(line + f"오류 {r['error']}")
+            continue
+        by_name = {c['name']: c for c in r['comparisons']}
+        cells = []
+        for n in names:
+            c = by_name.get(n)
+            if c is None:
+                cells.append('-')
+            else:
+                extra = len(c['extra']) if c['countsExtra'] else '-'
+                cells.append(f"{len(c['missing'])}/{extra}/{len(c['diffs'])}")
+        print(line + '  '.join(f"{cell:<14}" for cell in cells))
+    slowest = max((r['seconds'] for r in results), default=0)
+    total = sum(r['seconds'] for r in results)
+    print(f"\n칸: 누락/추가/차이 (TS 전체와 비교하는 항목은 추가 '-'). "
+          f"전체 {elapsed:.1f}초 (가장 느린 작업 {slowest:.1f}초, 작업 합계 {total:.1f}초)")
+    for r in results:
+        if not has_problems(r) or r['error']:
+            continue
+        print(f"\n[{r['label']}] {r['workbook']}")
+        for c in r['comparisons']:
+            if c['missing']:
+                print(f"  {c['name']:<10} 누락 {len(c['missing'])}: {_examples(c['missing'], examples)}")
+            if c['extra']:
+                print(f"  {c['name']:<10} 추가 {len(c['extra'])}: {_examples(c['extra'], examples)}")
+            if c['diffs']:
+                shown = [f"{cid} ({', '.join(changes)})" for cid, changes in c['diffs'][:examples]]
+                more = f" 외 {len(c['diffs']) - examples}개" if len(c['diffs']) > examples else ''
+                print(f"  {c['name']:<10} 차이 {len(c['diffs'])}: {'; '.join(shown)}{more}")
+
+
+def register(subparsers):
+    p = subparsers.add_parser('validate-batch', help='매니페스트의 (수강편람, TS 폴더) 쌍을 동시에 검증')
+    p.add_argument('manifest', help='[{"workbook": .., "courses": .., "label": ..}] 형식의 JSON')
+    p.add_argument('--workers', type=int, help='프로세스 수 (기본: 작업 수와 CPU 수 중 작은 값)')
+    p.add_argument('--json', action='store_true', help='결과 전체를 JSON 으로 출력')
+    p.add_argument('--examples', type=int, default=5, help='비교마다 보여 줄 누락/추가/차이 id 수')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    try:
+        jobs = read_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(e)
+        return 2
+    started = time.perf_counter()
+    results = run_batch(jobs, args.workers, sheets.XLSX_ENGINE)
+    elapsed = time.perf_counter() - started
+    if args.json:
+        json.dump({'seconds': round(elapsed, 3), 'results': results}, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_summary(results, elapsed, args.examples)
+    return 1 if any(has_problems(r) for r in results) else 0
@@ -0,0 +1,112 @@
+"""catalog serve 부하 측정 클라이언트.
+
+연결 N 개를 열어 두고(keep-alive) 각 연결이 요청을 차례로 보내며 요청별 지연을 잰다.
+질의는 현재 카탈로그에서 고른 분반 id/교수/학수번호로 만든 검색, 충돌, 빈 강의실 질의를 섞는다.
+"""
+import asyncio
+import math
+import random
+import time
+from urllib.parse import quote, urlsplit
+
+DAYS_QUERY = '월화수목금'
+
+
+def sample_paths(catalog, n, seed=0):
+    """카탈로그에서 뽑은 값으로 만든 질의 경로 n 개 (같은 seed 면 같은 목록)"""
+    rng = random.Random(seed)
+    records = [r for r in catalog if r.time_blocks]
+    ids = [r.id for r in records]
+    professors = sorted({p for r in records for p in r.professors})
+    codes = sorted({r.code for r in records})
+    categories = ['전필', '전선', '교필', '교선', '코드쉐어']
+
+    def when():
+        first = rng.randint(1, 8)
+        return quote(f"{rng.choice(DAYS_QUERY)}{first}-{first + rng.randint(0, 2)}")
+
+    makers = [
+        lambda: f"/course?id={rng.choice(ids)}",
+        lambda: f"/conflicts?id={rng.choice(ids)}",
+        lambda: f"/conflicts?ids={','.join(rng.sample(ids, 5))}",
+        lambda: f"/search?professor={quote(rng.choice(professors))}",
+        lambda: f"/search?q={rng.choice(codes)}",
+        lambda: f"/search?category={quote(rng.choice(categories))}&when={when()}",
+        lambda: f"/rooms/free?when={when()}",
+    ]
+    return [rng.choice(makers)() for _ in range(n)]
+
+
+async def _read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("서버가 연결을 닫았습니다")
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _client(host, port, paths, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for path in paths:
+            started = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1'))
+            await writer.drain()
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run_bench(host, port, paths, concurrency):
+    """(지연 목록(초), 상태 코드별 개수, 전체 소요 시간)"""
+    latencies, statuses = [], {}
+    chunks = [paths[i::concurrency] for i in range(concurrency)]
+    started = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, chunk, latencies, statuses) for chunk in chunks if chunk))
+    return latencies, statuses, time.perf_counter() - started
+
+
+def percentile(sorted_values, p):
+    """최근접 순위 백분위수"""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def register(subparsers):
+    p = subparsers.add_parser('bench', help='catalog serve 에 동시 요청을 보내 지연 백분위수 측정')
+    p.add_argument('--url', default='http://127.0.0.1:8765')
+    p.add_argument('--concurrency', type=int, default=200, help='동시 연결 수')
+    p.add_argument('--requests', type=int, default=10000, help='전체 요청 수')
+    p.add_argument('--seed', type=int, default=0)
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    url = urlsplit(args.url)
+    paths = sample_paths(catalog, args.requests, args.seed)
+    try:
+        latencies, statuses, elapsed = asyncio.run(
+            run_bench(url.hostname, url.port or 80, paths, args.concurrency))
+    except OSError as e:
+        print(f"{args.url} 에 연결할 수 없습니다: {e}")
+        return 1
+    latencies.sort()
+    ms = [x * 1000 for x in latencies]
+    print(f"요청 {len(ms)}개, 동시 연결 {args.concurrency}개, {elapsed:.2f}초 ({len(ms) / elapsed:,.0f} req/s)")
+    print("상태 코드: " + ', '.join(f"{s} {n}개" for s, n in sorted(statuses.items())))
+    print("지연(ms): " + ', '.join(f"p{p} {percentile(ms, p):.2f}" for p in (50, 90, 99))
+          + f", 최대 {ms[-1]:.2f}" if ms else "지연: 측정값 없음")
+    return 0 if set(statuses) <= {200} else 1
@@ -0,0 +1,119 @@
+"""TS 과목 데이터의 timeBlocks 가 timeRaw/roomRaw 와 맞는지 검사.
+
+각 Course 리터럴은 timeRaw/roomRaw 와 미리 계산한 timeBlocks 를 함께 가지고 있다.
+timeBlocks 를 parseTimeSlots.ts 와 같은 규칙(timeMap.ts 의 PERIOD_50MIN/PERIOD_75MIN)으로
+다시 만들어 저장된 값과 비교한다. 같은 (timeRaw, roomRaw, timeBlocks) 조합은 한 번만 판정한다.
+
+불일치 종류 (심각한 순):
+  time   - 요일/시각이 다름 (충돌 검사 결과가 달라짐)
+  room   - 강의실만 다름
+  merged - 연속 교시를 한 블록으로 합쳐 저장함 (쉬는 시간까지 점유로 잡힘)
+  order  - 블록 순서만 다름
+  group  - '/' 구분 그룹 번호만 다름 (시간표 표시에만 영향)
+"""
+import json
+import sys
+from collections import Counter
+
+from .timeslots import parse_time_slots, to_minutes
+
+KINDS = ('time', 'room', 'merged', 'order', 'group')
+# 이 종류는 기본 출력에서 개수만 보여준다
+MINOR_KINDS = ('order', 'group')
+
+# 합쳐진 블록으로 볼 수 있는 교시 사이 최대 간격 (75분제 쉬는 시간 15분)
+MAX_BREAK = 15
+
+# 중복 제거 전 TS 레코드를 직접 읽으므로 __main__ 의 카탈로그가 필요 없다
+NEEDS_CATALOG = False
+
+
+def _span(b):
+    return (b.day, b.start_time, b.end_time)
+
+
+def _merge(blocks):
+    """같은 요일에서 쉬는 시간 이내로 이어지는 블록을 하나로 합친 (요일, 시작, 끝) 목록"""
+    merged = []
+    for day, start, end in sorted(_span(b) for b in blocks):
+        if merged and merged[-1][0] == day and to_minutes(start) - to_minutes(merged[-1][2]) <= MAX_BREAK:
+            merged[-1] = (day, merged[-1][1], max(end, merged[-1][2]))
+        else:
+            merged.append((day, start, end))
+    return merged
+
+
+def classify(stored, derived):
+    """저장된 블록과 다시 만든 블록 비교 -> 불일치 종류 (같으면 None)"""
+    if stored == derived:
+        return None
+    if sorted(map(_span, stored)) != sorted(map(_span, derived)):
+        if stored and _merge(stored) == _merge(derived) and len(stored) < len(derived):
+            return 'merged'
+        return 'time'
+    if sorted((_span(b), b.room) for b in stored) != sorted((_span(b), b.room) for b in derived):
+        return 'room'
+    if [(_span(b), b.room) for b in stored] != [(_span(b), b.room) for b in derived]:
+        return 'order'
+    return 'group'
+
+
+def check_blocks(records):
+    """[(레코드, 종류, 다시 만든 블록)] — 같은 입력 조합은 캐시된 판정을 쓴다"""
+    cache = {}
+    issues = []
+    for r in records:
+        key = (r.time_raw, r.room_raw, r.time_blocks)
+        hit = cache.get(key)
+        if hit is None:
+            derived = parse_time_slots(r.time_raw, r.room_raw)
+            hit = cache[key] = (classify(r.time_blocks, derived), derived)
+        if hit[0] is not None:
+            issues.append((r, hit[0], hit[1]))
+    return issues
+
+
+def _fmt(blocks):
+    return ' '.join(f"{b.day}{b.start_time}-{b.end_time}" + (f"@{b.room}" if b.room else '') + f"#{b.group}"
+                    for b in blocks) or '(없음)'
+
+
+def register(subparsers):
+    p = subparsers.add_parser('check-blocks', help='timeBlocks 와 timeRaw/roomRaw 일치 검사')
+    p.add_argument('--all', action='store_true', help='순서/그룹 번호만 다른 과목도 모두 출력')
+    p.add_argument('--json', action='store_true', help='JSON 으로 출력')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    from .tsdata import load_ts_courses
+
+    # 중복 제거 전 전체 TS 파일을 검사한다 (index.ts 에서 가려지는 사본도 데이터 파일에는 남아 있다)
+    records = load_ts_courses(args.courses_dir)
+    issues = check_blocks(records)
+    counts = Counter(kind for _, kind, _ in issues)
+
+    if args.json:
+        json.dump({
+            'courses': len(records),
+            'counts': {k: counts[k] for k in KINDS},
+            'issues': [{'id': r.id, 'source': r.source, 'kind': kind, 'timeRaw': r.time_raw,
+                        'roomRaw': r.room_raw, 'stored': [list(b) for b in r.time_blocks],
+                        'derived': [list(b) for b in derived]}
+                       for r, kind, derived in issues],
+        }, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(f"검사한 과목: {len(records)}개, 불일치: {len(issues)}개 "
+              + ', '.join(f"{k} {counts[k]}" for k in KINDS))
+        for kind in KINDS:
+            if not counts[kind] or (kind in MINOR_KINDS and not args.all):
+                continue
+            print(f"\n[{kind}] {counts[kind]}개")
+            for r, k, derived in issues:
+                if k != kind:
+                    continue
+                print(f"  {r.source:<22} {r.id:<10} {r.name}  {r.time_raw!r} / {r.room_raw!r}")
+                print(f"    저장: {_fmt(r.time_blocks)}")
+                print(f"    계산: {_fmt(derived)}")
+    return 1 if any(counts[k] for k in KINDS if k not in MINOR_KINDS) else 0
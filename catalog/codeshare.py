@@ -0,0 +1,218 @@
+"""코드쉐어 물리 수업 묶기.
+
+같은 분반이 여러 목록에 올라오는 것(경영학원론 10239-05 가 전공 시트와 코드쉐어 시트에 함께
+나오는 식)은 id 가 같으므로 그대로 한 수업이다 (same_session(a, a) 는 참).
+여기서 묶는 것은 학수번호/분반은 다르지만 같은 과목을 같은 시간, 같은 강의실, 같은 교수가
+한 교실에서 하는 합반이다 (자기계발과미래설계 22437-67/22437-125 처럼 학과별로 나뉜 분반).
+
+분반의 시간블록마다 (과목명, 학-강-실, 요일, 시작, 끝, 강의실, 교수) 키를 만들고, 키를 공유하는
+분반끼리 union-find 로 합친다 (경로 압축 + 크기 기준 합치기, 거의 선형 시간). 블록 하나만 공유해도
+같은 그룹이 되므로 화/목 중 한 요일만 합반하는 경우도 이어진다.
+과목이 다르면 시간/강의실/교수가 같아도 묶지 않는다 (한 교수가 한 교실에서 두 과목을 겹쳐 연 것은
+중복 배정이다). 교수는 professors.professor_key 로 정규화하고, '초빙-1' 같은 미정 자리나 기관 이름은
+사람이 아니므로 쓰지 않는다. 교수나 강의실이 미정이거나 시간이 미확정인 분반은 묶지 않는다.
+
+그룹은 강의실/교수 중복 배정 검사(같은 그룹끼리는 중복이 아님), 저장 시간표 수요 집계,
+public/data/sessions.json (그룹별 분반 id 목록. 앱의 시간 충돌 경고가 같은 수업 분반끼리의
+충돌을 '코드쉐어로 묶인 같은 수업'으로 알려 주는 데 쓴다) 에 쓰인다.
+"""
+import json
+import os
+
+from .records import normalize_name
+from .rooms import split_rooms
+from .timeslots import block_mask, parse_time_slots
+
+SESSIONS_ASSET = os.path.join('public', 'data', 'sessions.json')
+ASSET_VERSION = 1
+
+
+class UnionFind:
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return ra
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        return ra
+
+
+def record_blocks(record):
+    """TS 레코드는 저장된 timeBlocks, 엑셀 레코드는 강의시간/강의실 문자열에서 만든 블록"""
+    if record.is_time_confirmed is False:
+        return ()
+    if record.time_blocks:
+        return record.time_blocks
+    return parse_time_slots(record.time_raw, record.room_raw)
+
+
+def professor_names(record):
+    """교수명 목록. 엑셀 셀은 '홍길동,김철수' 한 문자열이라 쉼표로 나눈다"""
+    return [p.strip() for cell in record.professors for p in cell.split(',') if p.strip()]
+
+
+def session_keys(record):
+    """(과목명, 학-강-실, 요일, 시작, 끝, 강의실, 교수) 키들. 강의실/교수(사람) 미정이면 빈 목록"""
+    # professors.py 가 이 모듈을 import 하므로 여기서 가져온다
+    from .professors import PERSON, professor_keys
+
+    professors = [name for name, kind in professor_keys(record) if kind == PERSON]
+    if not professors:
+        return []
+    course = (normalize_name(record.name).replace(' ', ''), record.credit_detail)
+    keys = []
+    for b in record_blocks(record):
+        for room in split_rooms(b.room):
+            keys.extend((course, b.day, b.start_time, b.end_time, room, p) for p in professors)
+    return keys
+
+
+class SessionGroups:
+    """분반 id -> 물리 수업 그룹 번호. 다른 분반과 묶이지 않은 분반은 그룹에 없다"""
+
+    def __init__(self, groups):
+        self.groups = groups
+        self.group_of = {sid: g for g, members in enumerate(groups) for sid in members}
+
+    @classmethod
+    def build(cls, records):
+        ids = []
+        first = {}
+        seen = set()
+        for r in records:
+            if r.id in seen:
+                continue
+            seen.add(r.id)
+            ids.append(r.id)
+        uf = UnionFind(len(ids))
+        index = {sid: i for i, sid in enumerate(ids)}
+        for r in records:
+            i = index[r.id]
+            for key in session_keys(r):
+                j = first.setdefault(key, i)
+                if j != i:
+                    uf.union(i, j)
+        members = {}
+        for sid, i in index.items():
+            members.setdefault(uf.find(i), []).append(sid)
+        groups = sorted(sorted(m) for m in members.values() if len(m) > 1)
+        return cls(groups)
+
+    def same_session(self, a, b):
+        if a == b:
+            return True
+        g = self.group_of.get(a)
+        return g is not None and g == self.group_of.get(b)
+
+    def canonical(self, section_id):
+        """그룹의 대표 id (그룹에서 가장 작은 id, 그룹이 없으면 자기 자신)"""
+        g = self.group_of.get(section_id)
+        return section_id if g is None else self.groups[g][0]
+
+    def fold(self, counter):
+        """id 별 개수를 그룹 대표 id 별 개수로 합친다 (수요 집계용)"""
+        folded = {}
+        for sid, n in counter.items():
+            key = self.canonical(sid)
+            folded[key] = folded.get(key, 0) + n
+        return folded
+
+    def to_json(self):
+        return {'version': ASSET_VERSION, 'groups': self.groups}
+
+
+def double_bookings(records, key_of, sessions):
+    """key_of(레코드, 블록) 이 같고 시간이 겹치는데 같은 물리 수업이 아닌 분반 쌍.
+
+    [(키, id, id)] — 강의실 중복은 key_of=강의실, 교수 중복은 key_of=교수 로 호출한다.
+    """
+    by_key = {}
+    for r in records:
+        for b in record_blocks(r):
+            for key in key_of(r, b):
+                entries = by_key.setdefault(key, {})
+                entries[r.id] = entries.get(r.id, 0) | block_mask(b)
+    clashes = []
+    for key in sorted(by_key):
+        entries = sorted(by_key[key].items())
+        for n, (a, ma) in enumerate(entries):
+            for b, mb in entries[n + 1:]:
+                if ma & mb and not sessions.same_session(a, b):
+                    clashes.append((key, a, b))
+    return clashes
+
+
+def room_keys(record, block):
+    return split_rooms(block.room)
+
+
+def professor_keys(record, block):
+    return professor_names(record)
+
+
+def write_sessions_asset(sessions, path=SESSIONS_ASSET):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(sessions.to_json(), f, ensure_ascii=False, separators=(',', ':'))
+
+
+def register(subparsers):
+    p = subparsers.add_parser('codeshare', help='같은 시간/강의실/교수 분반을 물리 수업 그룹으로 묶기')
+    sub = p.add_subparsers(dest='codeshare_command', required=True)
+    show = sub.add_parser('groups', help='물리 수업 그룹 목록')
+    show.add_argument('--excel', help='TS 대신 엑셀 시트 전체(xlsx 또는 excel_data.json)로 묶기')
+    check = sub.add_parser('check', help='같은 수업을 뺀 강의실/교수 중복 배정')
+    check.add_argument('--excel', help='TS 대신 엑셀 시트 전체(xlsx 또는 excel_data.json)로 검사')
+    emit = sub.add_parser('emit', help=f'그룹을 {SESSIONS_ASSET} 로 저장')
+    emit.add_argument('--out', default=SESSIONS_ASSET)
+    p.set_defaults(func=run)
+
+
+def _excel_records(path):
+    from .watch import read_excel
+
+    return [r for table in read_excel(path).values() for r in table]
+
+
+def run(args, catalog):
+    records = _excel_records(args.excel) if getattr(args, 'excel', None) else list(catalog)
+    sessions = SessionGroups.build(records)
+    if args.codeshare_command == 'emit':
+        write_sessions_asset(sessions, args.out)
+        print(f"{args.out}: 그룹 {len(sessions.groups)}개, 분반 {len(sessions.group_of)}개")
+        return 0
+    by_id = {}
+    for r in records:
+        by_id.setdefault(r.id, r)
+    if args.codeshare_command == 'groups':
+        print(f"물리 수업 그룹 {len(sessions.groups)}개 (분반 {len(sessions.group_of)}개)")
+        for members in sessions.groups:
+            first = by_id[members[0]]
+            print(f"  {first.time_raw} / {first.room_raw} / {first.professor}")
+            for sid in members:
+                r = by_id[sid]
+                print(f"    {sid:<10} {r.name}  {r.department or r.source}")
+        return 0
+    status = 0
+    for label, key_of in (('강의실', room_keys), ('교수', professor_keys)):
+        clashes = double_bookings(records, key_of, sessions)
+        print(f"[{label} 중복 배정] {len(clashes)}건")
+        for key, a, b in clashes:
+            print(f"  {key}: {a} {by_id[a].name} ({by_id[a].time_raw}) x {b} {by_id[b].name} ({by_id[b].time_raw})")
+        status = status or (1 if clashes else 0)
+    return status
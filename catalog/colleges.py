@@ -0,0 +1,210 @@
+"""단과대학/학과 표준 사전 검증.
+
+src/constants/collegeDepartments.ts 의 COLLEGE_DEPARTMENTS 가 단과대학 -> 학과의 표준 이름이다.
+데이터의 이름은 가운뎃점이 'ㆍ' / '·' / '.' 로 섞이고('생명.나노과학대학'), 여러 대학이
+', ' 또는 줄바꿈으로 이어지며('스마트융합대학\n\n린튼글로벌스쿨'), 사전에 없는 이름도 있다.
+
+사전을 한 번 읽어 정규화 키(구분자와 공백 제거, filterCourses.ts 의 normalizeCollege 와 같은 규칙)
+-> 표준 이름 조회표로 만들고, 엑셀 모든 시트의 행과 TS 모든 과목을 한 번에 검사한다.
+같은 (단과대학, 학과) 값은 한 번만 검사하고 결과를 재사용한다 (수천 행에 서로 다른 값은 수백 개).
+  미등록  사전에 없는 이름
+  표기    정규화하면 사전에 있지만 표기가 다름 (표준 표기를 함께 보여 준다)
+  소속    학과가 그 행의 단과대학에 속하지 않음
+'모든 대학', '재수강' 같은 표시용 값은 검사하지 않는다.
+
+emit 은 TS 과목 id -> 표준 단과대학 번호를 public/data/colleges.json 으로 저장한다.
+앱은 이 파일이 있으면 과목마다 단과대학 문자열을 나누고 정규화하지 않고 번호로 바로 비교한다.
+과목마다 단과대학 문자열의 지문도 넣어, 자산을 만든 뒤 단과대학이 바뀐 과목은 앱이 문자열로 비교한다.
+"""
+import json
+import os
+import re
+
+from .records import asset_fingerprint
+
+COLLEGE_DEPARTMENTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'constants',
+                                        'collegeDepartments.ts')
+COLLEGES_ASSET = os.path.join('public', 'data', 'colleges.json')
+ASSET_VERSION = 2
+
+UNKNOWN, NONCANONICAL, MISMATCH = '미등록', '표기', '소속'
+# 단과대학/학과가 아니라 대상을 나타내는 값
+SPECIAL_VALUES = ('모든 대학', '모든 학과', '재수강', '외국인유학생')
+
+_ENTRY = re.compile(r"'([^']+)'\s*:\s*\[(.*?)\]", re.S)
+_STRING = re.compile(r"'([^']*)'")
+_SEPARATORS = re.compile(r'[·ㆍ.\s]')
+_VALUE_SPLIT = re.compile(r'[,\n]')
+
+
+def college_key(name):
+    """'생명.나노과학대학', '생명ㆍ나노과학대학' -> '생명나노과학대학'"""
+    return _SEPARATORS.sub('', name)
+
+
+def split_values(value):
+    """', ' 또는 줄바꿈으로 이어진 여러 이름 -> 이름 목록 (빈 칸 제외)"""
+    return [p.strip() for p in _VALUE_SPLIT.split(value) if p.strip()]
+
+
+def load_college_departments(path=COLLEGE_DEPARTMENTS_PATH):
+    """collegeDepartments.ts -> {단과대학: (학과, ...)} (파일 순서 유지)"""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    return {college: tuple(_STRING.findall(body)) for college, body in _ENTRY.findall(text)}
+
+
+class CollegeDirectory:
+    """정규화 키 -> 표준 이름 조회표와 값별 검사 결과 캐시"""
+
+    def __init__(self, departments):
+        self.departments = departments
+        self.colleges = list(departments)
+        self.college_by_key = {college_key(c): c for c in departments}
+        self.department_by_key = {}
+        self.colleges_of = {}   # 표준 학과명 -> 속한 단과대학들
+        for college, names in departments.items():
+            for d in names:
+                self.department_by_key.setdefault(college_key(d), d)
+                self.colleges_of.setdefault(d, []).append(college)
+        self.checked = {}   # (단과대학, 학과) -> 문제 목록
+
+    @classmethod
+    def load(cls, path=COLLEGE_DEPARTMENTS_PATH):
+        return cls(load_college_departments(path))
+
+    def resolve_colleges(self, value):
+        """단과대학 값 -> 표준 단과대학 목록 (사전에 없는 이름은 빠진다)"""
+        names = []
+        for part in split_values(value):
+            c = self.college_by_key.get(college_key(part))
+            if c is not None and c not in names:
+                names.append(c)
+        return names
+
+    def _check_names(self, field, value, by_key):
+        """값 하나 -> (표준 이름 목록, [(필드, 값, 종류, 설명)])"""
+        canonical = []
+        unknown = []
+        for part in split_values(value):
+            if part in SPECIAL_VALUES:
+                canonical.append(part)
+                continue
+            name = by_key.get(college_key(part))
+            if name is None:
+                unknown.append(part)
+            else:
+                canonical.append(name)
+        if unknown:
+            return canonical, [(field, value, UNKNOWN, ', '.join(f"'{p}'" for p in unknown) + " 은(는) 사전에 없음")]
+        if ', '.join(canonical) != value:
+            return canonical, [(field, value, NONCANONICAL, f"표준 표기 '{', '.join(canonical)}'")]
+        return canonical, []
+
+    def check(self, college, department):
+        """(단과대학, 학과) 값 쌍의 문제 목록. 같은 쌍은 캐시된 결과를 돌려준다"""
+        key = (college, department)
+        found = self.checked.get(key)
+        if found is not None:
+            return found
+        problems = []
+        colleges = []
+        if college:
+            colleges, problems = self._check_names('단과대학', college, self.college_by_key)
+        if department:
+            departments, dept_problems = self._check_names('학과', department, self.department_by_key)
+            problems += dept_problems
+            known = set(colleges) - set(SPECIAL_VALUES)
+            if known:
+                for d in departments:
+                    owners = self.colleges_of.get(d)
+                    if owners and known.isdisjoint(owners):
+                        problems.append(('학과', department, MISMATCH,
+                                         f"'{d}' 은(는) {', '.join(owners)} 소속 (행의 단과대학: {college})"))
+        self.checked[key] = problems
+        return problems
+
+    def to_json(self, records):
+        """TS 과목 id -> 표준 단과대학 번호 목록 (알아볼 수 있는 단과대학이 있는 과목만)과 단과대학 문자열 지문"""
+        number = {c: i for i, c in enumerate(self.colleges)}
+        resolved = {}
+        sections = {}
+        fingerprints = {}
+        for r in records:
+            if not r.college:
+                continue
+            found = resolved.get(r.college)
+            if found is None:
+                found = resolved[r.college] = ([number[c] for c in self.resolve_colleges(r.college)],
+                                               asset_fingerprint(r.college))
+            colleges, fp = found
+            if colleges:
+                sections[r.id] = colleges
+                fingerprints[r.id] = fp
+        return {'version': ASSET_VERSION, 'names': self.colleges, 'sections': sections,
+                'fingerprints': fingerprints}
+
+
+def validate(directory, sources):
+    """sources: [(이름, 레코드들)] -> {(필드, 값, 종류, 설명): [(이름, id)]} (레코드를 한 번씩만 훑는다)"""
+    found = {}
+    for label, records in sources:
+        for r in records:
+            for problem in directory.check(r.college, r.department):
+                found.setdefault(problem, []).append((label, r.id))
+    return found
+
+
+def write_colleges_asset(data, path=COLLEGES_ASSET):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def register(subparsers):
+    p = subparsers.add_parser('colleges', help='단과대학/학과 이름을 collegeDepartments.ts 사전으로 검사')
+    p.add_argument('--dictionary', default=COLLEGE_DEPARTMENTS_PATH, help='COLLEGE_DEPARTMENTS 가 있는 TS 파일')
+    sub = p.add_subparsers(dest='colleges_command', required=True)
+    check = sub.add_parser('check', help='엑셀 모든 시트와 TS 모든 과목의 미등록/표기/소속 문제')
+    check.add_argument('--excel', default='excel_data.json', help='xlsx 또는 excel_data.json')
+    check.add_argument('--no-excel', action='store_true', help='TS 과목만 검사')
+    check.add_argument('--examples', type=int, default=3, help='문제마다 보여 줄 분반 수')
+    emit = sub.add_parser('emit', help=f'과목별 표준 단과대학 번호를 {COLLEGES_ASSET} 로 저장')
+    emit.add_argument('--out', default=COLLEGES_ASSET)
+    p.set_defaults(func=run)
+
+
+NEEDS_CATALOG = False
+
+
+def run(args, catalog):
+    from .tsdata import load_ts_courses
+
+    directory = CollegeDirectory.load(args.dictionary)
+    ts = load_ts_courses(args.courses_dir)
+    if args.colleges_command == 'emit':
+        data = directory.to_json(ts)
+        write_colleges_asset(data, args.out)
+        print(f"{args.out}: 단과대학 {len(data['names'])}개, 과목 {len(data['sections'])}개")
+        return 0
+    sources = []
+    if not args.no_excel:
+        from .watch import read_excel
+
+        sources += [(f"엑셀 {sheet}", table) for sheet, table in read_excel(args.excel).items()]
+    sources += [(f"TS {source}", view) for source, view in ts.by_source().items()]
+    found = validate(directory, sources)
+    rows = sum(len(records) for _, records in sources)
+    print(f"사전: 단과대학 {len(directory.colleges)}개, 학과 {len(directory.colleges_of)}개 / "
+          f"검사: {rows}행, 서로 다른 값 {len(directory.checked)}개, 문제 {len(found)}종")
+    for kind in (UNKNOWN, NONCANONICAL, MISMATCH):
+        problems = sorted((p for p in found if p[2] == kind), key=lambda p: (p[0], -len(found[p]), p[1]))
+        if not problems:
+            continue
+        print(f"\n[{kind}] {len(problems)}종")
+        for field, value, _, message in problems:
+            places = found[(field, value, kind, message)]
+            examples = ', '.join(f"{label} {sid}" for label, sid in places[:args.examples])
+            more = f" 외 {len(places) - args.examples}" if len(places) > args.examples else ''
+            print(f"  {field} {value!r}: {message} — {len(places)}건 ({examples}{more})")
+    return 1 if found else 0
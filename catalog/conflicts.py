@@ -0,0 +1,149 @@
+"""분반 간 시간 충돌 인접 정보 사전 계산.
+
+같은 시간 패턴(요일/시각이 완전히 같은 블록 묶음)을 가진 분반은 충돌 관계도 같으므로
+패턴 단위로 계산한다. 패턴들의 시간 구간을 시작 시각 순으로 정렬해 한 번 훑으면서
+(sweep) 아직 끝나지 않은 구간과만 비교해 겹치는 패턴 쌍을 찾는다.
+
+결과는 public/data/conflicts.json 으로 저장해 앱(CourseList)이 선택한 강의와
+겹치는 분반을 바로 흐리게 표시하는 데 쓴다. 분반마다 시간 블록의 지문(time_fingerprint)을 함께 넣어,
+자산을 만든 뒤 시간이 바뀐 분반은 앱이 인덱스 대신 detectConflict 로 비교한다.
+"""
+import base64
+import json
+import os
+
+from .records import asset_fingerprint
+from .timeslots import DAY_INDEX, blocks_mask, course_mask, to_minutes
+
+CONFLICTS_ASSET = os.path.join('public', 'data', 'conflicts.json')
+ASSET_VERSION = 2
+
+
+def time_fingerprint(blocks):
+    """시간 블록들의 지문 (src/utils/conflictIndex.ts 의 timeFingerprint 와 같은 문자열로 계산)"""
+    return asset_fingerprint(','.join(f"{b.day}{b.start_time}-{b.end_time}" for b in blocks))
+
+
+class ConflictIndex:
+    """분반 id -> 시간 패턴, 패턴 -> 겹치는 패턴 집합"""
+
+    def __init__(self, section_pattern, adjacency, members=None, fingerprints=None):
+        self.section_pattern = section_pattern
+        self.adjacency = adjacency
+        self.fingerprints = fingerprints or {}   # 분반 id -> time_fingerprint
+        if members is None:
+            members = [[] for _ in adjacency]
+            for sid, p in section_pattern.items():
+                members[p].append(sid)
+        self.members = members
+
+    @classmethod
+    def build(cls, records):
+        patterns = {}
+        intervals = []
+        members = []
+        section_pattern = {}
+        fingerprints = {}
+        for r in records:
+            if r.is_time_confirmed is False or not r.time_blocks:
+                continue
+            mask = blocks_mask(r.time_blocks)
+            if not mask:
+                continue
+            p = patterns.get(mask)
+            if p is None:
+                p = patterns[mask] = len(members)
+                members.append([])
+                for b in r.time_blocks:
+                    base = DAY_INDEX[b.day] * 24 * 60
+                    intervals.append((base + to_minutes(b.start_time), base + to_minutes(b.end_time), p))
+            members[p].append(r.id)
+            if r.id not in section_pattern:
+                section_pattern[r.id] = p
+                fingerprints[r.id] = time_fingerprint(r.time_blocks)
+        return cls(section_pattern, sweep(intervals, len(members)), members, fingerprints)
+
+    def conflicts(self, section_id):
+        """section_id 와 시간이 겹치는 다른 분반 id 목록"""
+        p = self.section_pattern.get(section_id)
+        if p is None:
+            return []
+        return [sid for q in sorted(self.adjacency[p]) for sid in self.members[q] if sid != section_id]
+
+    def to_json(self):
+        n = len(self.adjacency)
+        return {
+            'version': ASSET_VERSION,
+            'patterns': n,
+            'sections': self.section_pattern,
+            'fingerprints': self.fingerprints,
+            'adjacency': [encode_bitset(adj, n) for adj in self.adjacency],
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        n = data['patterns']
+        return cls(data['sections'], [decode_bitset(s, n) for s in data['adjacency']],
+                   fingerprints=data.get('fingerprints'))
+
+
+def sweep(intervals, n_patterns):
+    """(start, end, pattern) 구간들에서 겹치는 패턴 쌍을 찾아 패턴별 인접 집합으로 반환"""
+    adjacency = [set() for _ in range(n_patterns)]
+    active = []
+    for start, end, p in sorted(intervals):
+        active = [(e, q) for e, q in active if e > start]
+        adj = adjacency[p]
+        adj.add(p)
+        for _, q in active:
+            adj.add(q)
+            adjacency[q].add(p)
+        active.append((end, p))
+    return adjacency
+
+
+def encode_bitset(indices, size):
+    """정수 집합 -> base64 비트셋 (비트 i = 바이트 i>>3 의 (i&7) 번째 비트)"""
+    buf = bytearray((size + 7) // 8)
+    for i in indices:
+        buf[i >> 3] |= 1 << (i & 7)
+    return base64.b64encode(bytes(buf)).decode('ascii')
+
+
+def decode_bitset(text, size):
+    buf = base64.b64decode(text)
+    return {i for i in range(size) if buf[i >> 3] >> (i & 7) & 1}
+
+
+def write_conflicts_asset(index, path=CONFLICTS_ASSET):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(index.to_json(), f, ensure_ascii=False, separators=(',', ':'))
+
+
+def register(subparsers):
+    p = subparsers.add_parser('conflicts', help='분반 간 시간 충돌 인접 정보')
+    sub = p.add_subparsers(dest='conflicts_command', required=True)
+    show = sub.add_parser('show', help='한 분반과 겹치는 분반 목록')
+    show.add_argument('section_id', help='학수번호-분반 (예: 11967-01)')
+    emit = sub.add_parser('emit', help=f'인접 정보를 {CONFLICTS_ASSET} 로 저장')
+    emit.add_argument('--out', default=CONFLICTS_ASSET)
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    if args.conflicts_command == 'show':
+        record = catalog.lookup(args.section_id)
+        if record is None:
+            print(f"{args.section_id}: 카탈로그에 없는 분반입니다")
+            return 1
+        # 한 분반만 볼 때는 전체 인접 정보를 만들지 않고 마스크만 비교한다
+        mask = course_mask(record)
+        matches = [r for r in catalog if r.id != record.id and course_mask(r) & mask]
+        print(f"{record.id} ({record.name} {record.time_raw}) 와 겹치는 분반 ({len(matches)}개):")
+        for r in matches:
+            print(f"  {r.id}  {r.name}  {r.time_raw}")
+    else:
+        index = ConflictIndex.build(catalog)
+        write_conflicts_asset(index, args.out)
+        print(f"{args.out}: 분반 {len(index.section_pattern)}개, 시간 패턴 {len(index.adjacency)}개")
@@ -0,0 +1,76 @@
+"""엑셀 레코드와 TS 레코드 비교.
+
+공통 id 마다 먼저 지문(CourseRecord.fingerprint)만 비교하고, 지문이 다른 과목만
+필드별로 비교한다. 엑셀 쪽은 지문 dict 와 레코드를 꺼내는 함수만 있으면 되므로
+Snapshot 의 행 단위 읽기와 함께 쓰면 바뀐 행만 읽는다.
+"""
+from collections import namedtuple
+
+from .professors import professor_keys
+from .records import normalize_name, normalize_time
+
+DiffResult = namedtuple('DiffResult', ['missing', 'extra', 'diffs', 'unchanged'])
+
+
+def field_changes(excel_entry, src_entry):
+    """compare_all.py 의 필드 비교 ('필드: 소스->엑셀' 문자열 목록)"""
+    changes = []
+    # 이름 비교 (로마숫자 정규화 후)
+    if normalize_name(excel_entry.name) != normalize_name(src_entry.name):
+        changes.append(f"name: '{src_entry.name}'->'{excel_entry.name}'")
+    # 시간 비교 (구분자 정규화 후)
+    if normalize_time(excel_entry.time_raw) != normalize_time(src_entry.time_raw):
+        changes.append(f"timeRaw: '{src_entry.time_raw}'->'{excel_entry.time_raw}'")
+    # 강의실 비교
+    if excel_entry.room_raw != src_entry.room_raw:
+        changes.append(f"roomRaw: '{src_entry.room_raw}'->'{excel_entry.room_raw}'")
+    # 교수 비교 (professors.py 와 같은 이름 정규화, 한쪽이 비어 있으면 비교하지 않음)
+    excel_prof = [name for name, _ in professor_keys(excel_entry)]
+    src_prof = [name for name, _ in professor_keys(src_entry)]
+    if excel_prof and src_prof and excel_prof != src_prof:
+        changes.append(f"professor: '{src_entry.professor}'->'{excel_entry.professor}'")
+    # 학점 비교
+    if excel_entry.credit_detail != src_entry.credit_detail:
+        changes.append(f"creditDetail: '{src_entry.credit_detail}'->'{excel_entry.credit_detail}'")
+    # 원격강좌 필드 (엑셀 시트 행에는 없으므로 엑셀 쪽에 값이 있을 때만 비교)
+    for label, field in (('capacity', 'capacity'), ('organizer', 'organizer'),
+                         ('partnerUniversity', 'partner_university')):
+        excel_value = getattr(excel_entry, field)
+        src_value = getattr(src_entry, field)
+        if excel_value is not None and (src_value or '') != excel_value:
+            changes.append(f"{label}: '{src_value or ''}'->'{excel_value}'")
+    return changes
+
+
+def diff_by_fingerprint(excel_fingerprints, src_by_id, excel_record, ids=None):
+    """excel_fingerprints: id -> 지문, src_by_id: id -> 레코드 (둘 다 정규화 id),
+    excel_record: id -> 엑셀 레코드 (지문이 다를 때만 호출).
+
+    ids 를 주면 그 id 들만 비교한다 (파일 하나가 바뀌었을 때 영향 받은 id 만 다시 비교).
+    """
+    excel_ids = set(excel_fingerprints)
+    src_ids = set(src_by_id)
+    if ids is not None:
+        ids = set(ids)
+        excel_ids &= ids
+        src_ids &= ids
+    diffs = []
+    unchanged = 0
+    for cid in sorted(excel_ids & src_ids):
+        src_entry = src_by_id[cid]
+        if excel_fingerprints[cid] == src_entry.fingerprint:
+            unchanged += 1
+            continue
+        changes = field_changes(excel_record(cid), src_entry)
+        if changes:
+            diffs.append((cid, changes))
+        else:
+            unchanged += 1
+    return DiffResult(excel_ids - src_ids, src_ids - excel_ids, diffs, unchanged)
+
+
+def diff_views(excel_view, src_view, ids=None):
+    """CourseView 두 개 비교 (엑셀 id 는 이미 정규화, TS id 는 정규화해서 맞춘다)"""
+    excel_by_id = excel_view.by_id()
+    return diff_by_fingerprint({cid: r.fingerprint for cid, r in excel_by_id.items()},
+                               src_view.by_id(normalize=True), excel_by_id.__getitem__, ids)
@@ -0,0 +1,134 @@
+"""분석용 Arrow/Parquet 내보내기.
+
+중복 제거한 카탈로그(index.ts 와 같은 병합 결과)를 두 테이블로 쓴다.
+  courses      분반 한 행 (교수/마이크로디그리 목록은 list 컬럼)
+  time_blocks  시간블록 한 행 (분반 id 로 courses 와 조인)
+반복이 많은 문자열 컬럼(단과대학, 학과, 이수구분, 요일, 강의실 ...)은 dictionary 로 인코딩하고,
+두 테이블 모두 학기/이수구분(괄호 앞 부분) 으로 hive 형식 파티션을 나눈다
+(out/courses/semester=2026-1/category_group=전선/part-0.parquet).
+분석 쪽에서는 pyarrow.dataset / pandas.read_parquet 로 필요한 컬럼과 파티션만 읽으면 된다.
+
+pyarrow 는 이 모듈에서만 쓰므로 `python -m catalog export` 를 실행할 때만 필요하다.
+"""
+import os
+import shutil
+
+from .stats import base_category
+from .timeslots import to_minutes
+
+# dictionary 로 인코딩할 문자열 컬럼
+COURSE_DICT_COLUMNS = ('name', 'category', 'college', 'department', 'major', 'year', 'professor',
+                       'time_raw', 'room_raw', 'source', 'organizer', 'partner_university', 'capacity')
+BLOCK_DICT_COLUMNS = ('day', 'start_time', 'end_time', 'room')
+PARTITION_COLUMNS = ('semester', 'category_group')
+FORMATS = {'parquet': 'parquet', 'arrow': 'ipc'}
+
+
+def course_columns(tables):
+    """[(학기, 카탈로그)] -> (courses 컬럼 dict, time_blocks 컬럼 dict)"""
+    courses = {k: [] for k in (
+        'semester', 'category_group', 'id', 'code', 'section', 'name', 'category', 'credits',
+        'college', 'department', 'major', 'year', 'professor', 'professors', 'time_raw', 'room_raw',
+        'is_time_confirmed', 'is_code_share', 'is_microdegree', 'microdegree_names', 'capacity',
+        'organizer', 'partner_university', 'source', 'fingerprint')}
+    blocks = {k: [] for k in (
+        'semester', 'category_group', 'id', 'day', 'start_time', 'end_time', 'start_minute',
+        'end_minute', 'room', 'group')}
+    for semester, table in tables:
+        for r in table:
+            group = base_category(r.category)
+            courses['semester'].append(semester)
+            courses['category_group'].append(group)
+            for field in ('id', 'code', 'section', 'name', 'category', 'credits', 'college',
+                          'department', 'major', 'year', 'professor', 'time_raw', 'room_raw',
+                          'is_time_confirmed', 'is_code_share', 'is_microdegree', 'capacity',
+                          'organizer', 'partner_university', 'source', 'fingerprint'):
+                courses[field].append(getattr(r, field))
+            courses['professors'].append(list(r.professors))
+            courses['microdegree_names'].append(list(r.microdegree_names))
+            for b in r.time_blocks:
+                blocks['semester'].append(semester)
+                blocks['category_group'].append(group)
+                blocks['id'].append(r.id)
+                blocks['day'].append(b.day)
+                blocks['start_time'].append(b.start_time)
+                blocks['end_time'].append(b.end_time)
+                blocks['start_minute'].append(to_minutes(b.start_time))
+                blocks['end_minute'].append(to_minutes(b.end_time))
+                blocks['room'].append(b.room)
+                blocks['group'].append(b.group)
+    return courses, blocks
+
+
+def to_arrow(columns, dict_columns, types=None):
+    """컬럼 dict -> pyarrow.Table. dict_columns 와 파티션 컬럼은 dictionary<int32, string>"""
+    import pyarrow as pa
+
+    types = types or {}
+    arrays = {}
+    for name, values in columns.items():
+        encoded = name in dict_columns or name in PARTITION_COLUMNS
+        # 값이 모두 None 인 컬럼(원격강좌가 없는 학기의 organizer 등)도 null 이 아닌 string 사전으로 쓴다
+        arr = pa.array(values, type=types.get(name, pa.string() if encoded else None))
+        if encoded:
+            arr = arr.dictionary_encode()
+        arrays[name] = arr
+    return pa.table(arrays)
+
+
+def build_tables(tables):
+    """[(학기, 카탈로그)] -> (courses, time_blocks) pyarrow.Table"""
+    import pyarrow as pa
+
+    courses, blocks = course_columns(tables)
+    course_table = to_arrow(courses, COURSE_DICT_COLUMNS, {
+        'credits': pa.int8(), 'professors': pa.list_(pa.string()),
+        'microdegree_names': pa.list_(pa.string())})
+    block_table = to_arrow(blocks, BLOCK_DICT_COLUMNS, {
+        'start_minute': pa.int16(), 'end_minute': pa.int16(), 'group': pa.int8()})
+    return course_table, block_table
+
+
+def write_tables(course_table, block_table, out_dir, fmt='parquet'):
+    """out_dir/courses, out_dir/time_blocks 에 파티션별로 쓰고 {테이블: 바이트 수} 반환"""
+    import pyarrow.dataset as ds
+
+    sizes = {}
+    for name, table in (('courses', course_table), ('time_blocks', block_table)):
+        path = os.path.join(out_dir, name)
+        # delete_matching 은 이번에 쓰는 파티션만 지우므로, 이번 카탈로그에 없는 학기/이수구분의
+        # 이전 파티션이 남지 않게 테이블 폴더를 먼저 비운다
+        shutil.rmtree(path, ignore_errors=True)
+        ds.write_dataset(table, path, format=FORMATS[fmt], partitioning=list(PARTITION_COLUMNS),
+                         partitioning_flavor='hive', existing_data_behavior='delete_matching',
+                         basename_template='part-{i}.' + ('parquet' if fmt == 'parquet' else 'arrow'))
+        sizes[name] = sum(os.path.getsize(os.path.join(root, f))
+                          for root, _, files in os.walk(path) for f in files)
+    return sizes
+
+
+def register(subparsers):
+    p = subparsers.add_parser('export', help='카탈로그를 Arrow/Parquet 로 내보내기 (학기/이수구분 파티션)')
+    p.add_argument('extra_dirs', nargs='*', help='함께 내보낼 다른 학기의 과목 데이터 폴더 (폴더 이름이 학기)')
+    p.add_argument('--out', default='catalog_export', help='출력 폴더')
+    p.add_argument('--format', choices=sorted(FORMATS), default='parquet')
+    p.add_argument('--semester', default='current', help='--courses-dir 카탈로그의 학기 이름')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    from .tsdata import dedupe_by_id, load_ts_courses
+
+    tables = [(args.semester, catalog)]
+    for d in args.extra_dirs:
+        semester = os.path.basename(os.path.normpath(d))
+        tables.append((semester, dedupe_by_id(load_ts_courses(d, semester=semester))))
+    try:
+        course_table, block_table = build_tables(tables)
+    except ImportError:
+        print("pyarrow 가 필요합니다: pip install pyarrow")
+        return 1
+    sizes = write_tables(course_table, block_table, args.out, args.format)
+    print(f"{args.out}: courses {course_table.num_rows}행 {sizes['courses'] / 1024:,.0f}KB, "
+          f"time_blocks {block_table.num_rows}행 {sizes['time_blocks'] / 1024:,.0f}KB ({args.format})")
+    return 0
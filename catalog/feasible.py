@@ -0,0 +1,337 @@
+"""희망 과목 목록(위시리스트)으로 만들 수 있는 시간표 조합 수 세기.
+
+학수번호마다 분반 하나씩을 골라 시간이 겹치지 않는 조합이 몇 개인지 (하나라도 있는지),
+어느 과목이 병목인지를 전체 탐색 전에 바로 답한다. 조합을 하나씩 나열하면 분반 수의 곱만큼
+늘어나므로 세기만 한다.
+
+  1. 분반을 주간 점유 마스크(course_mask)로 바꾸고, 과목 안에서 같은 마스크는 (마스크, 개수) 하나로 합친다.
+  2. 시간이 한 칸도 겹칠 수 없는 과목끼리는 독립이므로 충돌 그래프의 연결 요소로 나누고
+     요소별 개수를 곱한다.
+  3. 요소 안에서는 과목 순서대로 고르는 DP. 상태는 지금까지 고른 마스크 중 뒤에 올 과목들이
+     쓸 수 있는 칸만 남긴 것이어서 (future 마스크와 AND) 같은 상태가 많이 겹치고, 메모이즈한다.
+     과목 순서는 선택지가 적은 과목부터, 이미 고른 과목과 많이 겹치는 과목을 앞으로 둔다.
+  4. 요소의 DP 상태 수가 max_states 를 넘으면 (분반이 많은 교양 과목 여럿처럼 조합이 수십조 개인 경우)
+     정확한 값 대신 시간 예산 안에서 Knuth 표본 추정을 하고, 추정값과 95% 구간, 상한을 준다.
+     상한은 과목들을 작은 덩어리로 나눠 덩어리마다 정확히 센 값의 곱이다 (덩어리 사이 충돌을 무시한 완화).
+
+병목 점수: 과목 c 를 뺀 나머지 조합마다 c 의 분반을 하나 붙였을 때 겹치지 않는 비율을 r 이라 하면
+1 - r 이다 (0 이면 어떤 조합에도 잘 들어가고, 1 이면 c 의 어떤 분반도 들어갈 자리가 없다).
+과목 c 를 뺀 DP 는 c 의 각 분반 마스크를 시작 상태로 다시 쓰므로, 분반별로 들어가는 조합 수도 함께 나온다.
+시간 미확정 분반은 detectConflict 와 같이 어떤 분반과도 겹치지 않는 것으로 센다.
+"""
+import json
+import math
+import random
+import sys
+import time
+
+from .codeshare import UnionFind
+from .timeslots import course_mask
+
+DEFAULT_MAX_STATES = 100_000    # 요소 하나(병목 계산 포함)에 쓸 DP 상태 수
+DEFAULT_BUDGET = 1.0            # 추정으로 바뀌었을 때 표본 추출에 쓸 시간 (초)
+CHUNK_STATES = 5_000            # 상한 계산에서 덩어리 하나에 쓸 DP 상태 수
+
+
+class StateBudgetExceeded(Exception):
+    pass
+
+
+class Course:
+    """위시리스트의 과목 하나: 학수번호(또는 고정 분반)와 (마스크, 분반 수) 선택지"""
+    __slots__ = ('key', 'name', 'sections', 'options', 'union')
+
+    def __init__(self, key, name, sections):
+        self.key = key
+        self.name = name
+        self.sections = sections
+        counts = {}
+        for r in sections:
+            m = course_mask(r)
+            counts[m] = counts.get(m, 0) + 1
+        self.options = sorted(counts.items(), key=lambda o: -o[1])
+        self.union = 0
+        for m, _ in self.options:
+            self.union |= m
+
+    @property
+    def size(self):
+        return len(self.sections)
+
+
+class _Budget:
+    """여러 DP 가 나눠 쓰는 상태 수 한도"""
+
+    def __init__(self, states):
+        self.left = states
+
+
+class _Counter:
+    """과목 목록 하나(순서 고정)의 메모이즈 DP. 시작 마스크만 바꿔 여러 번 물을 수 있다"""
+
+    def __init__(self, courses, budget):
+        self.options = [c.options for c in courses]
+        n = len(courses)
+        self.future = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            self.future[i] = self.future[i + 1] | courses[i].union
+        self.memo = {}
+        self.budget = budget
+
+    def count(self, start=0):
+        return self._go(0, start & self.future[0])
+
+    def _go(self, i, mask):
+        if i == len(self.options):
+            return 1
+        key = (i, mask)
+        found = self.memo.get(key)
+        if found is not None:
+            return found
+        if self.budget.left <= 0:
+            raise StateBudgetExceeded
+        self.budget.left -= 1
+        nxt = self.future[i + 1]
+        total = 0
+        for m, k in self.options[i]:
+            if not m & mask:
+                total += k * self._go(i + 1, (mask | m) & nxt)
+        self.memo[key] = total
+        return total
+
+
+def order_courses(courses):
+    """선택지가 적은 과목부터, 이후로는 이미 고른 과목들과 많이 겹치는 과목부터"""
+    rest = sorted(courses, key=lambda c: (len(c.options), c.key))
+    ordered = [rest.pop(0)] if rest else []
+    used = ordered[0].union if ordered else 0
+    while rest:
+        best = max(range(len(rest)), key=lambda j: ((rest[j].union & used).bit_count(), -len(rest[j].options)))
+        c = rest.pop(best)
+        ordered.append(c)
+        used |= c.union
+    return ordered
+
+
+def components(courses):
+    """충돌할 수 있는 과목끼리 묶은 연결 요소 목록"""
+    uf = UnionFind(len(courses))
+    for i, a in enumerate(courses):
+        for j in range(i + 1, len(courses)):
+            if a.union & courses[j].union:
+                uf.union(i, j)
+    groups = {}
+    for i, c in enumerate(courses):
+        groups.setdefault(uf.find(i), []).append(c)
+    return list(groups.values())
+
+
+def chunk_upper_bound(ordered, chunk_states=CHUNK_STATES):
+    """순서대로 과목을 덩어리에 넣다가 DP 가 chunk_states 를 넘으면 새 덩어리를 연다.
+    덩어리별 정확한 조합 수의 곱은 (덩어리 사이 충돌을 무시했으므로) 전체 조합 수의 상한이다"""
+    bound = 1
+    chunk = []
+    counted = 1
+    for c in ordered:
+        try:
+            counted_with = _Counter(chunk + [c], _Budget(chunk_states)).count()
+        except StateBudgetExceeded:
+            bound *= counted
+            chunk, counted_with = [c], c.size
+        else:
+            chunk.append(c)
+        counted = counted_with
+    return bound * counted
+
+
+def sample_count(courses, rng, deadline, min_samples=100):
+    """Knuth 추정: 무작위 경로의 (단계별 양립 선택지 수의 곱) 평균.
+    deadline 까지 (최소 min_samples 개) 뽑는다. (추정값, 표준오차, 표본 수)"""
+    total = total_sq = 0
+    samples = 0
+    while samples < min_samples or (samples & 255 or time.perf_counter() < deadline):
+        mask, estimate = 0, 1
+        for c in courses:
+            fits = [(m, k) for m, k in c.options if not m & mask]
+            weight = sum(k for _, k in fits)
+            if not weight:
+                estimate = 0
+                break
+            estimate *= weight
+            pick = rng.randrange(weight)
+            for m, k in fits:
+                pick -= k
+                if pick < 0:
+                    mask |= m
+                    break
+        total += estimate
+        total_sq += estimate * estimate
+        samples += 1
+    mean = total / samples
+    variance = max(total_sq / samples - mean * mean, 0)
+    return mean, math.sqrt(variance / samples), samples
+
+
+class CourseReport:
+    __slots__ = ('course', 'bottleneck', 'live_sections', 'without')
+
+    def __init__(self, course, bottleneck, live_sections, without):
+        self.course = course
+        self.bottleneck = bottleneck        # 0~1 (None: 나머지 과목만으로도 조합이 없음)
+        self.live_sections = live_sections  # 조합에 하나라도 들어가는 분반 수
+        self.without = without              # 이 과목을 뺐을 때 같은 요소의 조합 수
+
+
+class FeasibleCount:
+    """count 결과. exact 가 False 이면 count 는 추정값이고 low/high 가 95% 구간, upper 가 상한"""
+
+    def __init__(self, count, exact, low, high, upper, reports, seconds, states, samples=0):
+        self.count = count
+        self.exact = exact
+        self.low = low
+        self.high = high
+        self.upper = upper
+        self.reports = reports
+        self.seconds = seconds
+        self.states = states
+        self.samples = samples
+
+    def to_json(self):
+        return {
+            'count': self.count, 'exact': self.exact, 'low': self.low, 'high': self.high, 'upper': self.upper,
+            'ms': round(self.seconds * 1000, 2), 'states': self.states, 'samples': self.samples,
+            'courses': [{'course': r.course.key, 'name': r.course.name, 'sections': r.course.size,
+                         'patterns': len(r.course.options), 'liveSections': r.live_sections,
+                         'bottleneck': r.bottleneck, 'without': r.without} for r in self.reports],
+        }
+
+
+def _exact_component(courses, max_states):
+    """요소 하나의 (조합 수, {과목 key: CourseReport}, 상태 수). 상태가 max_states 를 넘으면 StateBudgetExceeded"""
+    budget = _Budget(max_states)
+    count = _Counter(order_courses(courses), budget).count()
+    reports = {}
+    for c in courses:
+        others = _Counter(order_courses([o for o in courses if o is not c]), budget)
+        without = others.count()
+        live = sum(k for m, k in c.options if others.count(m))
+        bottleneck = None if not without else round(1 - count / (without * c.size), 4)
+        reports[c.key] = CourseReport(c, bottleneck, live, without)
+    return count, reports, max_states - budget.left
+
+
+def _estimated_component(courses, rng, seconds):
+    """요소 하나의 (추정값, 표준오차, 상한, {과목 key: CourseReport}, 표본 수).
+    시간의 절반은 전체 추정에, 나머지는 과목을 하나씩 뺀 추정(병목 점수)에 나눠 쓴다"""
+    ordered = order_courses(courses)
+    mean, error, samples = sample_count(ordered, rng, time.perf_counter() + seconds / 2)
+    reports = {}
+    share = seconds / 2 / len(courses)
+    for c in courses:
+        rest = order_courses([o for o in courses if o is not c])
+        without, _, n = sample_count(rest, rng, time.perf_counter() + share)
+        samples += n
+        bottleneck = None if not without else round(min(max(1 - mean / (without * c.size), 0), 1), 4)
+        reports[c.key] = CourseReport(c, bottleneck, None, round(without))
+    return mean, error, chunk_upper_bound(ordered), reports, samples
+
+
+def count_feasible(courses, max_states=DEFAULT_MAX_STATES, budget=DEFAULT_BUDGET, seed=0):
+    """courses: [Course] -> FeasibleCount. 요소별로 정확히 세고, 상태 한도를 넘는 요소만 추정한다"""
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    exact_product = 1
+    estimates = []  # (추정값, 표준오차, 상한)
+    reports = {}
+    states = samples = 0
+    groups = components(courses)
+    for group in groups:
+        try:
+            count, group_reports, group_states = _exact_component(group, max_states)
+        except StateBudgetExceeded:
+            mean, error, upper, group_reports, n = _estimated_component(group, rng, budget / len(groups))
+            estimates.append((mean, error, upper))
+            samples += n
+        else:
+            exact_product *= count
+            states += group_states
+        reports.update(group_reports)
+    ordered_reports = [reports[c.key] for c in courses]
+    elapsed = time.perf_counter() - started
+    if not estimates:
+        return FeasibleCount(exact_product, True, exact_product, exact_product, exact_product,
+                             ordered_reports, elapsed, states)
+    mean = low = high = upper = exact_product
+    for m, error, bound in estimates:
+        mean *= min(m, bound)  # 표본 평균이 상한을 넘으면 상한이 더 정확하다
+        low *= max(m - 1.96 * error, 0)
+        high *= min(m + 1.96 * error, bound)
+        upper *= bound
+    return FeasibleCount(mean, False, low, high, upper, ordered_reports, elapsed, states, samples)
+
+
+def wishlist_courses(catalog, items):
+    """'13479' (학수번호의 모든 분반) 또는 '11967-01' (그 분반만) 목록 -> [Course]. 없는 항목은 ValueError"""
+    by_code = {}
+    for r in catalog:
+        by_code.setdefault(r.code, []).append(r)
+    courses = []
+    for item in dict.fromkeys(items):
+        if '-' in item:
+            r = catalog.lookup(item)
+            if r is None:
+                raise ValueError(f"{item}: 카탈로그에 없는 분반입니다")
+            courses.append(Course(item, r.name, [r]))
+        else:
+            sections = by_code.get(item)
+            if not sections:
+                raise ValueError(f"{item}: 카탈로그에 없는 학수번호입니다")
+            courses.append(Course(item, sections[0].name, sections))
+    return courses
+
+
+def register(subparsers):
+    p = subparsers.add_parser('feasible', help='희망 과목들로 만들 수 있는 겹치지 않는 시간표 조합 수와 병목 과목')
+    p.add_argument('items', nargs='+', metavar='CODE|ID', help='학수번호 (모든 분반) 또는 분반 id (고정)')
+    p.add_argument('--max-states', type=int, default=DEFAULT_MAX_STATES,
+                   help='정확히 셀 때 쓸 DP 상태 수 한도 (넘으면 표본 추정)')
+    p.add_argument('--budget', type=float, default=DEFAULT_BUDGET, help='추정으로 바뀌었을 때 쓸 시간 (초)')
+    p.add_argument('--json', action='store_true', help='JSON 으로 출력')
+    p.set_defaults(func=run)
+
+
+def _format_count(value):
+    return f"{value:,}" if isinstance(value, int) else f"{value:,.0f}"
+
+
+def run(args, catalog):
+    try:
+        courses = wishlist_courses(catalog, args.items)
+    except ValueError as e:
+        print(e)
+        return 1
+    result = count_feasible(courses, args.max_states, args.budget)
+    if args.json:
+        json.dump(result.to_json(), sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0 if result.count else 1
+    total = math.prod(c.size for c in courses)
+    if result.exact:
+        print(f"겹치지 않는 조합 {_format_count(result.count)}개 (분반 조합 {total:,}개 중, "
+              f"{result.seconds * 1000:.1f}ms, DP 상태 {result.states:,}개)")
+    else:
+        print(f"겹치지 않는 조합 약 {_format_count(result.count)}개 (95% 구간 {_format_count(result.low)}"
+              f"~{_format_count(result.high)}, 상한 {_format_count(result.upper)}, 분반 조합 {total:,}개 중, "
+              f"{result.seconds * 1000:.1f}ms, 표본 {result.samples:,}개)")
+    print(f"  {'과목':<10} {'분반':>4} {'패턴':>4} {'가능':>4} {'병목':>6}  과목명")
+    for r in sorted(result.reports, key=lambda r: (-(r.bottleneck if r.bottleneck is not None else -1), r.course.key)):
+        c = r.course
+        live = '-' if r.live_sections is None else r.live_sections
+        score = '-' if r.bottleneck is None else f"{r.bottleneck:.2f}"
+        print(f"  {c.key:<10} {c.size:>4} {len(c.options):>4} {live:>4} {score:>6}  {c.name}")
+    if not result.count:
+        blockers = [r.course.key for r in result.reports if r.without]
+        if blockers:
+            print(f"조합이 없습니다. 빼면 조합이 생기는 과목: {', '.join(blockers)}")
+        return 1
+    return 0
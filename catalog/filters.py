@@ -0,0 +1,45 @@
+"""src/utils/filterCourses.ts 의 필터 조건을 파이썬에서 같은 의미로 쓰기 위한 함수"""
+
+ONLINE_ORGANIZER = '교수학습원격교육센터'
+
+
+def matches_category(record, categories):
+    """filterCourses.ts 의 이수구분 필터와 같은 판정 ('교선'은 온라인강좌 포함 등)"""
+    if not categories:
+        return True
+    for cat in categories:
+        if cat == '코드쉐어':
+            if record.is_code_share is True:
+                return True
+        elif cat == '마이크로디그리':
+            if record.is_microdegree is True:
+                return True
+        elif cat == '교선':
+            if record.category == '교선' or record.organizer == ONLINE_ORGANIZER:
+                return True
+        elif cat == '온라인':
+            if record.organizer == ONLINE_ORGANIZER:
+                return True
+        elif record.category.startswith(cat):
+            return True
+    return False
+
+
+def matches_year(record, years):
+    """year 는 '1,2' 처럼 쉼표로 여러 학년일 수 있다"""
+    if not years:
+        return True
+    course_years = [y.strip() for y in record.year.split(',')]
+    return any(y in course_years for y in years)
+
+
+def matches_credits(record, credits):
+    return not credits or record.credits in credits
+
+
+def make_filter(categories=(), years=(), credits=()):
+    """FilterState 의 categories / years / credits 조건을 묶은 판정 함수"""
+    def predicate(record):
+        return (matches_category(record, categories) and matches_year(record, years)
+                and matches_credits(record, credits))
+    return predicate
@@ -0,0 +1,106 @@
+"""저장된 시간표의 빈 시간에 들어가는 강의 추천.
+
+분반을 시간 패턴(마스크)별로 묶은 인덱스를 한 번 만든다. 질의 때는 패턴 묶음마다
+마스크 AND 한 번으로 빈 시간에 들어가는지 보고, 들어가는 묶음의 분반에만
+이수구분/학년/학점 필터(FilterState 와 같은 의미)를 적용한다.
+시간 미확정 분반은 빈 시간에 들어가는지 알 수 없으므로 추천하지 않는다.
+"""
+from collections import namedtuple
+
+from .filters import make_filter
+from .saved import find_timetable, load_saved_timetables
+from .timeslots import DAYS, SLOT_MINUTES, SLOTS_PER_DAY, WEEK_SLOTS, course_mask
+
+Candidate = namedtuple('Candidate', ['record', 'new_days', 'touching'])
+
+# 쉬는 시간(50분제 10분, 75분제 15분) 이내로 이어지는 수업은 붙어 있는 것으로 본다
+BREAK_SLOTS = 15 // SLOT_MINUTES
+_WEEK = (1 << WEEK_SLOTS) - 1
+
+
+def _day_set(mask):
+    days = 0
+    for d in range(len(DAYS)):
+        if (mask >> (d * SLOTS_PER_DAY)) & ((1 << SLOTS_PER_DAY) - 1):
+            days |= 1 << d
+    return days
+
+
+def touching_edges(mask, busy):
+    """mask 의 블록 시작/끝 중 쉬는 시간 이내로 기존 수업과 이어지는 곳의 수 (공강을 만들지 않는 정도).
+
+    요일 경계를 넘는 비트 이동은 08:00 이전/24:00 직전 수업이 없으므로 따로 막지 않는다.
+    """
+    starts = mask & ~(mask << 1)
+    ends = mask & ~(mask >> 1)
+    before = after = 0
+    for k in range(1, BREAK_SLOTS + 2):
+        before |= busy << k
+        after |= busy >> k
+    return (starts & before).bit_count() + (ends & after & _WEEK).bit_count()
+
+
+class PatternIndex:
+    """시간 마스크 -> (요일 비트, 분반 튜플)"""
+
+    def __init__(self, groups):
+        self.groups = groups
+
+    @classmethod
+    def build(cls, records):
+        groups = {}
+        for r in records:
+            mask = course_mask(r)
+            if not mask:
+                continue
+            groups.setdefault(mask, []).append(r)
+        return cls({mask: (_day_set(mask), tuple(rs)) for mask, rs in groups.items()})
+
+    def fitting(self, busy, predicate=None, exclude_codes=()):
+        """busy 와 겹치지 않는 분반을 잘 맞는 순으로 반환.
+
+        정렬 기준: 새로 생기는 등교 요일 수(적을수록), 기존 수업과 붙어 있는 경계 수(많을수록).
+        """
+        busy_days = _day_set(busy)
+        result = []
+        for mask, (days, records) in self.groups.items():
+            if mask & busy:
+                continue
+            new_days = (days & ~busy_days).bit_count()
+            touching = touching_edges(mask, busy)
+            for r in records:
+                if r.code in exclude_codes or (predicate and not predicate(r)):
+                    continue
+                result.append(Candidate(r, new_days, touching))
+        result.sort(key=lambda c: (c.new_days, -c.touching, c.record.id))
+        return result
+
+
+def register(subparsers):
+    p = subparsers.add_parser('fill', help='저장된 시간표의 빈 시간에 들어가는 강의')
+    p.add_argument('saved', help='저장된 시간표 JSON (SavedTimetable 또는 그 배열)')
+    p.add_argument('--timetable', help='시간표 id 또는 이름 (기본: 마지막으로 수정한 시간표)')
+    p.add_argument('--category', nargs='*', default=[], help="이수구분 (예: 전선 교선 코드쉐어)")
+    p.add_argument('--year', nargs='*', default=[], help='학년')
+    p.add_argument('--credits', nargs='*', type=int, default=[], help='학점')
+    p.add_argument('--top', type=int, default=30)
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    timetable = find_timetable(load_saved_timetables(args.saved), args.timetable)
+    if timetable is None:
+        print(f"{args.saved}: 시간표를 찾을 수 없습니다")
+        return 1
+    busy = 0
+    for r in timetable.records:
+        busy |= course_mask(r)
+
+    index = PatternIndex.build(catalog)
+    predicate = make_filter(args.category, args.year, args.credits)
+    result = index.fitting(busy, predicate, exclude_codes={r.code for r in timetable.records})
+    print(f"'{timetable.name}' ({len(timetable.records)}과목) 빈 시간에 들어가는 분반: {len(result)}개")
+    for c in result[:args.top]:
+        r = c.record
+        print(f"  {r.id:<10} {r.name}  {r.category}  {r.credits}학점  {r.time_raw}"
+              f"  (새 요일 {c.new_days}, 붙은 경계 {c.touching})")
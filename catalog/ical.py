@@ -0,0 +1,238 @@
+"""iCalendar(.ics) 일괄 내보내기.
+
+분반의 timeBlocks (요일, 시작, 끝, 강의실) 하나를 학기 기간 동안 매주 반복하는 VEVENT 하나로 쓴다.
+  sections   카탈로그의 모든 분반을 분반별(또는 학과별) .ics 로 (학과 페이지용)
+  timetables 내보낸 저장 시간표(SavedTimetable) JSON 들을 시간표별 .ics 로 (캘린더 앱 가져오기용)
+
+같은 (요일, 시작, 끝) 패턴의 DTSTART/DTEND/RRULE/EXDATE 줄은 학기마다 한 번만 계산하고 캐시한다
+(분반 수천 개의 블록 패턴은 수백 개뿐이다). 파일은 줄 단위로 바로 쓰고, 이벤트를 메모리에 모으지 않는다.
+시간은 Asia/Seoul 지역 시각(TZID)으로 쓰고, 긴 줄은 RFC 5545 대로 75 옥텟에서 접는다.
+"""
+import datetime
+import os
+import re
+import time
+from functools import lru_cache
+
+from .codeshare import record_blocks
+
+PRODID = '-//hnu-timetable//catalog ical//KO'
+TZID = 'Asia/Seoul'
+# 한국은 일광 절약 시간이 없어 표준시 하나로 충분하다
+VTIMEZONE = (
+    'BEGIN:VTIMEZONE', f'TZID:{TZID}', 'BEGIN:STANDARD', 'DTSTART:19700101T000000',
+    'TZOFFSETFROM:+0900', 'TZOFFSETTO:+0900', 'TZNAME:KST', 'END:STANDARD', 'END:VTIMEZONE',
+)
+UTC_OFFSET = datetime.timedelta(hours=9)
+RRULE_DAYS = {'월': 'MO', '화': 'TU', '수': 'WE', '목': 'TH', '금': 'FR', '토': 'SA'}
+WEEKDAYS = {d: i for i, d in enumerate('월화수목금토')}
+
+_UNSAFE_FILENAME = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+class Semester:
+    """학기 기간 [start, end] 와 휴강일(공휴일 등). 같은 학기의 반복 규칙 캐시 키로도 쓴다"""
+
+    def __init__(self, start, end, holidays=()):
+        if end < start:
+            raise ValueError(f"학기 종료일({end})이 시작일({start})보다 앞입니다")
+        self.start = start
+        self.end = end
+        self.holidays = tuple(sorted(set(holidays)))
+
+    def key(self):
+        return (self.start, self.end, self.holidays)
+
+
+@lru_cache(maxsize=None)
+def recurrence(semester_key, day, start_time, end_time):
+    """(요일, 시작, 끝) 패턴 -> VEVENT 의 시간 관련 줄들. 학기에 그 요일이 없으면 ()"""
+    start, end, holidays = semester_key
+    first = start + datetime.timedelta(days=(WEEKDAYS[day] - start.weekday()) % 7)
+    if first > end:
+        return ()
+    hhmm_start, hhmm_end = start_time.replace(':', ''), end_time.replace(':', '')
+    # UNTIL 은 UTC 로 써야 한다 (학기 마지막 날 23:59:59 KST)
+    until = datetime.datetime.combine(end, datetime.time(23, 59, 59)) - UTC_OFFSET
+    lines = [
+        f'DTSTART;TZID={TZID}:{first:%Y%m%d}T{hhmm_start}00',
+        f'DTEND;TZID={TZID}:{first:%Y%m%d}T{hhmm_end}00',
+        f'RRULE:FREQ=WEEKLY;BYDAY={RRULE_DAYS[day]};UNTIL={until:%Y%m%dT%H%M%S}Z',
+    ]
+    skipped = [d for d in holidays if first <= d <= end and d.weekday() == WEEKDAYS[day]]
+    if skipped:
+        lines.append(f'EXDATE;TZID={TZID}:' + ','.join(f'{d:%Y%m%d}T{hhmm_start}00' for d in skipped))
+    return tuple(lines)
+
+
+def escape_text(value):
+    """TEXT 값 이스케이프 (RFC 5545 3.3.11)"""
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def fold(line):
+    """75 옥텟이 넘는 줄을 접는다 (UTF-8 글자 중간에서 자르지 않음)"""
+    data = line.encode('utf-8')
+    if len(data) <= 75:
+        return line
+    parts = []
+    limit = 75
+    while data:
+        cut = min(limit, len(data))
+        while cut < len(data) and (data[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(data[:cut].decode('utf-8'))
+        data = data[cut:]
+        limit = 74  # 이어지는 줄은 앞의 공백 한 칸 포함 75
+    return '\r\n '.join(parts)
+
+
+class IcsWriter:
+    """열린 파일에 VCALENDAR 를 줄 단위로 쓴다"""
+
+    def __init__(self, f, name, stamp):
+        self.f = f
+        self.stamp = stamp
+        self.events = 0
+        self._write(('BEGIN:VCALENDAR', 'VERSION:2.0', f'PRODID:{PRODID}', 'CALSCALE:GREGORIAN',
+                     f'X-WR-CALNAME:{escape_text(name)}', f'X-WR-TIMEZONE:{TZID}') + VTIMEZONE)
+
+    def _write(self, lines):
+        self.f.write(''.join(fold(line) + '\r\n' for line in lines))
+
+    def add_record(self, record, semester, blocks=None):
+        """분반 하나의 블록마다 반복 VEVENT. 쓴 이벤트 수를 반환 (시간 미확정이면 0)"""
+        written = 0
+        summary = escape_text(f"{record.name} ({record.id})")
+        details = (record.professor, record.category, record.time_raw)
+        description = escape_text(' / '.join(v for v in details if v))
+        for n, b in enumerate(record_blocks(record) if blocks is None else blocks):
+            timing = recurrence(semester.key(), b.day, b.start_time, b.end_time)
+            if not timing:
+                continue
+            uid = f"{record.id}-{n}-{RRULE_DAYS[b.day]}{b.start_time.replace(':', '')}@hnu-timetable"
+            self._write(('BEGIN:VEVENT', f'UID:{uid}',
+                         f'DTSTAMP:{self.stamp}') + timing + (
+                         f'SUMMARY:{summary}', f'LOCATION:{escape_text(b.room)}',
+                         f'DESCRIPTION:{description}', 'END:VEVENT'))
+            written += 1
+        self.events += written
+        return written
+
+    def close(self):
+        self._write(('END:VCALENDAR',))
+
+
+def utc_stamp(now=None):
+    return time.strftime('%Y%m%dT%H%M%SZ', time.gmtime(now))
+
+
+def safe_filename(name):
+    return _UNSAFE_FILENAME.sub('_', name).strip('_') or '_'
+
+
+def write_calendar(path, name, records, semester, stamp, blocks_of=None):
+    """records 를 .ics 하나로 쓰고 이벤트 수를 반환. blocks_of(레코드) 로 블록을 바꿔 줄 수 있다"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = IcsWriter(f, name, stamp)
+        for r in records:
+            writer.add_record(r, semester, blocks_of(r) if blocks_of else None)
+        writer.close()
+    return writer.events
+
+
+def export_sections(records, out_dir, semester, by='section', stamp=None):
+    """분반별(by='section') 또는 학과별(by='department') .ics. (파일 수, 이벤트 수) 반환"""
+    stamp = stamp or utc_stamp()
+    os.makedirs(out_dir, exist_ok=True)
+    groups = {}
+    for r in records:
+        key = r.id if by == 'section' else (r.department or r.college or r.category or '기타')
+        groups.setdefault(key, []).append(r)
+    files = events = 0
+    for key, members in groups.items():
+        name = f"{members[0].name} ({key})" if by == 'section' else key
+        n = write_calendar(os.path.join(out_dir, safe_filename(key) + '.ics'), name, members, semester, stamp)
+        files += 1
+        events += n
+    return files, events
+
+
+def export_timetables(paths, catalog, out_dir, semester, stamp=None):
+    """저장 시간표 JSON 들 -> 시간표별 .ics. 과목 시간은 현재 카탈로그 기준 (없으면 저장된 블록).
+    (파일 수, 이벤트 수, [(읽지 못한 JSON, 오류)]) 반환"""
+    from .saved import read_saved_json, timetable_from_json
+    from .timetables import iter_json_files
+
+    stamp = stamp or utc_stamp()
+    os.makedirs(out_dir, exist_ok=True)
+    current = catalog.lookup if catalog is not None else (lambda cid: None)
+
+    def blocks_of(record):
+        r = current(record.id)
+        return record_blocks(r if r is not None else record)
+
+    files = events = 0
+    used = set()
+    errors = []
+    for path in iter_json_files(paths):
+        try:
+            timetables = read_saved_json(path)
+        except (OSError, ValueError) as e:
+            errors.append((path, str(e)))
+            continue
+        for obj in timetables:
+            if not isinstance(obj, dict) or 'selectedCourses' not in obj:
+                continue
+            t = timetable_from_json(obj)
+            # 여러 사용자의 파일에 같은 이름('1안')이 흔하므로 파일 이름을 앞에 붙인다
+            stem = os.path.splitext(os.path.basename(path))[0]
+            base = safe_filename(f"{stem}-{t.name or t.id}")
+            filename, n = base, 1
+            while filename in used:
+                n += 1
+                filename = f"{base}_{n}"
+            used.add(filename)
+            events += write_calendar(os.path.join(out_dir, filename + '.ics'), t.name or t.id,
+                                     t.records, semester, stamp, blocks_of)
+            files += 1
+    return files, events, errors
+
+
+def _date(text):
+    return datetime.date.fromisoformat(text)
+
+
+def register(subparsers):
+    p = subparsers.add_parser('ical', help='분반/저장 시간표를 매주 반복 일정 iCalendar(.ics) 로 내보내기')
+    p.add_argument('--start', type=_date, required=True, help='학기 시작일 (예: 2026-03-02)')
+    p.add_argument('--end', type=_date, required=True, help='학기 종료일 (예: 2026-06-19)')
+    p.add_argument('--holiday', type=_date, action='append', default=[], help='휴강일 (여러 번 지정 가능)')
+    p.add_argument('--out', default='ical', help='출력 폴더')
+    sub = p.add_subparsers(dest='ical_command', required=True)
+    sections = sub.add_parser('sections', help='카탈로그의 모든 분반')
+    sections.add_argument('--by', choices=('section', 'department'), default='section',
+                          help='분반별 파일 또는 학과별 파일')
+    timetables = sub.add_parser('timetables', help='내보낸 저장 시간표 JSON 파일/폴더')
+    timetables.add_argument('paths', nargs='+')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    try:
+        semester = Semester(args.start, args.end, args.holiday)
+    except ValueError as e:
+        print(e)
+        return 2
+    started = time.perf_counter()
+    errors = []
+    if args.ical_command == 'sections':
+        files, events = export_sections(catalog, args.out, semester, args.by)
+    else:
+        files, events, errors = export_timetables(args.paths, catalog, args.out, semester)
+    print(f"{args.out}: .ics {files}개, 반복 일정 {events}개, 시간 패턴 {recurrence.cache_info().currsize}개 "
+          f"({time.perf_counter() - started:.2f}초)")
+    for path, error in errors:
+        print(f"  [읽기 실패] {path}: {error}")
+    return 0
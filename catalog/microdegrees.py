@@ -0,0 +1,171 @@
+"""마이크로디그리 소속 인덱스.
+
+마이크로디그리 시트는 (마이크로디그리, 분반) 한 행씩이고, 이름 앞에 공백이 붙거나
+가운뎃점이 'ㆍ'/'·' 로 섞여 있다. 이름을 정규화해 마이크로디그리 -> 분반, 분반 -> 마이크로디그리
+인덱스를 한 번 만들어 두면 '생성형AI 에 인정되는 분반' 같은 질의가 과목 전체를 훑지 않는 조회가 된다.
+분반 id 는 normalize_id 형태('11967-01')로 저장해 엑셀과 TS 레코드를 같은 키로 찾는다.
+
+인덱스는 public/data/microdegrees.json (이름 목록 + 분반별 이름 번호) 으로 저장하고,
+catalog serve 의 /search?microdegree=.. 질의에도 쓴다.
+"""
+import json
+import os
+import re
+
+from .records import normalize_id
+
+MICRODEGREES_ASSET = os.path.join('public', 'data', 'microdegrees.json')
+ASSET_VERSION = 1
+
+# 가운뎃점 변형 -> '·'
+_MIDDLE_DOTS = str.maketrans({'ㆍ': '·', '‧': '·', '・': '·', '•': '·'})
+
+
+def normalize_microdegree(name):
+    """' 생성형AI  마이크로디그리' -> '생성형AI 마이크로디그리'"""
+    return re.sub(r'\s+', ' ', name.translate(_MIDDLE_DOTS)).strip()
+
+
+def _query_key(text):
+    return re.sub(r'\s+', '', normalize_microdegree(text))
+
+
+class MicrodegreeIndex:
+    """정규화한 마이크로디그리명 <-> 분반 id"""
+
+    def __init__(self, sections):
+        self.sections = sections
+        by_section = {}
+        for name in sorted(sections):
+            for sid in sections[name]:
+                by_section.setdefault(sid, []).append(name)
+        self.by_section = {sid: tuple(names) for sid, names in by_section.items()}
+
+    @classmethod
+    def build(cls, records):
+        """레코드의 microdegree_names 로 만든다 (엑셀 시트 행, TS 리터럴 모두 가능)"""
+        sections = {}
+        for r in records:
+            for name in r.microdegree_names:
+                name = normalize_microdegree(name)
+                if name:
+                    sections.setdefault(name, set()).add(normalize_id(r.id))
+        return cls({name: tuple(sorted(ids)) for name, ids in sections.items()})
+
+    @property
+    def names(self):
+        return sorted(self.sections)
+
+    def members(self, name):
+        """이름(정규화 전이어도 됨)에 속한 분반 id 목록"""
+        return self.sections.get(normalize_microdegree(name), ())
+
+    def microdegrees_of(self, section_id):
+        return self.by_section.get(normalize_id(section_id), ())
+
+    def find(self, query):
+        """공백을 무시하고 query 가 포함된 마이크로디그리명 목록 ('생성형AI' -> '생성형AI 마이크로디그리')"""
+        key = _query_key(query)
+        return [name for name in self.names if key in _query_key(name)]
+
+    def counts(self):
+        """이름 -> (분반 수, 학수번호 수)"""
+        return {name: (len(ids), len({sid.split('-')[0] for sid in ids}))
+                for name, ids in self.sections.items()}
+
+    def to_json(self):
+        names = self.names
+        number = {name: i for i, name in enumerate(names)}
+        return {
+            'version': ASSET_VERSION,
+            'names': names,
+            'sections': {sid: [number[n] for n in self.by_section[sid]] for sid in sorted(self.by_section)},
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        names = data['names']
+        sections = {}
+        for sid, numbers in data['sections'].items():
+            for i in numbers:
+                sections.setdefault(names[i], []).append(sid)
+        return cls({name: tuple(sorted(ids)) for name, ids in sections.items()})
+
+
+def diff_indexes(expected, actual):
+    """분반별 소속 차이 [(분반 id, 빠진 이름들, 더 있는 이름들)]"""
+    result = []
+    for sid in sorted(expected.by_section.keys() | actual.by_section.keys()):
+        want, have = set(expected.microdegrees_of(sid)), set(actual.microdegrees_of(sid))
+        if want != have:
+            result.append((sid, sorted(want - have), sorted(have - want)))
+    return result
+
+
+def write_microdegrees_asset(index, path=MICRODEGREES_ASSET):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(index.to_json(), f, ensure_ascii=False, separators=(',', ':'))
+
+
+def excel_index(path):
+    """엑셀 마이크로디그리 시트로 만든 인덱스"""
+    from .sheets import parse_sheet, read_workbook_rows
+    from .snapshot import Snapshot
+
+    if path.endswith('.json'):
+        with Snapshot(path) as snap:
+            return MicrodegreeIndex.build(parse_sheet('마이크로디그리', snap['마이크로디그리']))
+    rows = read_workbook_rows(path, ['마이크로디그리'])['마이크로디그리']
+    return MicrodegreeIndex.build(parse_sheet('마이크로디그리', rows))
+
+
+def register(subparsers):
+    p = subparsers.add_parser('microdegrees', help='마이크로디그리 <-> 분반 인덱스')
+    p.add_argument('--excel', default='excel_data.json', help='마이크로디그리 시트를 읽을 xlsx 또는 excel_data.json')
+    p.add_argument('--ts', action='store_true', help='엑셀 대신 TS 과목의 microdegreeNames 로 인덱스를 만든다')
+    sub = p.add_subparsers(dest='microdegrees_command', required=True)
+    sub.add_parser('list', help='마이크로디그리별 분반/학수번호 수')
+    show = sub.add_parser('show', help="마이크로디그리에 인정되는 분반 (예: show 생성형AI)")
+    show.add_argument('name')
+    sub.add_parser('check', help='엑셀 시트와 TS microdegreeNames 의 소속 차이')
+    emit = sub.add_parser('emit', help=f'인덱스를 {MICRODEGREES_ASSET} 로 저장')
+    emit.add_argument('--out', default=MICRODEGREES_ASSET)
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    ts = MicrodegreeIndex.build(catalog)
+    index = ts if args.ts else excel_index(args.excel)
+    command = args.microdegrees_command
+    if command == 'list':
+        counts = index.counts()
+        print(f"마이크로디그리 {len(counts)}개, 분반 {len(index.by_section)}개")
+        for name in index.names:
+            sections, codes = counts[name]
+            print(f"  {name:<40} 분반 {sections:>3}개 / 학수번호 {codes:>3}개")
+    elif command == 'show':
+        names = index.find(args.name)
+        if not names:
+            print(f"{args.name}: 해당하는 마이크로디그리가 없습니다")
+            return 1
+        by_id = catalog.by_id(normalize=True)
+        for name in names:
+            members = index.members(name)
+            print(f"[{name}] 분반 {len(members)}개")
+            for sid in members:
+                r = by_id.get(sid)
+                detail = f"{r.name}  {r.category}  {r.time_raw}" if r is not None else '(카탈로그에 없음)'
+                print(f"  {sid:<10} {detail}")
+    elif command == 'check':
+        diffs = diff_indexes(excel_index(args.excel) if args.ts else index, ts)
+        print(f"엑셀/TS 소속이 다른 분반: {len(diffs)}개")
+        for sid, missing, extra in diffs:
+            parts = ([f"TS 에 없음: {', '.join(missing)}"] if missing else []) + \
+                    ([f"엑셀에 없음: {', '.join(extra)}"] if extra else [])
+            print(f"  {sid:<10} {' / '.join(parts)}")
+        return 1 if diffs else 0
+    else:
+        write_microdegrees_asset(index, args.out)
+        print(f"{args.out}: 마이크로디그리 {len(index.sections)}개, 분반 {len(index.by_section)}개")
+    return 0
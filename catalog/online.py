@@ -0,0 +1,244 @@
+"""원격강좌(온라인강좌) 목록 가져오기.
+
+online.ts 는 수강편람 시트와 따로 관리되고 capacity/organizer/partnerUniversity 같은 자기 필드가 있다.
+원격강좌 목록(CSV 또는 xlsx)을 한 행씩 스트리밍으로 읽어 CourseRecord 로 만들고,
+  - 행마다 학수번호/분반/학점-강의-실습/수강인원 형식과 중복 분반을 검사하고
+  - id 는 엑셀 시트 레코드처럼 normalize_id 형태('24258-01')로 두고 (online.ts 에 쓸 때는
+    다른 TS 파일과 같은 '24258-1' 형태, ts_id), online.ts 와는 정규화 id 로 비교하며
+  - online.ts 와 비교(check)하거나 online.ts 를 새로 쓴다(emit).
+watch / validate-batch 에 --online 으로 목록을 주면 다른 시트와 같은 비교 한 번에
+'온라인' 비교(원격강좌 목록 <-> online.ts)가 함께 돌고, 바뀐 행만 다시 비교한다.
+
+헤더는 앞쪽 10행에서 학수번호/분반이 있는 행을 찾고, 헤더명으로 컬럼 위치를 정한다
+(schema.HEADER_FIELDS + 원격강좌 전용 헤더). xlsx 는 xlsx.py 의 스트리밍 리더로 읽는다.
+"""
+import csv
+import json
+import os
+import re
+import zipfile
+from collections import namedtuple
+
+from .filters import ONLINE_ORGANIZER
+from .records import CourseRecord, CourseTable, intern_str, normalize_id
+from .schema import HEADER_FIELDS, HEADER_SCAN_ROWS, SchemaError, normalize_header
+
+ONLINE_FILE = 'online.ts'
+ONLINE_SHEET = '원격강좌'
+ONLINE_EXPORT = 'ONLINE_COURSES'
+
+# 필드 -> 헤더명. 시트 공통 헤더에 원격강좌 목록에만 있는 헤더를 더한다
+ONLINE_HEADER_FIELDS = {
+    **HEADER_FIELDS,
+    'professor': HEADER_FIELDS['professor'] + ('교수', '교수명'),
+    'capacity': ('수강인원', '수강정원', '정원', '제한인원'),
+    'organizer': ('주관', '주관기관', '운영기관', '개설기관'),
+    'partner_university': ('제공대학', '협력대학', '개설대학', '제공기관'),
+}
+_ONLINE_HEADER_INDEX = {h: field for field, names in ONLINE_HEADER_FIELDS.items() for h in names}
+REQUIRED_FIELDS = ('code', 'section', 'name')
+
+_CREDIT_DETAIL = re.compile(r'\d+-\d+-\d+')
+
+OnlineProblem = namedtuple('OnlineProblem', ['row', 'id', 'message'])
+
+
+def ts_id(code, section):
+    """TS 파일의 id 형태: ('24258', '01') -> '24258-1'"""
+    return f"{code}-{int(section)}"
+
+
+def listing_rows(path, sheet=None, encoding='utf-8-sig'):
+    """원격강좌 목록의 행(문자열 리스트)을 차례로 내보낸다. CSV 또는 xlsx (sheet 를 안 주면 첫 시트)"""
+    if path.lower().endswith('.csv'):
+        with open(path, encoding=encoding, newline='') as f:
+            yield from csv.reader(f)
+        return
+    from .xlsx import iter_sheet_rows, read_date_styles, read_shared_strings, sheet_paths
+
+    with zipfile.ZipFile(path) as zf:
+        paths = sheet_paths(zf)
+        name = sheet or next(iter(paths))
+        if name not in paths:
+            raise KeyError(f"Worksheet {name} does not exist.")
+        yield from iter_sheet_rows(zf, paths[name], read_shared_strings(zf), read_date_styles(zf))
+
+
+def listing_columns(header):
+    """헤더 행 -> {필드: 위치} (같은 필드가 두 번 나오면 앞쪽 우선)"""
+    columns = {}
+    for i, cell in enumerate(header):
+        field = _ONLINE_HEADER_INDEX.get(normalize_header(cell))
+        if field is not None:
+            columns.setdefault(field, i)
+    return columns
+
+
+def record_from_row(row, columns):
+    """목록 한 행 -> (CourseRecord 또는 None, 문제 메시지 목록)"""
+    def cell(field):
+        i = columns.get(field)
+        return intern_str(row[i]) if i is not None and i < len(row) else ''
+
+    code, section, name = cell('code'), cell('section'), cell('name')
+    credit_detail, capacity = cell('credit_detail'), cell('capacity')
+    problems = []
+    if not code.isdigit():
+        problems.append(f"학수번호 형식 오류: '{code}'")
+    if not section.isdigit():
+        problems.append(f"분반 형식 오류: '{section}'")
+    if not name:
+        problems.append("교과목명 없음")
+    if not _CREDIT_DETAIL.fullmatch(credit_detail):
+        problems.append(f"학점-강의-실습 형식 오류: '{credit_detail}'")
+    if capacity and not capacity.isdigit():
+        problems.append(f"수강인원 형식 오류: '{capacity}'")
+    if problems:
+        return None, problems
+    section = section.zfill(2)
+    organizer = cell('organizer') or ONLINE_ORGANIZER
+    professor = cell('professor')
+    return CourseRecord(
+        normalize_id(f"{code}-{section}"), code=code, section=section, name=name,
+        college=cell('college'), department=cell('department'), major=cell('major'), year=cell('year') or '전체',
+        category=cell('category') or '교선', credit_detail=credit_detail,
+        professors=[p.strip() for p in professor.split(',') if p.strip()] or [organizer],
+        note=cell('note'), source=ONLINE_SHEET, credits=int(credit_detail.split('-')[0]),
+        is_time_confirmed=False, capacity=capacity, organizer=organizer,
+        partner_university=cell('partner_university'),
+    ), []
+
+
+def iter_online(rows):
+    """(행 번호(1부터), CourseRecord 또는 None, 문제 목록) 을 차례로 내보낸다.
+
+    앞쪽 HEADER_SCAN_ROWS 행만 모아 헤더를 찾고, 나머지는 한 행씩 읽는다.
+    빈 행과 중간에 반복되는 헤더 행은 건너뛴다.
+    """
+    rows = iter(rows)
+    head = []
+    columns = None
+    for row in rows:
+        head.append(row)
+        found = listing_columns(row)
+        if all(f in found for f in REQUIRED_FIELDS):
+            columns = found
+            break
+        if len(head) >= HEADER_SCAN_ROWS:
+            break
+    if columns is None:
+        raise SchemaError(f"원격강좌 목록 앞쪽 {HEADER_SCAN_ROWS}행에서 학수번호/분반/교과목명 헤더를 찾지 못했습니다")
+    seen = {}
+    for row_no, row in enumerate(rows, len(head) + 1):
+        if not any(c.strip() for c in row) or listing_columns(row) == columns:
+            continue
+        record, problems = record_from_row(row, columns)
+        if record is not None:
+            if record.id in seen:
+                problems = [f"{seen[record.id]}행과 분반 중복"]
+                record = None
+            else:
+                seen[record.id] = row_no
+        yield row_no, record, problems
+
+
+def load_online(path, sheet=None):
+    """원격강좌 목록 -> (CourseTable, [OnlineProblem])"""
+    table = CourseTable()
+    problems = []
+    for row_no, record, messages in iter_online(listing_rows(path, sheet)):
+        if record is not None:
+            table.append(record)
+        for message in messages:
+            problems.append(OnlineProblem(row_no, record.id if record is not None else '', message))
+    return table, problems
+
+
+def _ts_string(value):
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n') + "'"
+
+
+def render_online_ts(records):
+    """CourseRecord 목록 -> online.ts 본문 (지금 파일과 같은 필드 순서와 따옴표)"""
+    lines = ["import { type Course } from '../../types/index.ts'", '', '// 온라인강좌',
+             f'export const {ONLINE_EXPORT}: Course[] = [']
+    for n, r in enumerate(records):
+        lines += [
+            '  {',
+            f"    id: {_ts_string(ts_id(r.code, r.section))},",
+            f"    code: {_ts_string(r.code)},",
+            f"    section: {_ts_string(r.section)},",
+            f"    name: {_ts_string(r.name)},",
+            f"    college: {_ts_string(r.college)},",
+            f"    department: {_ts_string(r.department)},",
+            f"    major: {_ts_string(r.major)},",
+            f"    year: {_ts_string(r.year)},",
+            f"    credits: {r.credits},",
+            f"    creditDetail: {_ts_string(r.credit_detail)},",
+            f"    professors: {json.dumps(list(r.professors), ensure_ascii=False)},",
+            f"    category: {_ts_string(r.category)},",
+            f"    note: {_ts_string(r.note)},",
+            f"    timeRaw: {_ts_string(r.time_raw)},",
+            f"    roomRaw: {_ts_string(r.room_raw)},",
+            "    isTimeConfirmed: false,",
+            "    timeBlocks: [],",
+            f"    capacity: {_ts_string(r.capacity or '')},",
+            f"    organizer: {_ts_string(r.organizer or '')},",
+            f"    partnerUniversity: {_ts_string(r.partner_university or '')},",
+            '  },' if n < len(records) - 1 else '  }',
+        ]
+    lines.append(']')
+    return '\n'.join(lines) + '\n'
+
+
+def write_online_ts(records, path):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(render_online_ts(records))
+    os.replace(tmp, path)
+
+
+def register(subparsers):
+    p = subparsers.add_parser('online', help='원격강좌 목록(CSV/xlsx) 검사, online.ts 와 비교/생성')
+    p.add_argument('listing', help='원격강좌 목록 (.csv 또는 .xlsx)')
+    p.add_argument('--sheet', help='xlsx 시트명 (기본: 첫 시트)')
+    sub = p.add_subparsers(dest='online_command', required=True)
+    sub.add_parser('check', help='행 검사 후 online.ts 와 비교 (누락/추가/차이)')
+    emit = sub.add_parser('emit', help='목록으로 online.ts 를 새로 쓴다 (행 검사 오류가 있으면 쓰지 않음)')
+    emit.add_argument('--out', help='출력 파일 (기본: --courses-dir 의 online.ts)')
+    p.set_defaults(func=run)
+
+
+NEEDS_CATALOG = False
+
+
+def run(args, catalog):
+    from .diff import diff_views
+    from .tsdata import load_ts_courses
+
+    try:
+        listing, problems = load_online(args.listing, args.sheet)
+    except (OSError, KeyError, SchemaError) as e:
+        print(e)
+        return 2
+    print(f"{args.listing}: 원격강좌 {len(listing)}개, 행 오류 {len(problems)}건")
+    for p in problems:
+        print(f"  {p.row}행 {p.id + ' ' if p.id else ''}{p.message}")
+    if args.online_command == 'emit':
+        if problems:
+            return 1
+        out = args.out or os.path.join(args.courses_dir, ONLINE_FILE)
+        write_online_ts(list(listing), out)
+        print(f"{out}: {len(listing)}개 기록")
+        return 0
+    ts = load_ts_courses(args.courses_dir, files=[ONLINE_FILE])
+    result = diff_views(listing, ts)
+    print(f"online.ts 와 비교: 누락 {len(result.missing)}, 추가 {len(result.extra)}, "
+          f"차이 {len(result.diffs)}, 같음 {result.unchanged}")
+    for cid in sorted(result.missing):
+        print(f"  {cid}: 누락 (목록에만 있음)")
+    for cid in sorted(result.extra):
+        print(f"  {cid}: 추가 (online.ts 에만 있음)")
+    for cid, changes in result.diffs:
+        print(f"  {cid}: {', '.join(changes)}")
+    return 1 if problems or result.missing or result.extra or result.diffs else 0
@@ -0,0 +1,246 @@
+"""이수구분별 학점 요건을 채우는 시간표 조합 탐색.
+
+'전필 9학점 이상, 채플 1개, 총 18학점 이하' 같은 요건을 만족하면서 시간이 겹치지 않는
+분반 조합을 선호 점수 순으로 k 개 찾는다.
+
+학수번호마다 분반 하나를 고르거나 건너뛰는 분기 한정(branch and bound) 탐색이다.
+한정 값은 남은 학수번호들로 남은 학점 안에서 얻을 수 있는 최대 점수로,
+시간 충돌을 무시한 배낭 문제 DP(학수번호 x 학점)로 미리 계산해 둔다.
+요건은 남은 학수번호가 줄 수 있는 최대 기여의 접미 합과, 남은 요건을 채우는 데
+필요한 최소 학점이 남은 학점 한도를 넘는지로 가지를 친다.
+시간 미확정 분반은 충돌 판정이 불가능하므로 후보에서 뺀다.
+"""
+import heapq
+import re
+import time
+from collections import namedtuple
+
+from .filters import make_filter, matches_category
+from .timeslots import course_mask
+
+Plan = namedtuple('Plan', ['score', 'credits', 'records'])
+# category 가 None 이면 전체 과목. unit 은 'credits'(학점) 또는 'sections'(과목 수)
+Target = namedtuple('Target', ['category', 'amount', 'unit'])
+
+_NEG = float('-inf')
+
+
+def parse_target(text):
+    """'전필=9' (학점), '교필(영성)=1개' (과목 수) -> Target"""
+    m = re.fullmatch(r'(.+?)=(\d+)(개)?', text.strip())
+    if not m:
+        raise ValueError(f"요건 형식이 잘못되었습니다 (예: 전필=9, 교필(영성)=1개): {text}")
+    return Target(m.group(1), int(m.group(2)), 'sections' if m.group(3) else 'credits')
+
+
+def _contribution(record, target):
+    if target.category is not None and not matches_category(record, [target.category]):
+        return 0
+    return 1 if target.unit == 'sections' else record.credits or 0
+
+
+class _Group:
+    """학수번호 하나의 분반들: (레코드, 마스크, 학점, 점수, 요건별 기여)"""
+    __slots__ = ('code', 'options', 'best_contrib')
+
+    def __init__(self, code, options, n_targets):
+        self.code = code
+        self.options = sorted(options, key=lambda o: -o[3])
+        self.best_contrib = tuple(max((o[4][t] for o in options), default=0) for t in range(n_targets))
+
+
+class Planner:
+    def __init__(self, records, targets=(), max_credits=18, required=(), preferences=None):
+        self.targets = tuple(targets)
+        self.max_credits = max_credits
+        preferences = preferences or {}
+        required = set(required)
+
+        by_code = {}
+        for r in records:
+            if r.is_time_confirmed is False or not r.time_blocks:
+                continue
+            credits = r.credits or 0
+            if credits > max_credits:
+                continue
+            contrib = tuple(_contribution(r, t) for t in self.targets)
+            score = credits + preferences.get(r.code, 0)
+            if score <= 0 and not any(contrib) and r.code not in required:
+                continue  # 넣어도 점수/요건에 도움이 안 되는 분반 (0학점 실습 등)
+            by_code.setdefault(r.code, []).append((r, course_mask(r), credits, score, contrib))
+
+        missing = required - set(by_code)
+        if missing:
+            raise ValueError(f"후보에 없는 필수 학수번호: {', '.join(sorted(missing))}")
+        groups = [_Group(code, opts, len(self.targets)) for code, opts in by_code.items()]
+        # 필수 과목, 요건에 기여하는 과목, 나머지 순으로, 각각 점수가 높은 과목부터 분기한다
+        groups.sort(key=lambda g: (g.code not in required, not any(g.best_contrib),
+                                   -g.options[0][3], g.code))
+        self.groups = groups
+        self.n_required = sum(1 for g in groups if g.code in required)
+        self._bound = self._knapsack_bound()
+        self._suffix = self._suffix_contrib()
+        self._disjoint = self._disjoint_credit_targets()
+
+    def _knapsack_bound(self):
+        """bound[i][c] = groups[i:] 에서 학점 c 이하로 얻을 수 있는 최대 점수 (충돌 무시)"""
+        cap = self.max_credits
+        bound = [None] * (len(self.groups) + 1)
+        bound[-1] = [0] * (cap + 1)
+        for i in range(len(self.groups) - 1, -1, -1):
+            nxt = bound[i + 1]
+            row = list(nxt)
+            for _, _, credits, score, _ in self.groups[i].options:
+                for c in range(credits, cap + 1):
+                    v = nxt[c - credits] + score
+                    if v > row[c]:
+                        row[c] = v
+            bound[i] = row
+        return bound
+
+    def _suffix_contrib(self):
+        """suffix[i][t] = groups[i:] 가 요건 t 에 줄 수 있는 최대 기여의 합"""
+        n_t = len(self.targets)
+        suffix = [None] * (len(self.groups) + 1)
+        suffix[-1] = (0,) * n_t
+        for i in range(len(self.groups) - 1, -1, -1):
+            best = self.groups[i].best_contrib
+            suffix[i] = tuple(suffix[i + 1][t] + best[t] for t in range(n_t))
+        return suffix
+
+    def _disjoint_credit_targets(self):
+        """서로 겹치는 분반이 없는 학점 요건들의 조합 (남은 요건을 채우는 데 필요한 최소 학점 계산용)"""
+        credit_targets = [t for t, tg in enumerate(self.targets) if tg.unit == 'credits']
+        overlap = set()
+        for g in self.groups:
+            for *_, contrib in g.options:
+                hit = [t for t in credit_targets if contrib[t]]
+                overlap.update((a, b) for a in hit for b in hit if a != b)
+        subsets = [()]
+        for t in credit_targets:
+            subsets += [s + (t,) for s in subsets if all((t, u) not in overlap for u in s)]
+        return [s for s in subsets if s]
+
+    def _credits_needed(self, contrib):
+        """요건을 마저 채우려면 더 들어야 하는 최소 학점"""
+        return max((sum(max(self.targets[t].amount - contrib[t], 0) for t in s) for s in self._disjoint),
+                   default=0)
+
+    def _feasible(self, contrib, i):
+        suffix = self._suffix[i]
+        return all(contrib[t] + suffix[t] >= target.amount for t, target in enumerate(self.targets))
+
+    def search(self, k=5, time_budget=2.0):
+        """(점수 내림차순 Plan 목록, 시간 안에 탐색을 끝냈는지) 반환"""
+        deadline = time.perf_counter() + time_budget
+        groups, bound, cap = self.groups, self._bound, self.max_credits
+        targets = self.targets
+        heap = []  # (score, seq, credits, records) 최소 힙, 크기 k
+        seq = 0
+        nodes = 0
+        timed_out = False
+
+        def threshold():
+            return heap[0][0] if len(heap) >= k else _NEG
+
+        def visit(i, mask, credits, score, contrib, chosen):
+            nonlocal seq, nodes, timed_out
+            nodes += 1
+            if nodes & 1023 == 0 and time.perf_counter() > deadline:
+                timed_out = True
+            if timed_out:
+                return
+            if i >= self.n_required and all(contrib[t] >= tg.amount for t, tg in enumerate(targets)):
+                if score > threshold():
+                    item = (score, seq, credits, tuple(chosen))
+                    seq += 1
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    else:
+                        heapq.heapreplace(heap, item)
+            last = i if i < self.n_required else len(groups) - 1
+            for j in range(i, last + 1):
+                if score + bound[j][cap - credits] <= threshold():
+                    break  # bound 는 j 가 커질수록 작아지므로 뒤도 볼 필요가 없다
+                if not self._feasible(contrib, j):
+                    break
+                for r, m, cr, sc, co in groups[j].options:
+                    if m & mask or credits + cr > cap:
+                        continue
+                    if score + sc + bound[j + 1][cap - credits - cr] <= threshold():
+                        continue
+                    new_contrib = tuple(a + b for a, b in zip(contrib, co))
+                    if credits + cr + self._credits_needed(new_contrib) > cap:
+                        continue
+                    chosen.append(r)
+                    visit(j + 1, mask | m, credits + cr, score + sc, new_contrib, chosen)
+                    chosen.pop()
+                    if timed_out:
+                        return
+
+        visit(0, 0, 0, 0, (0,) * len(targets), [])
+        plans = [Plan(score, credits, list(records))
+                 for score, _, credits, records in sorted(heap, key=lambda x: (-x[0], x[1]))]
+        return plans, not timed_out
+
+
+def register(subparsers):
+    p = subparsers.add_parser('plan', help='학점 요건을 채우는 시간표 조합 탐색')
+    p.add_argument('--need', nargs='*', default=[], metavar='CAT=N',
+                   help="이수구분별 요건 (예: 전필=9 '교필(영성)=1개')")
+    p.add_argument('--department', nargs='*', default=[], help='후보로 쓸 학과 (요건 이수구분 과목은 학과와 무관하게 포함)')
+    p.add_argument('--year', nargs='*', default=[], help='학년')
+    p.add_argument('--require', nargs='*', default=[], metavar='CODE', help='반드시 넣을 학수번호 (예: 13479)')
+    p.add_argument('--prefer', nargs='*', default=[], metavar='CODE=W', help='학수번호별 선호 가중치 (음수는 회피)')
+    p.add_argument('--max-credits', type=int, default=18)
+    p.add_argument('--min-credits', type=int, default=0)
+    p.add_argument('--top', type=int, default=5)
+    p.add_argument('--budget', type=float, default=2.0, help='탐색 시간 (초)')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    try:
+        targets = [parse_target(t) for t in args.need]
+    except ValueError as e:
+        print(e)
+        return 1
+    if args.min_credits:
+        targets.append(Target(None, args.min_credits, 'credits'))
+    preferences = {}
+    for item in args.prefer:
+        code, _, weight = item.partition('=')
+        preferences[code] = float(weight or 1)
+
+    # 요건 이수구분 과목(요건이 없으면 전체)을 후보로 쓴다. 학과를 주면 그 학과 과목과 교양(교필/교선)도 넣는다.
+    # 필수/선호 학수번호는 학년과 무관하게 넣는다 (채플은 학년이 '전체').
+    categories = [t.category for t in targets if t.category is not None]
+    in_year = make_filter(years=args.year)
+    if args.department:
+        # department 는 '컴퓨터공학과, 산업경영공학과' 처럼 여러 학과가 이어진 경우가 있다
+        departments = set(args.department)
+        in_scope = lambda r: (not departments.isdisjoint(d.strip() for d in r.department.split(','))
+                              or r.category.startswith(('교필', '교선'))
+                              or (categories and matches_category(r, categories)))
+    else:
+        in_scope = make_filter(categories=categories)
+    pool = catalog.where(lambda r: r.code in args.require or r.code in preferences
+                         or (in_year(r) and in_scope(r)))
+    try:
+        planner = Planner(pool, targets, args.max_credits, args.require, preferences)
+    except ValueError as e:
+        print(e)
+        return 1
+
+    started = time.perf_counter()
+    plans, complete = planner.search(args.top, args.budget)
+    elapsed = time.perf_counter() - started
+    print(f"후보 {len(pool)}개 분반 / {len(planner.groups)}개 학수번호, "
+          f"{elapsed:.2f}초 {'탐색 완료' if complete else '시간 초과 (찾은 것까지)'}")
+    if not plans:
+        print("요건을 만족하는 조합이 없습니다")
+        return 1
+    for n, plan in enumerate(plans, 1):
+        print(f"\n[{n}] 점수 {plan.score:g}, {plan.credits}학점")
+        for r in sorted(plan.records, key=lambda r: r.id):
+            print(f"  {r.id:<10} {r.name}  {r.category}  {r.credits}학점  {r.time_raw}")
@@ -0,0 +1,229 @@
+"""교수 인덱스와 강의 부담/중복 배정 보고.
+
+교수 정보는 소스마다 모양이 다르다. 엑셀은 '정종진, 이형우' 같은 한 문자열, TS 는 professors 배열이고
+'마리나 위옹' / '마리나위옹', 'ㆍ' / '·' 처럼 표기가 흔들리며, '#N/A', '0' 같은 빈 값도 섞여 있다.
+또 사람이 아닌 이름이 있다.
+  기관   선교훈련팀, 교수학습원격교육센터, 취업창업처5, 학생군사교육단1 ... (끝의 번호는 떼어 하나로 모음)
+  미정   초빙-1, 겸임-2, 채용예정 신임교원, 신임교원(식품영양학과) ...
+이 정규화를 professor_key 한 곳에서 하고, 레코드를 한 번 훑어 교수 -> 분반, 주간 강의 시간(분),
+요일, 강의실 인덱스(ProfessorIndex)를 만든다. 공동 강의 분반은 교수마다 전체 시간으로 센다.
+코드쉐어로 묶인 분반(같은 물리 수업)은 시간을 한 번만 세고, 중복 배정에서도 뺀다.
+교수진이 똑같은 공동 강의 분반끼리 겹치는 것(21683-01/02/03 처럼 다섯 명이 한 시간에 맡는 분반들)은
+한 팀이 함께 진행하는 수업이므로 중복 배정이 아니라 '팀 겹침'으로 따로 보고한다.
+기관/미정 이름은 부담 순위와 중복 배정 검사에서 빼고 따로 집계한다 (선교훈련팀은 같은 시간에 수십 분반).
+"""
+import re
+from functools import lru_cache
+
+from .codeshare import SessionGroups, record_blocks
+from .filters import ONLINE_ORGANIZER
+from .rooms import split_rooms
+from .timeslots import DAYS, block_mask, to_minutes
+
+PERSON, UNIT, VACANCY = '교수', '기관', '미정'
+
+EMPTY_NAMES = ('', '0', '-', '#N/A', '미정')
+KNOWN_UNITS = ('선교훈련팀', ONLINE_ORGANIZER)
+# 번호가 붙은 기관 자리 ('취업창업처5') — 사람 이름과 헷갈리지 않게 다섯 글자 이상만
+_UNIT = re.compile(r'(.{4,}(?:팀|센터|대학|처|단|사업))\d*')
+_VACANCY = re.compile(r'(?:겸임|초빙|시간강사)-?\d*|.*(?:신임교원|채용예정).*')
+_SPACES = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=None)
+def professor_key(name):
+    """교수명 한 개 -> (정규화 이름, 종류) 또는 None (빈 값)"""
+    key = _SPACES.sub('', name).replace('ㆍ', '·')
+    if key in EMPTY_NAMES:
+        return None
+    if key in KNOWN_UNITS:
+        return key, UNIT
+    if _VACANCY.fullmatch(key):
+        return key, VACANCY
+    m = _UNIT.fullmatch(key)
+    if m:
+        return m.group(1), UNIT
+    return key, PERSON
+
+
+def professor_keys(record):
+    """레코드의 교수들 -> [(정규화 이름, 종류)] (중복 제거, 순서 유지)"""
+    keys = []
+    for cell in record.professors:
+        for name in cell.split(','):
+            k = professor_key(name)
+            if k is not None and k not in keys:
+                keys.append(k)
+    return keys
+
+
+class ProfessorEntry:
+    __slots__ = ('name', 'kind', 'sections', 'masks', 'minutes', 'days', 'rooms', 'team')
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.sections = []
+        self.masks = {}     # 분반 id -> 주간 점유 마스크 (중복 배정 검사용)
+        self.minutes = 0    # 주간 강의 시간 (코드쉐어 묶음은 한 번만)
+        self.days = set()
+        self.rooms = set()
+        self.team = 0       # 공동 강의 분반 수
+
+    def day_string(self):
+        return ''.join(d for d in DAYS if d in self.days)
+
+
+class ProfessorIndex:
+    """정규화 교수명 -> ProfessorEntry. build 에서 레코드를 한 번만 훑는다"""
+
+    def __init__(self, entries, sessions, teams):
+        self.entries = entries
+        self.sessions = sessions
+        self.teams = teams  # 공동 강의 분반 id -> 교수(사람) 이름 frozenset
+
+    @classmethod
+    def build(cls, records, sessions=None):
+        records = list(records)
+        if sessions is None:
+            sessions = SessionGroups.build(records)
+        entries = {}
+        teams = {}
+        counted = set()     # (교수, 물리 수업 대표 id)
+        seen = set()
+        for r in records:
+            if r.id in seen:
+                continue
+            seen.add(r.id)
+            keys = professor_keys(r)
+            if not keys:
+                continue
+            blocks = record_blocks(r)
+            mask = minutes = 0
+            days, rooms = set(), set()
+            for b in blocks:
+                mask |= block_mask(b)
+                minutes += to_minutes(b.end_time) - to_minutes(b.start_time)
+                days.add(b.day)
+                rooms.update(split_rooms(b.room))
+            session = sessions.canonical(r.id)
+            people = frozenset(name for name, kind in keys if kind == PERSON)
+            if len(people) > 1:
+                teams[r.id] = people
+            for name, kind in keys:
+                e = entries.get(name)
+                if e is None:
+                    e = entries[name] = ProfessorEntry(name, kind)
+                e.sections.append(r.id)
+                e.masks[r.id] = mask
+                e.days |= days
+                e.rooms |= rooms
+                if len(keys) > 1:
+                    e.team += 1
+                if (name, session) not in counted:
+                    counted.add((name, session))
+                    e.minutes += minutes
+        return cls(entries, sessions, teams)
+
+    def get(self, name):
+        k = professor_key(name)
+        return self.entries.get(k[0]) if k is not None else None
+
+    def people(self):
+        return [e for e in self.entries.values() if e.kind == PERSON]
+
+    def placeholders(self):
+        return [e for e in self.entries.values() if e.kind != PERSON]
+
+    def load(self):
+        """교수(사람)별 부담, 주간 강의 시간 많은 순"""
+        return sorted(self.people(), key=lambda e: (-e.minutes, -len(e.sections), e.name))
+
+    def same_team(self, a, b):
+        """두 분반이 같은 교수진(두 명 이상)의 공동 강의인지"""
+        team = self.teams.get(a)
+        return team is not None and team == self.teams.get(b)
+
+    def clashes(self):
+        """(같은 교수의 시간이 겹치는 분반 쌍 [(교수, id, id)], 팀 겹침 [(교수진, id, id)]).
+
+        같은 물리 수업은 빼고, 교수진이 똑같은 공동 강의끼리는 교수마다가 아니라 쌍마다 한 번 팀 겹침으로 센다.
+        """
+        clashes, team = [], {}
+        for e in sorted(self.people(), key=lambda e: e.name):
+            entries = sorted((sid, m) for sid, m in e.masks.items() if m)
+            for n, (a, ma) in enumerate(entries):
+                for b, mb in entries[n + 1:]:
+                    if not ma & mb or self.sessions.same_session(a, b):
+                        continue
+                    if self.same_team(a, b):
+                        team.setdefault((a, b), tuple(sorted(self.teams[a])))
+                    else:
+                        clashes.append((e.name, a, b))
+        return clashes, [(names, a, b) for (a, b), names in sorted(team.items())]
+
+
+def register(subparsers):
+    p = subparsers.add_parser('professors', help='교수별 강의 부담/중복 배정 (공동 강의, 기관/미정 이름 정규화)')
+    p.add_argument('--excel', help='TS 대신 엑셀 시트 전체(xlsx 또는 excel_data.json)로')
+    sub = p.add_subparsers(dest='professors_command', required=True)
+    load = sub.add_parser('load', help='교수별 분반 수, 주간 강의 시간, 요일, 강의실')
+    load.add_argument('--top', type=int, help='위에서 N명만')
+    load.add_argument('--min-hours', type=float, default=0, help='주간 강의 시간이 이 이상인 교수만')
+    sub.add_parser('clashes', help='같은 교수의 시간이 겹치는 분반 (코드쉐어 묶음 제외, 같은 팀 공동 강의는 따로)')
+    show = sub.add_parser('show', help='교수 한 명의 분반 목록')
+    show.add_argument('name')
+    p.set_defaults(func=run)
+
+
+def _hours(minutes):
+    return f"{minutes / 60:.1f}h"
+
+
+def run(args, catalog):
+    if args.excel:
+        from .watch import read_excel
+
+        records = [r for table in read_excel(args.excel).values() for r in table]
+    else:
+        records = list(catalog)
+    index = ProfessorIndex.build(records)
+    by_id = {}
+    for r in records:
+        by_id.setdefault(r.id, r)
+    cmd = args.professors_command
+    if cmd == 'show':
+        e = index.get(args.name)
+        if e is None:
+            print(f"'{args.name}' 교수를 찾지 못했습니다")
+            return 1
+        print(f"{e.name} ({e.kind}): 분반 {len(e.sections)}개 (공동 {e.team}), 주간 {_hours(e.minutes)}, "
+              f"요일 {e.day_string() or '-'}, 강의실 {', '.join(sorted(e.rooms)) or '-'}")
+        for sid in e.sections:
+            r = by_id[sid]
+            print(f"  {sid:<10} {r.name}  {r.time_raw or '(시간 미정)'}  {r.room_raw}  [{r.professor}]")
+        return 0
+    if cmd == 'clashes':
+        clashes, team = index.clashes()
+        print(f"[교수 중복 배정] {len(clashes)}건")
+        for name, a, b in clashes:
+            print(f"  {name}: {a} {by_id[a].name} ({by_id[a].time_raw}) x {b} {by_id[b].name} ({by_id[b].time_raw})")
+        if team:
+            print(f"\n[팀 겹침] 교수진이 같은 공동 강의 {len(team)}쌍 (중복 배정으로 세지 않음)")
+            for names, a, b in team:
+                print(f"  {', '.join(names)}: {a} x {b} {by_id[a].name} ({by_id[a].time_raw})")
+        return 1 if clashes else 0
+    people = [e for e in index.load() if e.minutes >= args.min_hours * 60]
+    if args.top:
+        people = people[:args.top]
+    placeholders = index.placeholders()
+    print(f"교수 {len(index.people())}명, 기관/미정 이름 {len(placeholders)}개")
+    print(f"  {'교수':<12} {'분반':>4} {'공동':>4} {'주간':>6}  {'요일':<6} 강의실")
+    for e in people:
+        print(f"  {e.name:<12} {len(e.sections):>4} {e.team:>4} {_hours(e.minutes):>6}  "
+              f"{e.day_string() or '-':<6} {', '.join(sorted(e.rooms)) or '-'}")
+    if placeholders:
+        print("기관/미정 (부담 순위와 중복 배정 검사에서 제외)")
+        for e in sorted(placeholders, key=lambda e: (e.kind, -len(e.sections), e.name)):
+            print(f"  [{e.kind}] {e.name:<20} 분반 {len(e.sections):>3}, 주간 {_hours(e.minutes)}")
+    return 0
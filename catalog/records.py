@@ -0,0 +1,229 @@
+"""과목 레코드 모델.
+
+엑셀 시트와 TS 파일에서 읽은 과목을 하나의 __slots__ 레코드로 표현한다.
+반복되는 문자열(단과대학, 학과, 이수구분, '선교훈련팀' 등)은 intern 하여 공유하고,
+카테고리별 부분집합은 레코드를 복사하지 않고 인덱스만 가진 뷰로 만든다.
+"""
+import hashlib
+import sys
+from array import array
+from collections import namedtuple
+
+# src/types/index.ts 의 TimeBlock 과 같은 모양 (day, startTime, endTime, room, group)
+TimeBlock = namedtuple('TimeBlock', ['day', 'start_time', 'end_time', 'room', 'group'])
+
+_EMPTY = ()
+_tuple_cache = {}
+_block_cache = {}
+
+
+def intern_str(value):
+    """셀 값을 strip 한 문자열로 변환하고 intern 한다 (None -> '')."""
+    if value is None:
+        return ''
+    return sys.intern(str(value).strip())
+
+
+def intern_tuple(values):
+    """문자열 튜플을 공유한다. 같은 교수/마이크로디그리 목록은 한 객체만 남는다."""
+    if not values:
+        return _EMPTY
+    key = tuple(sys.intern(v) for v in values)
+    return _tuple_cache.setdefault(key, key)
+
+
+def make_block(day, start_time, end_time, room, group):
+    """TimeBlock 을 만들고, 같은 값의 블록은 한 객체를 공유한다."""
+    key = (day, start_time, end_time, room, group)
+    block = _block_cache.get(key)
+    if block is None:
+        block = TimeBlock(sys.intern(day), sys.intern(start_time), sys.intern(end_time),
+                          sys.intern(room), group)
+        _block_cache[key] = block
+    return block
+
+
+def normalize_id(id_str):
+    """ID 정규화: '11967-1' -> '11967-01'"""
+    parts = id_str.split('-')
+    if len(parts) == 2:
+        return f"{parts[0]}-{parts[1].zfill(2)}"
+    return id_str
+
+
+def normalize_time(t):
+    """시간 표기 정규화: '/' -> ',' 통일"""
+    if not t:
+        return t
+    return t.replace('/', ',').replace(' ', '')
+
+
+def normalize_name(n):
+    """이름 정규화: 로마숫자 I->Ⅰ, II->Ⅱ 등 통일"""
+    if not n:
+        return n
+    # 로마 숫자 정규화 (fullwidth -> ASCII)
+    n = n.replace('Ⅰ', 'I').replace('Ⅱ', 'II').replace('Ⅲ', 'III').replace('Ⅳ', 'IV')
+    return n
+
+
+def fingerprint(record):
+    """엑셀-TS 비교 필드(과목명, 강의시간, 강의실, 교수, 학점, 원격강좌 필드)를 정규화한 값의 해시.
+
+    지문이 같으면 비교 필드가 모두 같다. 다르면 diff.field_changes 로 필드별로 다시 비교한다
+    (교수명이 한쪽만 비어 있는 경우처럼 비교에서 봐주는 차이도 지문은 달라진다).
+    """
+    fields = (normalize_name(record.name), normalize_time(record.time_raw), record.room_raw,
+              record.professor.replace(' ', ''), record.credit_detail)
+    # 원격강좌 필드는 값이 있는 레코드(online.ts, 원격강좌 목록)만 지문에 넣는다
+    # (엑셀 시트 행의 지문은 그대로라 스냅샷 인덱스에 저장된 지문도 그대로 쓸 수 있다)
+    online = (record.capacity, record.organizer, record.partner_university)
+    if online != (None, None, None):
+        fields += tuple(v or '' for v in online)
+    return hashlib.blake2b('\x1f'.join(fields).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def asset_fingerprint(text):
+    """public/data 자산에 과목마다 넣는 짧은 지문 (FNV-1a 32비트, 16진수 8자리).
+
+    앱의 src/utils/assetFingerprint.ts 가 같은 값을 다시 계산해, 자산을 만든 뒤 바뀐 과목은
+    자산 대신 직접 계산한다.
+    """
+    h = 0x811c9dc5
+    for byte in text.encode('utf-8'):
+        h = ((h ^ byte) * 0x01000193) & 0xffffffff
+    return f"{h:08x}"
+
+
+class CourseRecord:
+    """과목 한 건. 엑셀 행과 TS 리터럴이 같은 타입을 쓴다.
+
+    source 는 엑셀 시트명('전공') 또는 TS 파일명('major_elective.ts').
+    TS 에만 있는 필드(credits, time_blocks, is_* 플래그 등)는 엑셀 레코드에서 기본값으로 남는다.
+    fingerprint 는 만들 때 한 번 계산하는 비교 필드 지문이다.
+    """
+    __slots__ = (
+        'id', 'code', 'section', 'name', 'college', 'department', 'major', 'year',
+        'category', 'credit_detail', 'professors', 'time_raw', 'room_raw', 'note',
+        'source', 'credits', 'time_blocks', 'is_time_confirmed', 'is_code_share',
+        'is_microdegree', 'microdegree_names', 'capacity', 'organizer', 'partner_university',
+        'fingerprint',
+    )
+
+    def __init__(self, id, code='', section='', name='', college='', department='', major='',
+                 year='', category='', credit_detail='', professors=_EMPTY, time_raw='',
+                 room_raw='', note='', source='', credits=None, time_blocks=_EMPTY,
+                 is_time_confirmed=None, is_code_share=None, is_microdegree=None,
+                 microdegree_names=_EMPTY, capacity=None, organizer=None, partner_university=None):
+        self.id = id
+        self.code = sys.intern(code)
+        self.section = sys.intern(section)
+        self.name = sys.intern(name)
+        self.college = sys.intern(college)
+        self.department = sys.intern(department)
+        self.major = sys.intern(major)
+        self.year = sys.intern(year)
+        self.category = sys.intern(category)
+        self.credit_detail = sys.intern(credit_detail)
+        self.professors = intern_tuple(professors)
+        self.time_raw = sys.intern(time_raw)
+        self.room_raw = sys.intern(room_raw)
+        self.note = note
+        self.source = sys.intern(source)
+        self.credits = credits
+        self.time_blocks = tuple(time_blocks) if time_blocks else _EMPTY
+        self.is_time_confirmed = is_time_confirmed
+        self.is_code_share = is_code_share
+        self.is_microdegree = is_microdegree
+        self.microdegree_names = intern_tuple(microdegree_names)
+        self.capacity = capacity
+        self.organizer = sys.intern(organizer) if organizer else organizer
+        self.partner_university = partner_university
+        self.fingerprint = fingerprint(self)
+
+    @property
+    def professor(self):
+        """교수명을 엑셀 셀과 같은 형태(쉼표 구분 한 문자열)로 반환"""
+        return ','.join(self.professors)
+
+    def __repr__(self):
+        return f"CourseRecord({self.id!r}, {self.name!r}, source={self.source!r})"
+
+
+class CourseView:
+    """CourseTable 의 부분집합. 레코드 대신 인덱스(range 또는 array)만 보관한다."""
+
+    def __init__(self, table, indices):
+        self.table = table
+        self.indices = indices
+        self._by_id = None
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        records = self.table.records
+        for i in self.indices:
+            yield records[i]
+
+    def __getitem__(self, i):
+        return self.table.records[self.indices[i]]
+
+    def where(self, predicate):
+        """조건을 만족하는 레코드만 담은 하위 뷰"""
+        records = self.table.records
+        return CourseView(self.table, array('I', (i for i in self.indices if predicate(records[i]))))
+
+    def ids(self):
+        return {r.id for r in self}
+
+    def lookup(self, section_id):
+        """'11967-1' 과 '11967-01' 어느 형태로도 레코드를 찾는다 (없으면 None)"""
+        return self.by_id().get(section_id) or self.by_id(normalize=True).get(normalize_id(section_id))
+
+    def by_id(self, normalize=False):
+        """id -> 레코드 (앞쪽 우선). normalize=True 이면 normalize_id 를 키로 쓴다."""
+        if self._by_id is None:
+            self._by_id = {}
+        mapping = self._by_id.get(normalize)
+        if mapping is None:
+            mapping = self._by_id[normalize] = {}
+            for r in self:
+                mapping.setdefault(normalize_id(r.id) if normalize else r.id, r)
+        return mapping
+
+
+class CourseTable(CourseView):
+    """한 학기 카탈로그(또는 한 시트)의 레코드 목록"""
+
+    def __init__(self, records=None, semester=''):
+        self.records = list(records) if records is not None else []
+        self.semester = semester
+        super().__init__(self, range(len(self.records)))
+
+    def append(self, record):
+        self.records.append(record)
+        self.indices = range(len(self.records))
+        self._by_id = None
+
+    def extend(self, records):
+        self.records.extend(records)
+        self.indices = range(len(self.records))
+        self._by_id = None
+
+    def slice(self, start, stop):
+        """연속 구간 뷰 (range 라서 추가 메모리가 거의 없다)"""
+        return CourseView(self, range(start, stop))
+
+    def by_source(self):
+        """source(시트명/파일명) -> 뷰. 같은 source 의 레코드가 연속이면 range 뷰가 된다."""
+        groups = {}
+        for i, r in enumerate(self.records):
+            groups.setdefault(r.source, []).append(i)
+        views = {}
+        for source, idx in groups.items():
+            if idx[-1] - idx[0] + 1 == len(idx):
+                views[source] = self.slice(idx[0], idx[-1] + 1)
+            else:
+                views[source] = CourseView(self, array('I', idx))
+        return views
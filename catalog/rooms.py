@@ -0,0 +1,165 @@
+"""강의실 점유 인덱스와 빈 강의실 검색.
+
+카탈로그 전체의 timeBlocks 로 강의실 x 요일 x 5분 슬롯 점유 비트맵을 한 번 만든다.
+빈 강의실/이용률 질의는 과목을 다시 훑지 않고 강의실별 비트맵 연산으로 답한다.
+"""
+import json
+import os
+import re
+
+from .timeslots import (DAY_START, DAYS, SLOT_MINUTES, SLOTS_PER_DAY, block_mask, day_bits,
+                        mask_blocks, parse_period_query, range_mask)
+
+UNKNOWN_ROOMS = ('', '미정', '0')
+ROOMS_ASSET = os.path.join('public', 'data', 'rooms.json')
+
+# 이용률 분모: 월~금 09:00~18:00
+TEACHING_DAYS = '월화수목금'
+TEACHING_HOURS = (9 * 60, 18 * 60)
+
+
+def room_key(room):
+    """'060335-0' 과 '060335' 를 같은 강의실로 본다 (끝의 '-0' 제거)"""
+    room = room.strip()
+    return room[:-2] if room.endswith('-0') else room
+
+
+def split_rooms(room):
+    """블록 강의실 문자열 -> 강의실 키 목록.
+
+    '090320,090410' 처럼 여러 강의실이 한 문자열로 오면 (어느 시간이 어느 강의실인지
+    알 수 없으므로) 각 강의실을 모두 점유한 것으로 본다. 미정 강의실은 빠진다.
+    """
+    keys = []
+    for part in re.split(r'[,/]', room):
+        part = part.strip()
+        if part not in UNKNOWN_ROOMS:
+            key = room_key(part)
+            if key not in keys:
+                keys.append(key)
+    return keys
+
+
+def building_of(room):
+    """강의실 번호 앞 두 자리 = 건물 번호 ('060141(성지관)' -> '06')"""
+    m = re.match(r'(\d{2})\d', room)
+    return m.group(1) if m else ''
+
+
+class RoomIndex:
+    """강의실 -> 주간 점유 마스크"""
+
+    def __init__(self, masks=None):
+        self.masks = masks or {}
+        self._by_building = None
+
+    @classmethod
+    def build(cls, records):
+        masks = {}
+        for r in records:
+            if r.is_time_confirmed is False:
+                continue
+            for b in r.time_blocks:
+                for key in split_rooms(b.room):
+                    masks[key] = masks.get(key, 0) | block_mask(b)
+        return cls(masks)
+
+    def buildings(self):
+        if self._by_building is None:
+            groups = {}
+            for room in sorted(self.masks):
+                groups.setdefault(building_of(room), []).append(room)
+            self._by_building = groups
+        return self._by_building
+
+    def rooms(self, building=None):
+        if building is None:
+            return sorted(self.masks)
+        return self.buildings().get(building, [])
+
+    def free_rooms(self, query_mask, building=None):
+        """query_mask 시간대에 비어 있는 강의실 목록"""
+        masks = self.masks
+        return [room for room in self.rooms(building) if not masks[room] & query_mask]
+
+    def occupants(self, room, query_mask):
+        """room 에서 query_mask 와 겹치는 시간대 (요일, 시작, 끝) 목록"""
+        return mask_blocks(self.masks.get(room_key(room), 0) & query_mask)
+
+    def utilization(self, building=None, days=TEACHING_DAYS, hours=TEACHING_HOURS):
+        """강의실별 (점유 분, 이용률) — 분모는 days x hours 구간"""
+        window = 0
+        for d in days:
+            window |= range_mask(d, *hours)
+        total = window.bit_count()
+        result = {}
+        for room in self.rooms(building):
+            used = (self.masks[room] & window).bit_count()
+            result[room] = (used * SLOT_MINUTES, used / total if total else 0.0)
+        return result
+
+    def to_json(self):
+        """앱에서 읽는 정적 자산 형태. 강의실마다 요일별 SLOTS_PER_DAY 비트를 16진수로 기록"""
+        rooms = {}
+        for room in sorted(self.masks):
+            mask = self.masks[room]
+            days = {d: format(day_bits(mask, d), 'x') for d in DAYS if day_bits(mask, d)}
+            rooms[room] = days
+        return {
+            'slotMinutes': SLOT_MINUTES,
+            'dayStart': f"{DAY_START // 60:02d}:{DAY_START % 60:02d}",
+            'slotsPerDay': SLOTS_PER_DAY,
+            'rooms': rooms,
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        masks = {}
+        for room, days in data['rooms'].items():
+            mask = 0
+            for d, hexbits in days.items():
+                mask |= int(hexbits, 16) << (DAYS.index(d) * SLOTS_PER_DAY)
+            masks[room] = mask
+        return cls(masks)
+
+
+def write_rooms_asset(index, path=ROOMS_ASSET):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(index.to_json(), f, ensure_ascii=False, separators=(',', ':'))
+
+
+def load_rooms_asset(path=ROOMS_ASSET):
+    with open(path, 'r', encoding='utf-8') as f:
+        return RoomIndex.from_json(json.load(f))
+
+
+def register(subparsers):
+    p = subparsers.add_parser('rooms', help='빈 강의실 / 강의실 이용률')
+    sub = p.add_subparsers(dest='rooms_command', required=True)
+    free = sub.add_parser('free', help="빈 강의실 (예: free 화3-5 --building 06)")
+    free.add_argument('when', help="요일+교시 (예: '화3-5', '목A', '월1,2/수3')")
+    free.add_argument('--building', help='건물 번호 두 자리 (예: 06)')
+    util = sub.add_parser('util', help='강의실별 이용률 (월~금 09~18시 기준)')
+    util.add_argument('--building')
+    util.add_argument('--top', type=int, default=30)
+    emit = sub.add_parser('emit', help=f'점유 인덱스를 {ROOMS_ASSET} 로 저장')
+    emit.add_argument('--out', default=ROOMS_ASSET)
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    index = RoomIndex.build(catalog)
+    if args.rooms_command == 'free':
+        rooms = index.free_rooms(parse_period_query(args.when), args.building)
+        print(f"{args.when} 빈 강의실 ({len(rooms)}개):")
+        for room in rooms:
+            print(f"  {room}")
+    elif args.rooms_command == 'util':
+        util = index.utilization(args.building)
+        ranked = sorted(util.items(), key=lambda kv: -kv[1][1])
+        for room, (minutes, ratio) in ranked[:args.top]:
+            print(f"  {room:<24} {minutes // 60:>3}시간 {minutes % 60:02d}분  {ratio:6.1%}")
+    else:
+        write_rooms_asset(index, args.out)
+        print(f"{args.out}: 강의실 {len(index.masks)}개")
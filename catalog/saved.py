@@ -0,0 +1,51 @@
+"""저장된 시간표(src/utils/storage.ts 의 SavedTimetable) 읽기.
+
+localStorage 의 'unitimetable_saved_timetables' 값(SavedTimetable 배열)이나
+시간표 하나(SavedTimetable 객체)를 JSON 파일로 내보낸 것을 읽는다.
+"""
+import json
+from collections import namedtuple
+
+from .tsdata import record_from_literal
+
+SAVED_TIMETABLES_KEY = 'unitimetable_saved_timetables'
+
+SavedTimetable = namedtuple('SavedTimetable', ['id', 'name', 'records', 'created_at', 'updated_at'])
+
+
+def timetable_from_json(obj):
+    records = [record_from_literal(sc['course'], source='saved') for sc in obj.get('selectedCourses') or ()]
+    return SavedTimetable(obj.get('id', ''), obj.get('name', ''), records,
+                          obj.get('createdAt', ''), obj.get('updatedAt', ''))
+
+
+def read_saved_json(path):
+    """JSON 파일 -> SavedTimetable 객체(dict) 목록.
+
+    배열, 시간표 객체 하나, {'unitimetable_saved_timetables': '<JSON 문자열>'} 형태의
+    localStorage 덤프를 모두 받는다.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict) and SAVED_TIMETABLES_KEY in data:
+        data = data[SAVED_TIMETABLES_KEY]
+        if isinstance(data, str):
+            data = json.loads(data)
+    if isinstance(data, dict):
+        data = [data]
+    return data
+
+
+def load_saved_timetables(path):
+    """JSON 파일 -> SavedTimetable 목록 (과목은 CourseRecord 로 변환)"""
+    return [timetable_from_json(obj) for obj in read_saved_json(path)]
+
+
+def find_timetable(timetables, key=None):
+    """id 또는 이름으로 시간표 하나를 고른다. key 가 없으면 마지막으로 수정한 시간표"""
+    if key is None:
+        return max(timetables, key=lambda t: t.updated_at) if timetables else None
+    for t in timetables:
+        if key in (t.id, t.name):
+            return t
+    return None
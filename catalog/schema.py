@@ -0,0 +1,136 @@
+"""시트 헤더로 컬럼 위치 추론.
+
+시트마다 헤더 행을 찾아 한글 헤더명(학수번호, 분반, 담당교수/담당교원, 강의시간 ...)을
+CourseRecord 필드로 매핑한다. 같은 헤더(공백 제거 후 셀 목록)는 한 번만 추론하고,
+추론한 위치가 sheets.SHEET_COLUMNS 의 기대 위치와 다르면 layout 변경으로 보고한다.
+헤더를 찾지 못하면 SHEET_COLUMNS 의 고정 위치를 쓴다.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+# 필드 -> 헤더명 (공백 제거 후 비교)
+HEADER_FIELDS = {
+    'name': ('과목명', '교과목명'),
+    'category': ('이수구분', '이수구분(개설)'),
+    'code': ('학수번호',),
+    'section': ('분반',),
+    'credit_detail': ('학점-강의-실습', '학-강-실', '학강실', '학점'),
+    'college': ('단과대학', '주관대학'),
+    'department': ('[학부]학과', '학부/학과', '주관학과(전공)', '학과'),
+    'major': ('전공',),
+    'year': ('수강대상학년', '학년'),
+    'professor': ('담당교수', '담당교원'),
+    'time_raw': ('강의시간',),
+    'room_raw': ('강의실',),
+    'note': ('비고',),
+    'microdegree': ('마이크로디그리명',),
+}
+_HEADER_INDEX = {h: field for field, names in HEADER_FIELDS.items() for h in names}
+
+# 헤더 행으로 인정하는 조건: 이 필드들이 모두 있어야 한다
+KEY_FIELDS = ('code', 'section')
+HEADER_SCAN_ROWS = 10
+
+Schema = namedtuple('Schema', ['header_row', 'columns', 'unknown', 'changes'])
+
+# 엑셀만 읽는 명령이라 TS 카탈로그가 필요 없다 (__main__.py)
+NEEDS_CATALOG = False
+
+
+class SchemaError(ValueError):
+    """헤더에서 필수 컬럼을 찾지 못함"""
+
+
+def normalize_header(cell):
+    return re.sub(r'\s+', '', str(cell or ''))
+
+
+def header_signature(row):
+    """헤더 행 -> 캐시 키 (공백 제거, 뒤쪽 빈 셀 제거)"""
+    cells = [normalize_header(c) for c in row]
+    while cells and not cells[-1]:
+        cells.pop()
+    return tuple(cells)
+
+
+@lru_cache(maxsize=None)
+def infer_columns(signature):
+    """헤더 시그니처 -> ({필드: 위치}, 알 수 없는 헤더 목록). 같은 필드가 두 번 나오면 앞쪽 우선"""
+    columns = {}
+    unknown = []
+    for i, cell in enumerate(signature):
+        if not cell:
+            continue
+        field = _HEADER_INDEX.get(cell)
+        if field is None:
+            unknown.append(cell)
+        else:
+            columns.setdefault(field, i)
+    return columns, tuple(unknown)
+
+
+def find_header_row(rows, scan=HEADER_SCAN_ROWS):
+    """앞쪽 scan 개 행에서 학수번호/분반 헤더가 있는 첫 행 번호 (없으면 None)"""
+    for i, row in enumerate(rows[:scan]):
+        columns, _ = infer_columns(header_signature(row))
+        if all(f in columns for f in KEY_FIELDS):
+            return i
+    return None
+
+
+def sheet_schema(sheet_name, rows, expected=None):
+    """시트 행 목록의 Schema. expected 는 기대 위치 {'required': .., 'columns': {..}}"""
+    header_row = find_header_row(rows)
+    if header_row is None:
+        if expected is None:
+            raise SchemaError(f"{sheet_name}: 헤더 행(학수번호, 분반)을 찾지 못했습니다")
+        return Schema(None, dict(expected['columns']), (), ["헤더 행을 찾지 못해 고정 위치 사용"])
+    columns, unknown = infer_columns(header_signature(rows[header_row]))
+    changes = []
+    if expected is not None:
+        exp = expected['columns']
+        if expected['required'] not in columns:
+            raise SchemaError(f"{sheet_name}: 필수 컬럼 '{expected['required']}' 이(가) 헤더에 없습니다")
+        for field in sorted(exp.keys() | columns.keys()):
+            if exp.get(field) != columns.get(field):
+                changes.append(f"{field}: {_pos(exp.get(field))} -> {_pos(columns.get(field))}")
+    return Schema(header_row, dict(columns), unknown, changes)
+
+
+def _pos(index):
+    return '없음' if index is None else str(index)
+
+
+def register(subparsers):
+    p = subparsers.add_parser('schema', help='엑셀 시트 헤더에서 추론한 컬럼 위치와 변경 사항')
+    p.add_argument('--excel', default='excel_data.json', help='수강편람 xlsx 또는 excel_data.json')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    from .sheets import SHEET_COLUMNS, SHEET_NAMES, read_workbook_rows
+    from .snapshot import Snapshot
+
+    source = Snapshot(args.excel) if args.excel.endswith('.json') else read_workbook_rows(args.excel, SHEET_NAMES)
+    status = 0
+    for name in SHEET_NAMES:
+        if name not in source:
+            print(f"[{name}] 시트가 없습니다")
+            status = 1
+            continue
+        try:
+            schema = sheet_schema(name, source[name], SHEET_COLUMNS[name])
+        except SchemaError as e:
+            print(f"[{name}] {e}")
+            status = 1
+            continue
+        mapped = ', '.join(f"{f}={i}" for f, i in sorted(schema.columns.items(), key=lambda kv: kv[1]))
+        print(f"[{name}] 헤더 {schema.header_row}행: {mapped}")
+        if schema.unknown:
+            print(f"    알 수 없는 헤더: {', '.join(schema.unknown)}")
+        for change in schema.changes:
+            print(f"    위치 변경: {change}")
+        if schema.changes:
+            status = 1
+    return status
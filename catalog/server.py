@@ -0,0 +1,391 @@
+"""로컬 카탈로그 질의 HTTP 서비스.
+
+카탈로그를 한 번 읽어 학수번호/교수/강의실/이수구분/시간대별 인덱스를 메모리에 두고
+JSON 질의에 답한다. 표준 라이브러리 asyncio 스트림으로 HTTP/1.1(keep-alive)을 직접 처리해
+스레드 하나로 동시 연결 수백 개를 받는다. 서비스 중에는 카탈로그가 바뀌지 않으므로
+같은 질의(경로 + 정렬한 파라미터)의 응답 바이트를 LRU 로 캐시한다.
+
+    GET /search?q=자료구조&category=전선&year=2&credits=3&professor=..&room=..&when=화3-5&limit=50
+                                            limit 은 1 ~ 1000 (기본 50)
+    GET /search?microdegree=생성형AI       마이크로디그리에 인정되는 분반 (이름 일부로 찾음)
+    GET /course?id=11967-01
+    GET /conflicts?id=11967-01              한 분반과 시간이 겹치는 분반
+    GET /conflicts?ids=11967-01,13479-02    선택한 분반들 사이의 충돌 쌍
+    GET /rooms/free?when=화3-5&building=06
+    GET /stats                              인덱스 크기와 캐시 적중률 (캐시하지 않음)
+
+여러 값을 받는 파라미터(category, year, credits, ids)는 쉼표로 구분하거나 반복해서 준다.
+"""
+import asyncio
+import json
+from array import array
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlsplit
+
+from .conflicts import ConflictIndex
+from .filters import matches_category, matches_year
+from .microdegrees import MicrodegreeIndex
+from .records import normalize_id
+from .rooms import RoomIndex, room_key, split_rooms
+from .timeslots import DAYS, SLOTS_PER_DAY, course_mask, parse_period_query
+
+# 시간대 인덱스 단위: 요일별 1시간(12 슬롯) 버킷
+BUCKET_SLOTS = 12
+N_BUCKETS = len(DAYS) * SLOTS_PER_DAY // BUCKET_SLOTS
+_BUCKET_FULL = (1 << BUCKET_SLOTS) - 1
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1000
+MAX_HEADER_LINES = 100
+
+
+class QueryError(ValueError):
+    """잘못된 질의 (400)"""
+
+
+def record_json(r):
+    """src/types/index.ts 의 Course 필수 키 (+ timeRaw, roomRaw)"""
+    return {
+        'id': r.id, 'code': r.code, 'section': r.section, 'name': r.name,
+        'college': r.college, 'department': r.department, 'major': r.major, 'year': r.year,
+        'credits': r.credits, 'creditDetail': r.credit_detail, 'professors': list(r.professors),
+        'category': r.category, 'note': r.note,
+        'timeRaw': r.time_raw, 'roomRaw': r.room_raw, 'isTimeConfirmed': r.is_time_confirmed,
+        'timeBlocks': [{'day': b.day, 'startTime': b.start_time, 'endTime': b.end_time,
+                        'room': b.room, 'group': b.group} for b in r.time_blocks],
+    }
+
+
+def mask_buckets(mask):
+    """마스크가 걸친 시간대 버킷 번호들"""
+    buckets = []
+    for b in range(N_BUCKETS):
+        if (mask >> (b * BUCKET_SLOTS)) & _BUCKET_FULL:
+            buckets.append(b)
+    return buckets
+
+
+class CatalogIndex:
+    """카탈로그 레코드 목록과 필드별 역색인 (값 -> 레코드 번호 array)"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.records = list(catalog)
+        self.masks = [course_mask(r) for r in self.records]
+        # q 검색 대상 (학수번호, 과목명, 교수명을 이은 문자열)
+        self.texts = [f"{r.code}\x00{r.name}\x00{r.professor}" for r in self.records]
+        by_code, by_professor, by_room, buckets, by_section = {}, {}, {}, {}, {}
+        for i, r in enumerate(self.records):
+            by_code.setdefault(r.code, array('I')).append(i)
+            by_section.setdefault(normalize_id(r.id), i)
+            for p in set(r.professors):
+                by_professor.setdefault(p, array('I')).append(i)
+            for room in {k for b in r.time_blocks for k in split_rooms(b.room)}:
+                by_room.setdefault(room, array('I')).append(i)
+            for b in mask_buckets(self.masks[i]):
+                buckets.setdefault(b, array('I')).append(i)
+        self.by_code = by_code
+        self.by_professor = by_professor
+        self.by_room = by_room
+        self.buckets = buckets
+        self.by_section = by_section
+        self.microdegrees = MicrodegreeIndex.build(self.records)
+        self._by_category = {}
+        self.rooms = RoomIndex.build(self.records)
+        self.conflicts = ConflictIndex.build(self.records)
+
+    def category_members(self, category):
+        """filterCourses.ts 와 같은 의미의 이수구분 필터 결과. 처음 질의할 때 만들어 둔다"""
+        members = self._by_category.get(category)
+        if members is None:
+            members = self._by_category[category] = array(
+                'I', (i for i, r in enumerate(self.records) if matches_category(r, [category])))
+        return members
+
+    def microdegree_members(self, query):
+        """이름에 query 가 들어간 마이크로디그리들에 속한 레코드 번호 집합"""
+        md = self.microdegrees
+        return {self.by_section[sid] for name in md.find(query) for sid in md.members(name)
+                if sid in self.by_section}
+
+    def overlapping(self, mask):
+        """mask 와 시간이 겹치는 레코드 번호 집합 (버킷으로 후보를 줄인 뒤 마스크로 확인)"""
+        candidates = set()
+        for b in mask_buckets(mask):
+            candidates.update(self.buckets.get(b, ()))
+        masks = self.masks
+        return {i for i in candidates if masks[i] & mask}
+
+    def search(self, q='', categories=(), years=(), credits=(), professor='', room='', when=None,
+               microdegree='', limit=DEFAULT_LIMIT):
+        """조건을 모두 만족하는 레코드 (id 순)와 전체 개수"""
+        sets = []
+        if categories:
+            sets.append(set().union(*(self.category_members(c) for c in categories)))
+        if professor:
+            sets.append(set(self.by_professor.get(professor, ())))
+        if room:
+            sets.append(set(self.by_room.get(room_key(room), ())))
+        if when is not None:
+            sets.append(self.overlapping(when))
+        if microdegree:
+            sets.append(self.microdegree_members(microdegree))
+        if sets:
+            sets.sort(key=len)
+            found = sets[0].intersection(*sets[1:])
+        else:
+            found = range(len(self.records))
+        records, texts = self.records, self.texts
+        result = []
+        for i in found:
+            if q and q not in texts[i]:
+                continue
+            r = records[i]
+            if years and not matches_year(r, years):
+                continue
+            if credits and r.credits not in credits:
+                continue
+            result.append(r)
+        result.sort(key=lambda r: r.id)
+        return result[:limit], len(result)
+
+    def lookup(self, section_id):
+        return self.catalog.lookup(section_id)
+
+    def selection_conflicts(self, section_ids):
+        """선택한 분반들 사이의 충돌 쌍 [(id, id)] 과 카탈로그에 없는 id 목록"""
+        chosen, missing = [], []
+        for sid in section_ids:
+            r = self.lookup(sid)
+            if r is None:
+                missing.append(sid)
+            else:
+                chosen.append((r.id, course_mask(r)))
+        pairs = [(a, b) for n, (a, ma) in enumerate(chosen) for b, mb in chosen[n + 1:] if ma & mb]
+        return pairs, missing
+
+
+class ResponseCache:
+    """질의 키 -> (상태 코드, 응답 바이트) LRU"""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        if self.maxsize <= 0:
+            return
+        self.entries[key] = entry
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+
+def _values(params, name):
+    """반복 파라미터와 쉼표 구분 값을 모두 펼친 목록"""
+    return [v.strip() for raw in params.get(name, ()) for v in raw.split(',') if v.strip()]
+
+
+def _first(params, name, default=''):
+    values = params.get(name)
+    return values[0].strip() if values else default
+
+
+def _int(text, name):
+    try:
+        return int(text)
+    except ValueError:
+        raise QueryError(f"{name} 은(는) 정수여야 합니다: {text}") from None
+
+
+def _when(params):
+    text = _first(params, 'when')
+    if not text:
+        return None
+    try:
+        return parse_period_query(text)
+    except ValueError as e:
+        raise QueryError(str(e)) from None
+
+
+class CatalogService:
+    """경로/파라미터 -> (상태 코드, JSON 바이트). HTTP 와 무관하게 호출할 수 있다"""
+
+    def __init__(self, index, cache_size=1024):
+        self.index = index
+        self.cache = ResponseCache(cache_size)
+        self.routes = {
+            '/search': self.search,
+            '/course': self.course,
+            '/conflicts': self.conflicts,
+            '/rooms/free': self.free_rooms,
+        }
+
+    def respond(self, target):
+        parts = urlsplit(target)
+        path = parts.path.rstrip('/') or '/'
+        if path == '/stats':
+            return 200, _dump(self.stats())
+        handler = self.routes.get(path)
+        if handler is None:
+            return 404, _dump({'error': f"알 수 없는 경로: {path}"})
+        pairs = parse_qsl(parts.query, keep_blank_values=True)
+        key = (path, tuple(sorted(pairs)))
+        entry = self.cache.get(key)
+        if entry is None:
+            params = {}
+            for k, v in pairs:
+                params.setdefault(k, []).append(v)
+            try:
+                entry = 200, _dump(handler(params))
+            except QueryError as e:
+                entry = 400, _dump({'error': str(e)})
+            self.cache.put(key, entry)
+        return entry
+
+    def search(self, params):
+        credits = [_int(c, 'credits') for c in _values(params, 'credits')]
+        limit = _int(_first(params, 'limit', str(DEFAULT_LIMIT)), 'limit')
+        if not 1 <= limit <= MAX_LIMIT:
+            raise QueryError(f"limit 은(는) 1 ~ {MAX_LIMIT} 이어야 합니다: {limit}")
+        records, total = self.index.search(
+            q=_first(params, 'q'), categories=_values(params, 'category'), years=_values(params, 'year'),
+            credits=credits, professor=_first(params, 'professor'), room=_first(params, 'room'),
+            when=_when(params), microdegree=_first(params, 'microdegree'), limit=limit)
+        return {'total': total, 'courses': [record_json(r) for r in records]}
+
+    def course(self, params):
+        sid = _first(params, 'id')
+        if not sid:
+            raise QueryError("id 파라미터가 필요합니다")
+        r = self.index.lookup(sid)
+        return {'course': record_json(r) if r is not None else None}
+
+    def conflicts(self, params):
+        ids = _values(params, 'ids')
+        if ids:
+            pairs, missing = self.index.selection_conflicts(ids)
+            return {'conflicts': [list(p) for p in pairs], 'missing': missing}
+        sid = _first(params, 'id')
+        if not sid:
+            raise QueryError("id 또는 ids 파라미터가 필요합니다")
+        r = self.index.lookup(sid)
+        if r is None:
+            return {'id': sid, 'conflicts': None}
+        return {'id': r.id, 'conflicts': self.index.conflicts.conflicts(r.id)}
+
+    def free_rooms(self, params):
+        mask = _when(params)
+        if mask is None:
+            raise QueryError("when 파라미터가 필요합니다 (예: 화3-5)")
+        building = _first(params, 'building') or None
+        return {'rooms': self.index.rooms.free_rooms(mask, building)}
+
+    def stats(self):
+        index, cache = self.index, self.cache
+        lookups = cache.hits + cache.misses
+        return {
+            'courses': len(index.records), 'codes': len(index.by_code),
+            'professors': len(index.by_professor), 'rooms': len(index.by_room),
+            'cache': {'size': len(cache.entries), 'maxsize': cache.maxsize, 'hits': cache.hits,
+                      'misses': cache.misses, 'hitRate': cache.hits / lookups if lookups else 0.0},
+        }
+
+
+def _dump(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+def _response(status, body, keep_alive):
+    head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            "Access-Control-Allow-Origin: *\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+def _content_length(headers):
+    """Content-Length 헤더 -> 본문 바이트 수 (없으면 0, 음이 아닌 정수가 아니면 None)"""
+    text = headers.get('content-length', '0')
+    return int(text) if text.isascii() and text.isdigit() else None
+
+
+async def handle_connection(service, reader, writer):
+    """연결 하나에서 요청을 차례로 처리한다 (keep-alive). GET/HEAD 만 받는다"""
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                method, target, version = line.decode('latin-1').split()
+            except ValueError:
+                break
+            headers = {}
+            for _ in range(MAX_HEADER_LINES):
+                h = await reader.readline()
+                if h in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = h.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            conn = headers.get('connection', '').lower()
+            keep_alive = conn != 'close' and (version != 'HTTP/1.0' or conn == 'keep-alive')
+            length = _content_length(headers)
+            if length:
+                await reader.readexactly(length)
+            if length is None:
+                # 본문 경계를 알 수 없으므로 응답하고 연결을 닫는다
+                keep_alive = False
+                status, body = 400, _dump({'error': f"잘못된 Content-Length: {headers['content-length']}"})
+            elif method in ('GET', 'HEAD'):
+                status, body = service.respond(target)
+            else:
+                status, body = 405, _dump({'error': f"지원하지 않는 메서드: {method}"})
+            data = _response(status, body, keep_alive)
+            writer.write(data if method != 'HEAD' else data[:len(data) - len(body)])
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(service, host, port):
+    server = await asyncio.start_server(lambda r, w: handle_connection(service, r, w), host, port,
+                                        backlog=1024)
+    async with server:
+        print(f"[catalog] http://{host}:{port} 과목 {len(service.index.records)}개")
+        await server.serve_forever()
+
+
+def register(subparsers):
+    p = subparsers.add_parser('serve', help='카탈로그 질의 HTTP 서비스 (검색/충돌/빈 강의실)')
+    p.add_argument('--host', default='127.0.0.1')
+    p.add_argument('--port', type=int, default=8765)
+    p.add_argument('--cache-size', type=int, default=1024, help='응답 LRU 캐시 항목 수 (0 이면 끔)')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    service = CatalogService(CatalogIndex(catalog), args.cache_size)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1,161 @@
+"""수강편람 시트 -> CourseRecord 변환.
+
+시트 행은 extract_excel.py 와 같은 형태(셀마다 문자열, 빈 셀은 '')로 다룬다.
+openpyxl 워크북이든 excel_data.json 이든 같은 파서를 쓴다.
+컬럼 위치는 시트 헤더에서 추론하고, 행마다 itemgetter 하나로 필요한 셀을 꺼낸다.
+"""
+from operator import itemgetter
+
+from .records import CourseRecord, CourseTable, intern_str
+from .schema import SchemaError, sheet_schema
+
+# 시트별 기대 컬럼 위치 (0부터). 실제 위치는 헤더에서 추론하고(schema.py), 이 표는
+# 헤더를 찾지 못했을 때의 기본값과 위치 변경 감지에 쓴다. required 컬럼이 비어 있으면 행을 건너뛴다.
+SHEET_COLUMNS = {
+    # 과목명, 이수구분, 학수번호, 분반, 학점-강의-실습, 단과대학, [학부]학과, 수강대상 학년, 담당교수, 강의시간, 강의실
+    '교필': {
+        'required': 'name',
+        'columns': {'name': 0, 'category': 1, 'code': 2, 'section': 3, 'credit_detail': 4,
+                    'college': 5, 'department': 6, 'year': 7, 'professor': 8,
+                    'time_raw': 9, 'room_raw': 10},
+    },
+    # 교과목명, 이수구분, 학수번호, 분반, 학점-강의-실습, 담당교수, 강의시간, 강의실, 비고
+    '교선': {
+        'required': 'name',
+        'columns': {'name': 0, 'category': 1, 'code': 2, 'section': 3, 'credit_detail': 4,
+                    'professor': 5, 'time_raw': 6, 'room_raw': 7, 'note': 8},
+    },
+    # 단과대학, 학부/학과, 전공, 학년, 학수번호, 분반, 과목 명, 이수구분, 학점, 담당교수, 강의시간, 강의실, 비고
+    '전공': {
+        'required': 'college',
+        'columns': {'college': 0, 'department': 1, 'major': 2, 'year': 3, 'code': 4,
+                    'section': 5, 'name': 6, 'category': 7, 'credit_detail': 8,
+                    'professor': 9, 'time_raw': 10, 'room_raw': 11, 'note': 12},
+    },
+    # 교과목명, 주관 대학, 주관학과(전공), 학수번호, 분반, 학강실, 학년, 이수구분(개설), 담당교원, 강의시간, 강의실
+    '코드쉐어': {
+        'required': 'name',
+        'columns': {'name': 0, 'college': 1, 'department': 2, 'code': 3, 'section': 4,
+                    'credit_detail': 5, 'year': 6, 'category': 7, 'professor': 8,
+                    'time_raw': 9, 'room_raw': 10},
+    },
+    # 마이크로디그리 명, 학수번호, 교과목명, 분반, 학-강-실, 학년, 이수구분, 담당교원, 강의시간, 강의실, 비고
+    '마이크로디그리': {
+        'required': 'microdegree',
+        'columns': {'microdegree': 0, 'code': 1, 'name': 2, 'section': 3, 'credit_detail': 4,
+                    'year': 5, 'category': 6, 'professor': 7, 'time_raw': 8,
+                    'room_raw': 9, 'note': 10},
+    },
+}
+
+SHEET_NAMES = list(SHEET_COLUMNS)
+
+
+# CourseRecord 로 옮기는 필드 (professor / microdegree 는 튜플 필드로 변환)
+RECORD_FIELDS = ('code', 'section', 'name', 'college', 'department', 'major', 'year', 'category',
+                 'credit_detail', 'professor', 'time_raw', 'room_raw', 'note', 'microdegree')
+
+
+def sheet_columns(sheet_name, rows):
+    """(헤더 다음 행 번호, {필드: 위치}). 헤더에서 추론하고, 못 찾으면 SHEET_COLUMNS 의 고정 위치"""
+    schema = sheet_schema(sheet_name, rows, SHEET_COLUMNS[sheet_name])
+    start = schema.header_row + 1 if schema.header_row is not None else 2
+    return start, schema.columns
+
+
+def _projection(columns):
+    """행 -> 시트에 있는 필드의 셀들을 한 번에 꺼내는 itemgetter, 그 필드들의 RECORD_FIELDS 위치, 필요한 행 길이"""
+    present = [(k, columns[f]) for k, f in enumerate(RECORD_FIELDS) if f in columns]
+    getter = itemgetter(*(col for _, col in present))
+    return getter, [k for k, _ in present], max(col for _, col in present) + 1
+
+
+def parse_sheet(sheet_name, rows, start_row=None):
+    """시트 행 목록을 CourseRecord 리스트로 변환 (중간에 반복되는 헤더 행은 건너뜀)"""
+    return [record for _, record in iter_sheet(sheet_name, rows, start_row)]
+
+
+def iter_sheet(sheet_name, rows, start_row=None, columns=None):
+    """(행 번호, CourseRecord) 를 차례로 내보낸다. 행 번호는 rows 기준 (0부터).
+
+    columns 를 주지 않으면 헤더에서 추론하고, start_row 를 주지 않으면 헤더 다음 행부터 읽는다.
+    """
+    if columns is None:
+        header_next, columns = sheet_columns(sheet_name, rows)
+        if start_row is None:
+            start_row = header_next
+    elif start_row is None:
+        start_row = 0
+    getter, slots, width = _projection(columns)
+    required = RECORD_FIELDS.index(SHEET_COLUMNS[sheet_name]['required'])
+    pad = [''] * width
+    blank = [''] * len(RECORD_FIELDS)  # 시트에 없는 필드는 빈 문자열
+    for i, row in enumerate(rows[start_row:], start_row):
+        if len(row) < width:
+            row = list(row) + pad[len(row):]
+        cells = list(blank)
+        for k, c in zip(slots, getter(row)):
+            cells[k] = intern_str(c)
+        code = cells[0]
+        if not cells[required] or code == '학수번호':
+            continue
+        (_, section, name, college, department, major, year, category, credit_detail,
+         professor, time_raw, room_raw, note, micro) = cells
+        section = section.zfill(2) if section else ''
+        yield i, CourseRecord(
+            f"{code}-{section}", code=code, section=section, name=name, college=college,
+            department=department, major=major, year=year, category=category,
+            credit_detail=credit_detail, professors=(professor,) if professor else (),
+            time_raw=time_raw, room_raw=room_raw, note=note,
+            microdegree_names=(micro,) if micro else (), source=sheet_name,
+        )
+
+
+# xlsx 를 읽는 방식: 'openpyxl' 또는 'stream' (xlsx.py, zip/XML 을 직접 스트리밍).
+# python -m catalog --xlsx-engine stream ... 으로 바꾼다
+XLSX_ENGINE = 'openpyxl'
+
+
+def stream_columns(sheet_name):
+    """스트리밍 리더용 열 선택 함수: 앞쪽 행 -> 이 시트를 파싱할 때 쓰는 열 위치 집합.
+
+    헤더 추론은 sheet_columns 와 같으므로 parse_sheet 결과는 모든 열을 읽었을 때와 같다.
+    헤더에 필수 컬럼이 없으면 None (모든 열을 읽고, 오류는 파싱하는 쪽에서 낸다).
+    """
+    def choose(head):
+        try:
+            _, columns = sheet_columns(sheet_name, head)
+        except SchemaError:
+            return None
+        return set(columns.values())
+    return choose
+
+
+def read_workbook_rows(path, sheet_names=None, engine=None):
+    """xlsx 를 열어 시트명 -> 문자열 행 목록을 반환 (openpyxl 은 여기서만 import).
+
+    stream 엔진은 SHEET_COLUMNS 시트의 헤더 아래 행에서 파싱에 쓰는 열만 읽고 나머지 셀은 '' 로 둔다.
+    """
+    if (engine or XLSX_ENGINE) == 'stream':
+        from .xlsx import read_workbook_rows as read_stream
+        return read_stream(path, sheet_names, {name: stream_columns(name) for name in SHEET_COLUMNS})
+    import openpyxl
+
+    wb = openpyxl.load_workbook(path, data_only=True, read_only=True)
+    result = {}
+    for name in sheet_names or wb.sheetnames:
+        ws = wb[name]
+        result[name] = [[str(c) if c is not None else "" for c in row]
+                        for row in ws.iter_rows(values_only=True)]
+    wb.close()
+    return result
+
+
+def load_sheets(sheet_rows, semester='', names=None):
+    """시트명 -> 행 목록 을 시트명 -> CourseTable 로 변환 (알려진 시트만).
+
+    sheet_rows 는 dict 또는 Snapshot. names 를 주면 그 시트만 읽는다.
+    """
+    names = [n for n in (names or SHEET_NAMES) if n in sheet_rows]
+    return {name: CourseTable(parse_sheet(name, sheet_rows[name]), semester=semester)
+            for name in names}
@@ -0,0 +1,242 @@
+"""excel_data.json 지연 로딩.
+
+extract_excel.py 가 excel_data.json 을 쓸 때 시트/행의 바이트 위치를
+excel_data.index.json 에 함께 기록한다. Snapshot 은 파일을 한 번만 열고,
+접근한 시트(또는 행)의 바이트만 읽어 json 으로 변환한다.
+
+    with Snapshot("excel_data.json") as snap:
+        major_rows = snap["전공"]      # 아직 읽지 않음
+        major_rows[2]                 # 이 행의 바이트만 읽음
+        for row in major_rows[2:]:    # 시트 구간을 한 번에 읽음
+            ...
+        snap.fingerprints("전공")     # 과목 id -> 지문 (인덱스에 저장됨)
+        snap.record("전공", "11967-01")  # 과목 하나만 읽어 CourseRecord 로
+"""
+import json
+import os
+
+from .sheets import SHEET_COLUMNS, iter_sheet, sheet_columns
+
+# 2: 시트별 과목 id -> [행 번호, 지문] (records) 추가
+INDEX_VERSION = 2
+
+
+def index_path_for(path):
+    root, _ = os.path.splitext(path)
+    return root + '.index.json'
+
+
+def _dump(value):
+    return json.dumps(value, ensure_ascii=False, indent=2)
+
+
+def _serialize(sheets):
+    """json.dump(sheets, ensure_ascii=False, indent=2) 와 같은 바이트를 만들면서 위치를 기록"""
+    parts = []
+    pos = 0
+    index = {}
+
+    def emit(text):
+        nonlocal pos
+        data = text.encode('utf-8')
+        parts.append(data)
+        pos += len(data)
+
+    emit('{')
+    for n, (name, rows) in enumerate(sheets.items()):
+        emit((',' if n else '') + '\n  ' + json.dumps(name, ensure_ascii=False) + ': ')
+        start = pos
+        offsets = []
+        if not rows:
+            emit('[]')
+        else:
+            emit('[')
+            for i, row in enumerate(rows):
+                emit((',' if i else '') + '\n    ')
+                row_start = pos
+                emit(_dump(row).replace('\n', '\n    '))
+                offsets.append(row_start - start)
+                offsets.append(pos - row_start)
+            emit('\n  ]')
+        index[name] = {'offset': start, 'length': pos - start, 'rows': offsets}
+    emit('\n}' if sheets else '}')
+    return b''.join(parts), index
+
+
+def _add_fingerprints(sheets, index):
+    """알려진 시트마다 과목 id -> [행 번호, 지문] 을 인덱스에 넣는다 (같은 id 는 앞쪽 우선)"""
+    for name, rows in sheets.items():
+        if name not in SHEET_COLUMNS:
+            continue
+        records = {}
+        for i, record in iter_sheet(name, rows):
+            records.setdefault(record.id, [i, record.fingerprint])
+        index[name]['records'] = records
+
+
+def write_snapshot(sheets, path):
+    """시트명 -> 행 목록 을 path 에 저장하고, 같은 위치에 오프셋 인덱스를 쓴다"""
+    data, index = _serialize(sheets)
+    _write_atomic(path, data)
+    _add_fingerprints(sheets, index)
+    _write_index(path, len(data), index)
+
+
+def build_index(path):
+    """기존 excel_data.json 에 대한 인덱스를 만든다 (한 번 전체를 읽음)"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    sheets = json.loads(raw.decode('utf-8-sig'))
+    data, index = _serialize(sheets)
+    if data != raw:
+        raise ValueError(f"{path} 가 extract_excel.py 형식(indent=2)이 아니어서 인덱스를 만들 수 없습니다")
+    _add_fingerprints(sheets, index)
+    _write_index(path, len(raw), index)
+    return index
+
+
+def _write_index(path, size, index):
+    data = json.dumps({'version': INDEX_VERSION, 'size': size, 'sheets': index},
+                      ensure_ascii=False, separators=(',', ':'))
+    _write_atomic(index_path_for(path), data.encode('utf-8'))
+
+
+def _write_atomic(path, data):
+    """같은 폴더의 임시 파일에 쓴 뒤 os.replace 로 바꾼다.
+    쓰는 도중 중단되거나 다른 프로세스가 읽어도 이전 파일 또는 완성된 파일만 보인다"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class SheetRows:
+    """시트 하나의 행 목록. 행 단위 접근은 그 행만, 순회/슬라이스는 해당 구간만 읽는다."""
+
+    def __init__(self, snapshot, name, entry):
+        self._snap = snapshot
+        self.name = name
+        self._offset = entry['offset']
+        self._length = entry['length']
+        self._rows = entry['rows']
+        self._cache = {}
+        self._all = None
+
+    def __len__(self):
+        return len(self._rows) // 2
+
+    def _row_span(self, i):
+        return self._offset + self._rows[2 * i], self._rows[2 * i + 1]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._slice(i)
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        if self._all is not None:
+            return self._all[i]
+        row = self._cache.get(i)
+        if row is None:
+            row = self._cache[i] = json.loads(self._snap._read(*self._row_span(i)))
+        return row
+
+    def _slice(self, s):
+        if self._all is not None:
+            return self._all[s]
+        idx = range(len(self))[s]
+        if not idx:
+            return []
+        if s.step not in (None, 1):
+            return [self[i] for i in idx]
+        # 연속 구간은 첫 행 시작 ~ 마지막 행 끝까지 한 번에 읽어 JSON 배열로 파싱
+        first, _ = self._row_span(idx[0])
+        last, last_len = self._row_span(idx[-1])
+        return json.loads(b'[' + self._snap._read(first, last + last_len - first) + b']')
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def load(self):
+        """시트 전체를 읽어 리스트로 반환 (이후 접근은 메모리에서)"""
+        if self._all is None:
+            self._all = json.loads(self._snap._read(self._offset, self._length))
+            self._cache = {}
+        return self._all
+
+
+class Snapshot:
+    """excel_data.json 을 한 번 열어 두고 시트/행을 필요할 때만 읽는 리더"""
+
+    def __init__(self, path='excel_data.json'):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._sheets = {}
+        self._index = self._load_index()
+
+    def _load_index(self):
+        size = os.fstat(self._file.fileno()).st_size
+        try:
+            with open(index_path_for(self.path), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = None
+        if meta and meta.get('version') == INDEX_VERSION and meta.get('size') == size:
+            index = meta['sheets']
+            if all(self._read(e['offset'], 1) == b'[' for e in index.values()):
+                return index
+        # 인덱스가 없거나 오래됨 -> 다시 만든다
+        return build_index(self.path)
+
+    def _read(self, offset, length):
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    @property
+    def sheet_names(self):
+        return list(self._index)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __getitem__(self, name):
+        rows = self._sheets.get(name)
+        if rows is None:
+            rows = self._sheets[name] = SheetRows(self, name, self._index[name])
+        return rows
+
+    def get(self, name, default=None):
+        return self[name] if name in self._index else default
+
+    def fingerprints(self, name):
+        """과목 id -> 지문 (인덱스에서 바로 읽으며 시트 JSON 은 읽지 않는다)"""
+        return {cid: fp for cid, (_, fp) in self._index[name].get('records', {}).items()}
+
+    def record(self, name, course_id):
+        """과목 하나를 그 행의 바이트만 읽어 CourseRecord 로 만든다 (없으면 None)"""
+        entry = self._index[name].get('records', {}).get(course_id)
+        if entry is None:
+            return None
+        rows = self[name]
+        _, columns = sheet_columns(name, rows)
+        for _, record in iter_sheet(name, [rows[entry[0]]], start_row=0, columns=columns):
+            return record
+        return None
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,75 @@
+"""명령 시작 시간 측정.
+
+캐시(.catalog-cache.pickle)와 스냅샷(excel_data.json + 인덱스)만으로 답하는 짧은 명령들을
+새 프로세스로 여러 번 실행해 전체 소요 시간(인터프리터 시작 포함)의 중앙값을 잰다.
+첫 실행은 캐시를 데우는 용도로 버린다. 중앙값이 예산(기본 100ms)을 넘거나, 측정한 실행 중 한 번이라도
+0 이 아닌 코드로 끝난 명령이 있으면 종료 코드 1 (실패한 명령은 stderr 를 함께 출력한다).
+"""
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+# 캐시/스냅샷으로 답하는 명령 (openpyxl 이나 xlsx 를 건드리지 않아야 한다)
+DEFAULT_COMMANDS = [
+    'conflicts show 11967-01',
+    'alternatives 13479 --selected 11967-01',
+    'rooms free 화3-5 --building 06',
+    'microdegrees --ts show 생성형AI',
+    'schema --excel excel_data.json',
+]
+
+NEEDS_CATALOG = False
+
+
+def time_command(argv, runs, courses_dir=None):
+    """argv 를 runs 번 실행한 소요 시간 목록(초), 처음 실패한 실행의 종료 코드(모두 성공이면 0)와 stderr"""
+    base = [sys.executable, '-m', 'catalog']
+    if courses_dir:
+        base += ['--courses-dir', courses_dir]
+    subprocess.run(base + argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    times = []
+    code, stderr = 0, ''
+    for _ in range(runs):
+        started = time.perf_counter()
+        proc = subprocess.run(base + argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        times.append(time.perf_counter() - started)
+        if proc.returncode and not code:
+            code, stderr = proc.returncode, proc.stderr.decode('utf-8', 'replace')
+    return times, code, stderr
+
+
+def register(subparsers):
+    p = subparsers.add_parser('startup-bench', help='짧은 명령들의 시작~종료 시간 측정 (캐시/스냅샷 사용)')
+    p.add_argument('commands', nargs='*', help="측정할 명령 (예: 'conflicts show 11967-01'). 기본: 대표 명령들")
+    p.add_argument('--runs', type=int, default=10)
+    p.add_argument('--budget-ms', type=float, default=100.0, help='중앙값 허용 시간 (ms)')
+    p.add_argument('--json', action='store_true', help='JSON 으로 출력 (CI 기록용)')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    results = []
+    for command in args.commands or DEFAULT_COMMANDS:
+        times, code, stderr = time_command(command.split(), args.runs, args.courses_dir)
+        ms = sorted(t * 1000 for t in times)
+        results.append({'command': command, 'exitCode': code, 'stderr': stderr,
+                        'medianMs': round(statistics.median(ms), 1),
+                        'minMs': round(ms[0], 1), 'maxMs': round(ms[-1], 1)})
+    over = [r for r in results if r['medianMs'] > args.budget_ms]
+    failed = [r for r in results if r['exitCode']]
+    if args.json:
+        json.dump({'budgetMs': args.budget_ms, 'runs': args.runs, 'results': results},
+                  sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print(f"명령별 시작~종료 시간 ({args.runs}회, 예산 {args.budget_ms:g}ms)")
+        for r in results:
+            mark = ('  초과' if r in over else '') + (f"  실패(종료 코드 {r['exitCode']})" if r['exitCode'] else '')
+            print(f"  {r['command']:<44} 중앙값 {r['medianMs']:>6.1f}ms  "
+                  f"(최소 {r['minMs']:.1f}, 최대 {r['maxMs']:.1f}){mark}")
+        for r in failed:
+            print(f"\n[실패] {r['command']} (종료 코드 {r['exitCode']})")
+            print(r['stderr'].rstrip() or '(stderr 없음)')
+    return 1 if over or failed else 0
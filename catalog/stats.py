@@ -0,0 +1,180 @@
+"""카탈로그 통계 (NumPy).
+
+과목 속성과 시간블록을 한 번 NumPy 배열로 옮긴 뒤, 요일x교시 분반 수 히트맵,
+이수구분별 학점 분포, 단과대학별 50분/75분 블록 사용량을 bincount/unique 로 집계한다.
+여러 학기 카탈로그를 한 번에 넘겨도 배열 길이만 늘어난다.
+
+numpy 는 이 모듈에서만 쓰므로 `python -m catalog stats` 를 실행할 때만 필요하다.
+"""
+import json
+import sys
+
+from .timeslots import DAYS, PERIOD_50MIN, PERIOD_75MIN, to_minutes
+
+# 히트맵 행: 50분제 교시 0~13
+PERIODS = sorted(PERIOD_50MIN, key=int)
+_75MIN_SPANS = {(to_minutes(s), to_minutes(e)) for s, e in PERIOD_75MIN.values()}
+BLOCK_KINDS = ('50분', '75분', '기타')
+
+
+class _Codes:
+    """문자열 -> 정수 코드 (사전 인코딩)"""
+
+    def __init__(self):
+        self.values = []
+        self._index = {}
+
+    def __call__(self, value):
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def base_category(category):
+    """'교필(문화)' -> '교필'"""
+    return category.split('(', 1)[0] or '(없음)'
+
+
+class CatalogArrays:
+    """분반 단위 배열과 블록 단위 배열"""
+
+    def __init__(self, tables):
+        import numpy as np
+
+        categories, colleges, semesters = _Codes(), _Codes(), _Codes()
+        sec_cat, sec_college, sec_credits, sec_semester = [], [], [], []
+        blk_sec, blk_day, blk_start, blk_end = [], [], [], []
+        day_index = {d: i for i, d in enumerate(DAYS)}
+        n = 0
+        for table in tables:
+            sem = semesters(getattr(table.table, 'semester', '') or '(현재)')
+            for r in table:
+                sec_cat.append(categories(base_category(r.category)))
+                sec_college.append(colleges(r.college or '(없음)'))
+                sec_credits.append(r.credits or 0)
+                sec_semester.append(sem)
+                if r.is_time_confirmed is not False:
+                    for b in r.time_blocks:
+                        blk_sec.append(n)
+                        blk_day.append(day_index[b.day])
+                        blk_start.append(to_minutes(b.start_time))
+                        blk_end.append(to_minutes(b.end_time))
+                n += 1
+
+        self.categories = categories.values
+        self.colleges = colleges.values
+        self.semesters = semesters.values
+        self.sec_category = np.array(sec_cat, dtype=np.int32)
+        self.sec_college = np.array(sec_college, dtype=np.int32)
+        self.sec_credits = np.array(sec_credits, dtype=np.int32)
+        self.sec_semester = np.array(sec_semester, dtype=np.int32)
+        self.blk_section = np.array(blk_sec, dtype=np.int64)
+        self.blk_day = np.array(blk_day, dtype=np.int64)
+        self.blk_start = np.array(blk_start, dtype=np.int32)
+        self.blk_end = np.array(blk_end, dtype=np.int32)
+
+    @property
+    def n_sections(self):
+        return len(self.sec_category)
+
+    def block_kind(self):
+        """블록별 0=50분, 1=75분(A~G 교시), 2=기타"""
+        import numpy as np
+
+        duration = self.blk_end - self.blk_start
+        is75 = np.zeros(len(duration), dtype=bool)
+        for s, e in _75MIN_SPANS:
+            is75 |= (self.blk_start == s) & (self.blk_end == e)
+        return np.where(duration == 50, 0, np.where(is75, 1, 2))
+
+
+def day_period_heatmap(arr):
+    """(요일 x 교시) 분반 수. 한 분반이 같은 칸에 여러 블록을 가져도 한 번만 센다."""
+    import numpy as np
+
+    p_start = np.array([to_minutes(PERIOD_50MIN[p][0]) for p in PERIODS])
+    p_end = np.array([to_minutes(PERIOD_50MIN[p][1]) for p in PERIODS])
+    hit = (arr.blk_start[:, None] < p_end[None, :]) & (arr.blk_end[:, None] > p_start[None, :])
+    b, p = np.nonzero(hit)
+    n_p = len(PERIODS)
+    keys = np.unique((arr.blk_section[b] * len(DAYS) + arr.blk_day[b]) * n_p + p)
+    cells = keys % (len(DAYS) * n_p)
+    return np.bincount(cells, minlength=len(DAYS) * n_p).reshape(len(DAYS), n_p)
+
+
+def credit_distribution(arr):
+    """(이수구분 x 학점) 분반 수. 열 i 는 i 학점"""
+    import numpy as np
+
+    width = int(arr.sec_credits.max()) + 1 if arr.n_sections else 1
+    flat = np.bincount(arr.sec_category * width + arr.sec_credits,
+                       minlength=len(arr.categories) * width)
+    return flat.reshape(len(arr.categories), width)
+
+
+def block_kind_by_college(arr):
+    """(단과대학 x [50분, 75분, 기타]) 블록 수"""
+    import numpy as np
+
+    k = len(BLOCK_KINDS)
+    college = arr.sec_college[arr.blk_section]
+    flat = np.bincount(college * k + arr.block_kind(), minlength=len(arr.colleges) * k)
+    return flat.reshape(len(arr.colleges), k)
+
+
+def report(tables):
+    """전체 통계를 dict 로 반환"""
+    import numpy as np
+
+    arr = CatalogArrays(tables)
+    heat = day_period_heatmap(arr)
+    credits = credit_distribution(arr)
+    kinds = block_kind_by_college(arr)
+    per_semester = np.bincount(arr.sec_semester, minlength=len(arr.semesters))
+    return {
+        'sections': arr.n_sections,
+        'semesters': {s: int(c) for s, c in zip(arr.semesters, per_semester)},
+        'dayPeriod': {d: {p: int(heat[i, j]) for j, p in enumerate(PERIODS)} for i, d in enumerate(DAYS)},
+        'creditsByCategory': {c: {str(k): int(v) for k, v in enumerate(credits[i]) if v}
+                              for i, c in enumerate(arr.categories)},
+        'blockKindsByCollege': {c: dict(zip(BLOCK_KINDS, map(int, kinds[i])))
+                                for i, c in enumerate(arr.colleges)},
+    }
+
+
+def print_report(data):
+    print(f"분반 수: {data['sections']}  " + ', '.join(f"{s}: {c}" for s, c in data['semesters'].items()))
+
+    print("\n[요일 x 교시 분반 수]")
+    print('교시 ' + ''.join(f"{d:>6}" for d in DAYS))
+    for p in PERIODS:
+        print(f"{p:>4} " + ''.join(f"{data['dayPeriod'][d][p]:>7}" for d in DAYS))
+
+    print("\n[이수구분별 학점 분포]")
+    for cat, dist in sorted(data['creditsByCategory'].items()):
+        print(f"  {cat:<10} " + ', '.join(f"{k}학점 {v}" for k, v in sorted(dist.items(), key=lambda kv: int(kv[0]))))
+
+    print("\n[단과대학별 블록 (50분 / 75분 / 기타)]")
+    for college, kinds in sorted(data['blockKindsByCollege'].items(), key=lambda kv: -sum(kv[1].values())):
+        print(f"  {college:<24} " + ' / '.join(f"{kinds[k]:>4}" for k in BLOCK_KINDS))
+
+
+def register(subparsers):
+    p = subparsers.add_parser('stats', help='카탈로그 통계 (numpy 필요)')
+    p.add_argument('extra_dirs', nargs='*', help='함께 집계할 다른 학기의 과목 데이터 폴더')
+    p.add_argument('--json', action='store_true', help='JSON 으로 출력')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    from .tsdata import dedupe_by_id, load_ts_courses
+
+    tables = [catalog] + [dedupe_by_id(load_ts_courses(d, semester=d)) for d in args.extra_dirs]
+    data = report(tables)
+    if args.json:
+        json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_report(data)
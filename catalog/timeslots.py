@@ -0,0 +1,187 @@
+"""강의시간 문자열/TimeBlock <-> 시간 슬롯 비트마스크.
+
+한 주를 5분 단위 슬롯으로 나누어 과목의 시간블록을 파이썬 int 비트마스크로 표현한다.
+50분제(숫자 교시)와 75분제(영문 교시)의 시작/종료 시각이 모두 5분 단위라서
+두 마스크의 AND 가 0 이 아니면 시간이 겹친다 (detectConflict.ts 의 blocksOverlap 과 같은 판정,
+정확히 인접한 블록은 충돌 아님).
+"""
+import os
+import re
+from functools import lru_cache
+
+from .records import make_block
+
+DAYS = '월화수목금토'
+DAY_INDEX = {d: i for i, d in enumerate(DAYS)}
+
+SLOT_MINUTES = 5
+DAY_START = 8 * 60      # 08:00
+DAY_END = 24 * 60       # 24:00
+SLOTS_PER_DAY = (DAY_END - DAY_START) // SLOT_MINUTES
+WEEK_SLOTS = SLOTS_PER_DAY * len(DAYS)
+
+TIME_MAP_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'constants', 'timeMap.ts')
+
+
+def _load_period_tables(path=TIME_MAP_PATH):
+    """src/constants/timeMap.ts 의 PERIOD_50MIN / PERIOD_75MIN 을 읽는다"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    tables = {}
+    for name in ('PERIOD_50MIN', 'PERIOD_75MIN'):
+        body = re.search(name + r"[^=]*=\s*\{(.*?)\n\}", text, re.DOTALL).group(1)
+        tables[name] = {k: (s, e) for k, s, e in re.findall(
+            r"(\w+):\s*\{\s*start:\s*'(\d\d:\d\d)',\s*end:\s*'(\d\d:\d\d)'", body)}
+    return tables['PERIOD_50MIN'], tables['PERIOD_75MIN']
+
+
+PERIOD_50MIN, PERIOD_75MIN = _load_period_tables()
+_LEADING_INT = re.compile(r'\s*([+-]?\d+)')
+
+
+def period_time(period):
+    """교시 식별자("3", "A" 등) -> (start, end). 모르는 교시는 None (getPeriodTime 과 동일)"""
+    upper = period.upper()
+    if upper in PERIOD_75MIN:
+        return PERIOD_75MIN[upper]
+    # parseInt 처럼 앞 공백과 부호를 건너뛰고 앞쪽 숫자만 읽는다 (' 1' -> 1, '1교시' -> 1)
+    m = _LEADING_INT.match(period)
+    if m and 0 <= int(m.group(1)) <= 13:
+        return PERIOD_50MIN.get(str(abs(int(m.group(1)))))
+    return None
+
+
+def _parse_part(part):
+    result = []
+    current_day = None
+    for token in (t.strip() for t in part.split(',')):
+        if not token:
+            continue
+        if token[0] in DAY_INDEX:
+            current_day = token[0]
+            if token[1:]:
+                result.append((current_day, token[1:]))
+        elif current_day:
+            result.append((current_day, token))
+    return result
+
+
+@lru_cache(maxsize=None)
+def parse_time_slots(time_str, room_str):
+    """parseTimeSlots.ts 와 같은 규칙으로 강의시간/강의실 문자열을 TimeBlock 튜플로 변환"""
+    trimmed = time_str.strip()
+    if not trimmed or trimmed in ('미정', '0'):
+        return ()
+    room_parts = room_str.split('/')
+    result = []
+    for i, part in enumerate(trimmed.split('/')):
+        part = part.strip()
+        if not part:
+            continue
+        if len(room_parts) > 1:
+            room = room_parts[i].strip() if i < len(room_parts) else ''
+        else:
+            room = room_parts[0].strip()
+        room = room or '미정'
+        for day, period in _parse_part(part):
+            span = period_time(period)
+            if span:
+                result.append(make_block(day, span[0], span[1], room, i))
+    return tuple(result)
+
+
+@lru_cache(maxsize=None)
+def to_minutes(hhmm):
+    h, m = hhmm.split(':')
+    return int(h) * 60 + int(m)
+
+
+def _slot(minutes):
+    return min(max(minutes - DAY_START, 0), DAY_END - DAY_START) // SLOT_MINUTES
+
+
+def range_mask(day, start, end):
+    """요일 하나의 [start, end) 분 구간 마스크"""
+    base = DAY_INDEX[day] * SLOTS_PER_DAY
+    lo, hi = _slot(start), -(-(min(end, DAY_END) - DAY_START) // SLOT_MINUTES)
+    if hi <= lo:
+        return 0
+    return ((1 << (hi - lo)) - 1) << (base + lo)
+
+
+def block_mask(block):
+    return _span_mask(block.day, block.start_time, block.end_time)
+
+
+@lru_cache(maxsize=None)
+def _span_mask(day, start_time, end_time):
+    """강의실/그룹이 달라도 같은 요일/시각이면 캐시를 같이 쓴다"""
+    return range_mask(day, to_minutes(start_time), to_minutes(end_time))
+
+
+@lru_cache(maxsize=None)
+def blocks_mask(blocks):
+    """TimeBlock 튜플 전체의 마스크 (같은 시간 패턴의 과목끼리 캐시 공유)"""
+    mask = 0
+    for b in blocks:
+        mask |= block_mask(b)
+    return mask
+
+
+def course_mask(record):
+    """시간 미확정 과목은 0 (detectConflict 와 같이 비교 대상에서 제외)"""
+    if record.is_time_confirmed is False:
+        return 0
+    return blocks_mask(record.time_blocks)
+
+
+def period_mask(day, first, last=None):
+    """'화' 3~5교시 같은 교시 구간의 마스크. first/last 는 '3', 'A' 등 교시 식별자"""
+    start = period_time(str(first))
+    end = period_time(str(last if last is not None else first))
+    if not start or not end:
+        raise ValueError(f"알 수 없는 교시: {first}-{last}")
+    return range_mask(day, to_minutes(start[0]), to_minutes(end[1]))
+
+
+def parse_period_query(text):
+    """'화3-5', '화A', '목6,7' 형태의 질의 문자열 -> 마스크"""
+    mask = 0
+    for day, periods in re.findall(r'([' + DAYS + r'])([0-9A-Ga-g,\-~]+)', text):
+        for chunk in periods.split(','):
+            if not chunk:
+                continue
+            first, _, last = chunk.replace('~', '-').partition('-')
+            mask |= period_mask(day, first, last or None)
+    if not mask:
+        raise ValueError(f"시간 질의를 해석할 수 없습니다: {text}")
+    return mask
+
+
+def mask_blocks(mask):
+    """마스크 -> [(요일, 'HH:MM', 'HH:MM')] 연속 구간 목록 (출력용)"""
+    result = []
+    for d, day in enumerate(DAYS):
+        bits = (mask >> (d * SLOTS_PER_DAY)) & ((1 << SLOTS_PER_DAY) - 1)
+        i = 0
+        while bits:
+            if bits & 1:
+                j = i
+                while bits & 1:
+                    bits >>= 1
+                    j += 1
+                result.append((day, _hhmm(DAY_START + i * SLOT_MINUTES), _hhmm(DAY_START + j * SLOT_MINUTES)))
+                i = j
+            else:
+                bits >>= 1
+                i += 1
+    return result
+
+
+def _hhmm(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def day_bits(mask, day):
+    """마스크에서 한 요일 부분만 잘라낸 SLOTS_PER_DAY 비트 정수"""
+    return (mask >> (DAY_INDEX[day] * SLOTS_PER_DAY)) & ((1 << SLOTS_PER_DAY) - 1)
@@ -0,0 +1,249 @@
+"""내보낸 저장 시간표(SavedTimetable) 일괄 분석.
+
+여러 사용자가 내보낸 시간표 JSON 파일 수천 개를 읽어
+  - 시간표에 복사된 과목을 현재 카탈로그와 id 로 맞춰 보고 (카탈로그에 없는 과목 집계)
+  - 저장 이후 시간이 바뀐 과목을 찾고
+  - 현재 카탈로그 시간 기준으로 시간표 안의 충돌을 다시 검사하고
+  - 분반별 수요(담은 시간표 수)를 모은다.
+
+파일은 작업 프로세스들이 하나씩 처리하고 작은 집계 결과만 돌려준다.
+각 프로세스는 카탈로그 요약(id -> 시간 서명, 마스크)만 들고 있고, 집계 키도 카탈로그 id 로 한정한다.
+카탈로그에 없는 과목(직접 추가한 강의 등)의 id 는 사용자마다 달라질 수 있으므로 MAX_MISSING_IDS 개까지만
+따로 세고 나머지는 합계로만, 그런 과목이 낀 충돌은 쌍 대신 건수로만 센다. 그래서 메모리는 시간표 수가 아니라
+카탈로그 크기 (+ MAX_MISSING_IDS) 에 비례한다.
+형식이 잘못된 시간표(객체가 아닌 항목, 요일이 없는 블록 등)는 그 시간표만 건너뛰고 오류로 기록한다.
+"""
+import json
+import os
+from collections import Counter
+from multiprocessing import Pool
+
+from .codeshare import SessionGroups
+from .records import make_block, normalize_id
+from .saved import read_saved_json
+from .timeslots import blocks_mask, course_mask
+from .tsdata import dedupe_by_id, load_ts_courses
+
+_catalog = None  # 작업 프로세스별 카탈로그 요약
+
+# 카탈로그에 없는 id 를 따로 세는 최대 개수 (넘는 id 는 missingOther 합계로만)
+MAX_MISSING_IDS = 1000
+# 파일 하나에서 기록하는 시간표 오류 수 (넘는 것은 개수만)
+MAX_ERRORS_PER_FILE = 5
+
+
+def _time_signature(blocks):
+    """(요일, 시작, 끝) 튜플 — 강의실/그룹 변경은 시간 변경으로 보지 않는다"""
+    return tuple(sorted((b[0], b[1], b[2]) for b in blocks))
+
+
+def catalog_summary(records):
+    """id -> (시간 서명, 마스크). 정규화 id('11967-01')로도 찾을 수 있게 같이 넣는다"""
+    summary = {}
+    for r in records:
+        entry = (_time_signature(r.time_blocks), course_mask(r))
+        summary.setdefault(r.id, entry)
+        summary.setdefault(normalize_id(r.id), entry)
+    return summary
+
+
+def _init_worker(courses_dir):
+    global _catalog
+    _catalog = catalog_summary(dedupe_by_id(load_ts_courses(courses_dir)))
+
+
+def count_capped(counter, keys, limit):
+    """counter 에 keys 를 세되 서로 다른 키는 limit 개까지만. 세지 못한 건수를 돌려준다"""
+    overflow = 0
+    for key in keys:
+        if key in counter or len(counter) < limit:
+            counter[key] += 1
+        else:
+            overflow += 1
+    return overflow
+
+
+def analyze_timetable(obj, catalog):
+    """시간표 하나 -> (담은 id, 카탈로그에 없는 id, 시간이 바뀐 id, 충돌 id 쌍).
+
+    충돌 쌍은 두 과목이 모두 카탈로그에 있으면 (id, id), 아니면 None.
+    형식이 잘못되면 AttributeError/TypeError/KeyError/ValueError 가 난다 (analyze_file 이 기록).
+    """
+    ids, missing, changed, masks = [], [], [], []
+    for sc in obj.get('selectedCourses') or ():
+        course = sc.get('course') or {}
+        cid = course.get('id', '')
+        blocks = [(b.get('day', ''), b.get('startTime', ''), b.get('endTime', ''))
+                  for b in course.get('timeBlocks') or ()]
+        entry = catalog.get(cid)
+        if entry is None:
+            missing.append(cid)
+            if course.get('isTimeConfirmed') is False:
+                continue
+            mask = blocks_mask(tuple(make_block(d, s, e, '', 0) for d, s, e in blocks))
+        else:
+            ids.append(cid)
+            if entry[0] != _time_signature(blocks):
+                changed.append(cid)
+            mask = entry[1]
+        if mask:
+            masks.append((cid, mask))
+    known = set(ids)
+    conflicts = [(a, b) if a in known and b in known else None
+                 for i, (a, ma) in enumerate(masks) for b, mb in masks[i + 1:] if ma & mb]
+    return ids, missing, changed, conflicts
+
+
+def analyze_file(path, catalog=None):
+    """파일 하나의 집계 결과. 작업 프로세스에서 호출되며 작은 dict 만 돌려준다"""
+    catalog = catalog if catalog is not None else _catalog
+    result = {'path': path, 'timetables': 0, 'demand': Counter(), 'missing': Counter(), 'missingOther': 0,
+              'changed': Counter(), 'conflicts': Counter(), 'otherConflicts': 0, 'flagged': [],
+              'error': None, 'errors': [], 'badTimetables': 0}
+    try:
+        timetables = read_saved_json(path)
+    except (OSError, ValueError) as e:
+        result['error'] = str(e)
+        return result
+    if not isinstance(timetables, list):
+        result['error'] = f"시간표 배열이나 객체가 아닙니다 ({type(timetables).__name__})"
+        return result
+    for n, obj in enumerate(timetables):
+        try:
+            ids, missing, changed, conflicts = analyze_timetable(obj, catalog)
+        except (AttributeError, TypeError, KeyError, ValueError) as e:
+            # 시간표 하나가 잘못되어도 파일의 나머지와 다른 파일은 계속 처리한다
+            result['badTimetables'] += 1
+            if len(result['errors']) < MAX_ERRORS_PER_FILE:
+                result['errors'].append(f"{n}번째 시간표: {type(e).__name__}: {e}")
+            continue
+        result['timetables'] += 1
+        result['demand'].update(ids)
+        result['missingOther'] += count_capped(result['missing'], missing, MAX_MISSING_IDS)
+        result['changed'].update(changed)
+        pairs = [pair for pair in conflicts if pair is not None]
+        result['conflicts'].update(pairs)
+        result['otherConflicts'] += len(conflicts) - len(pairs)
+        if changed or conflicts:
+            result['flagged'].append({'path': path, 'id': obj.get('id', ''), 'name': obj.get('name', ''),
+                                      'timeChanged': changed, 'conflicts': pairs})
+    return result
+
+
+def iter_json_files(paths):
+    """파일/폴더 목록에서 *.json 경로를 차례로 내보낸다 (폴더는 하위까지)"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith('.json'):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def analyze_files(paths, courses_dir, workers=None, flagged_out=None):
+    """여러 파일을 작업 프로세스로 나눠 처리하고 집계를 합친다.
+
+    flagged_out 이 있으면 시간 변경/충돌이 있는 시간표를 JSON Lines 로 바로 써서
+    목록을 메모리에 쌓지 않는다.
+    """
+    totals = {'files': 0, 'timetables': 0, 'errors': [], 'badTimetables': 0, 'flagged': 0,
+              'demand': Counter(), 'missing': Counter(), 'missingOther': 0, 'changed': Counter(),
+              'conflicts': Counter(), 'otherConflicts': 0}
+    files = iter_json_files(paths)
+    if workers == 1:
+        _init_worker(courses_dir)
+        results = map(analyze_file, files)
+        pool = None
+    else:
+        pool = Pool(workers, initializer=_init_worker, initargs=(courses_dir,))
+        results = pool.imap_unordered(analyze_file, files, chunksize=16)
+    try:
+        for res in results:
+            totals['files'] += 1
+            if res['error']:
+                totals['errors'].append((res['path'], res['error']))
+                continue
+            totals['timetables'] += res['timetables']
+            totals['badTimetables'] += res['badTimetables']
+            totals['errors'].extend((res['path'], error) for error in res['errors'])
+            for key in ('demand', 'changed', 'conflicts'):
+                totals[key].update(res[key])
+            for key in ('missingOther', 'otherConflicts'):
+                totals[key] += res[key]
+            for cid, n in res['missing'].items():
+                if cid in totals['missing'] or len(totals['missing']) < MAX_MISSING_IDS:
+                    totals['missing'][cid] += n
+                else:
+                    totals['missingOther'] += n
+            totals['flagged'] += len(res['flagged'])
+            if flagged_out is not None:
+                for item in res['flagged']:
+                    flagged_out.write(json.dumps(item, ensure_ascii=False) + '\n')
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return totals
+
+
+def ranked(counter, n=None):
+    """빈도 내림차순, 같은 빈도는 키 순 (작업 프로세스 완료 순서와 무관한 출력)"""
+    items = sorted(counter.items(), key=lambda kv: (-kv[1], kv[0]))
+    return items if n is None else items[:n]
+
+
+def register(subparsers):
+    p = subparsers.add_parser('timetables', help='내보낸 저장 시간표 일괄 분석 (수요/시간 변경/충돌)')
+    p.add_argument('paths', nargs='+', help='시간표 JSON 파일 또는 폴더')
+    p.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (기본: CPU 수, 1 이면 단일 프로세스)')
+    p.add_argument('--flagged', help='시간 변경/충돌이 있는 시간표를 JSON Lines 로 저장할 파일')
+    p.add_argument('--top', type=int, default=20)
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    flagged_out = open(args.flagged, 'w', encoding='utf-8') if args.flagged else None
+    try:
+        totals = analyze_files(args.paths, args.courses_dir, args.workers, flagged_out)
+    finally:
+        if flagged_out is not None:
+            flagged_out.close()
+
+    by_id = catalog.by_id()
+    print(f"파일 {totals['files']}개, 시간표 {totals['timetables']}개, "
+          f"담긴 분반 {sum(totals['demand'].values())}건 ({len(totals['demand'])}개 분반)")
+    print(f"시간 변경/충돌이 있는 시간표: {totals['flagged']}개")
+    if totals['badTimetables']:
+        print(f"형식이 잘못되어 건너뛴 시간표: {totals['badTimetables']}개")
+    for path, error in totals['errors']:
+        print(f"  [오류] {path}: {error}")
+
+    print(f"\n[수요 상위 {args.top}개 분반]")
+    for cid, n in ranked(totals['demand'], args.top):
+        r = by_id.get(cid)
+        capacity = f" / 정원 {r.capacity}" if r is not None and r.capacity else ''
+        print(f"  {cid:<10} {r.name if r is not None else '':<20} {n}개 시간표{capacity}")
+    sessions = SessionGroups.build(catalog)
+    shared = [(key, n) for key, n in ranked(sessions.fold(totals['demand'])) if key in sessions.group_of]
+    if shared:
+        print("\n[같은 물리 수업(코드쉐어) 분반 합산 수요]")
+        for key, n in shared[:args.top]:
+            print(f"  {' / '.join(sessions.groups[sessions.group_of[key]])}  {n}개 시간표")
+    if totals['changed']:
+        print("\n[저장 이후 시간이 바뀐 분반]")
+        for cid, n in ranked(totals['changed']):
+            r = by_id.get(cid)
+            print(f"  {cid:<10} {r.time_raw if r is not None else '':<16} {n}개 시간표")
+    if totals['missing']:
+        other = f" (id 를 세지 않은 {totals['missingOther']}건 별도)" if totals['missingOther'] else ''
+        print(f"\n[카탈로그에 없는 과목] {len(totals['missing'])}개 id, {sum(totals['missing'].values())}건{other}")
+        for cid, n in ranked(totals['missing'], args.top):
+            print(f"  {cid:<14} {n}개 시간표")
+    if totals['conflicts'] or totals['otherConflicts']:
+        print(f"\n[현재 시간 기준 충돌 쌍 상위 {args.top}개] "
+              f"(카탈로그에 없는 과목이 낀 충돌 {totals['otherConflicts']}건은 쌍으로 세지 않음)")
+        for (a, b), n in ranked(totals['conflicts'], args.top):
+            print(f"  {a} x {b}  {n}개 시간표")
@@ -0,0 +1,210 @@
+"""src/data/courses/*.ts 의 Course 리터럴 파서.
+
+정규식으로 필드를 하나씩 찾는 대신, 배열 리터럴을 토큰 단위로 읽어
+각 객체를 CourseRecord 로 만든다. 한 줄에 여러 필드가 있는 core.ts 형식과
+작은따옴표/큰따옴표가 섞인 online.ts 형식을 모두 처리한다.
+"""
+import os
+import pickle
+import re
+from array import array
+
+from .records import CourseRecord, CourseTable, CourseView, make_block
+
+COURSES_DIR = os.path.join('src', 'data', 'courses')
+
+# 파싱 결과 캐시 (TS 폴더 안, .gitignore 대상). 파일별 (mtime, 크기) 가 같으면 다시 파싱하지 않는다.
+# CourseRecord 필드나 지문 계산이 바뀌면 CACHE_VERSION 과 함께 캐시가 무효가 된다.
+CACHE_NAME = '.catalog-cache.pickle'
+CACHE_VERSION = (2, CourseRecord.__slots__)
+
+# src/data/courses/index.ts 의 병합 순서 (앞쪽 파일 우선)
+TS_FILES = ['core.ts', 'electives.ts', 'major_required.ts', 'major_elective.ts',
+            'semester.ts', 'normal_electives.ts', 'teaching.ts', 'online.ts']
+
+_TOKEN = re.compile(r"""
+    \s+ | //[^\n]*
+  | (?P<str>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<num>-?\d+(?:\.\d+)?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}\[\]:,])
+""", re.VERBOSE)
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', "'": "'", '"': '"'}
+_ESCAPE = re.compile(r'\\(.)')
+_ARRAY_START = re.compile(r"export\s+const\s+\w+\s*:\s*Course\[\]\s*=\s*\[")
+
+
+class TsParseError(ValueError):
+    pass
+
+
+def _unquote(s):
+    body = s[1:-1]
+    if '\\' in body:
+        body = _ESCAPE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), body)
+    return body
+
+
+def _tokens(text, pos):
+    for m in _TOKEN.finditer(text, pos):
+        kind = m.lastgroup
+        if kind is None:
+            continue
+        yield kind, m.group(kind), m.start()
+
+
+def _parse_value(tok, kind, value):
+    if kind == 'punct':
+        if value == '{':
+            return _parse_object(tok)
+        if value == '[':
+            return _parse_array(tok)
+        raise TsParseError(f"unexpected '{value}'")
+    if kind == 'str':
+        return _unquote(value)
+    if kind == 'num':
+        return float(value) if '.' in value else int(value)
+    if value == 'true':
+        return True
+    if value == 'false':
+        return False
+    if value in ('null', 'undefined'):
+        return None
+    raise TsParseError(f"unexpected identifier '{value}'")
+
+
+def _parse_array(tok):
+    items = []
+    for kind, value, _ in tok:
+        if value == ']' and kind == 'punct':
+            return items
+        if value == ',' and kind == 'punct':
+            continue
+        items.append(_parse_value(tok, kind, value))
+    raise TsParseError("unterminated array")
+
+
+def _parse_object(tok):
+    obj = {}
+    for kind, value, _ in tok:
+        if kind == 'punct':
+            if value == '}':
+                return obj
+            if value == ',':
+                continue
+            raise TsParseError(f"unexpected '{value}' in object")
+        key = _unquote(value) if kind == 'str' else value
+        kind, value, _ = next(tok)
+        if value != ':':
+            raise TsParseError(f"expected ':' after {key}")
+        kind, value, _ = next(tok)
+        obj[key] = _parse_value(tok, kind, value)
+    raise TsParseError("unterminated object")
+
+
+def parse_ts_literals(text):
+    """TS 파일 본문에서 `export const X: Course[] = [...]` 의 객체 리스트를 반환"""
+    m = _ARRAY_START.search(text)
+    if not m:
+        raise TsParseError("Course[] 배열을 찾을 수 없습니다")
+    return _parse_array(_tokens(text, m.end()))
+
+
+def parse_ts_const(text, name):
+    """TS 본문에서 `export const name ... = [...]` 배열 리터럴을 읽는다 (타입 표기는 무엇이든)"""
+    m = re.search(r"export\s+const\s+" + re.escape(name) + r"\b[^=]*=\s*\[", text)
+    if not m:
+        raise TsParseError(f"{name} 배열을 찾을 수 없습니다")
+    return _parse_array(_tokens(text, m.end()))
+
+
+def record_from_literal(obj, source=''):
+    """Course 리터럴(dict) -> CourseRecord"""
+    blocks = [make_block(b.get('day', ''), b.get('startTime', ''), b.get('endTime', ''),
+                         b.get('room', ''), b.get('group', 0))
+              for b in obj.get('timeBlocks') or ()]
+    return CourseRecord(
+        obj.get('id', ''), code=obj.get('code', ''), section=obj.get('section', ''),
+        name=obj.get('name', ''), college=obj.get('college', ''),
+        department=obj.get('department', ''), major=obj.get('major', ''),
+        year=obj.get('year', ''), category=obj.get('category', ''),
+        credit_detail=obj.get('creditDetail', ''), professors=obj.get('professors') or (),
+        time_raw=obj.get('timeRaw', ''), room_raw=obj.get('roomRaw', ''),
+        note=obj.get('note', ''), source=source, credits=obj.get('credits'),
+        time_blocks=blocks, is_time_confirmed=obj.get('isTimeConfirmed'),
+        is_code_share=obj.get('isCodeShare'), is_microdegree=obj.get('isMicrodegree'),
+        microdegree_names=obj.get('microdegreeNames') or (),
+        capacity=obj.get('capacity'), organizer=obj.get('organizer'),
+        partner_university=obj.get('partnerUniversity'),
+    )
+
+
+def parse_ts_file(path):
+    """TS 파일 하나를 CourseRecord 리스트로 변환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    source = os.path.basename(path)
+    return [record_from_literal(obj, source) for obj in parse_ts_literals(text)]
+
+
+def _file_key(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_cache(path):
+    try:
+        with open(path, 'rb') as f:
+            version, entries = pickle.load(f)
+    except (OSError, EOFError, ValueError, TypeError, AttributeError, pickle.UnpicklingError):
+        return {}
+    return entries if version == CACHE_VERSION else {}
+
+
+def _write_cache(path, entries):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            pickle.dump((CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def load_ts_courses(courses_dir=COURSES_DIR, files=TS_FILES, semester='', use_cache=True):
+    """TS 파일 전체를 하나의 CourseTable 로 읽는다 (파일별 부분은 table.by_source()).
+
+    use_cache 이면 courses_dir/.catalog-cache.pickle 에서 바뀌지 않은 파일의 레코드를 읽고,
+    바뀐 파일만 다시 파싱해 캐시를 갱신한다.
+    """
+    cache_path = os.path.join(courses_dir, CACHE_NAME)
+    cached = _read_cache(cache_path) if use_cache else {}
+    entries = {}
+    table = CourseTable(semester=semester)
+    for name in files:
+        path = os.path.join(courses_dir, name)
+        if not os.path.exists(path):
+            continue
+        key = _file_key(path)
+        hit = cached.get(name)
+        records = hit[1] if hit is not None and hit[0] == key else parse_ts_file(path)
+        entries[name] = (key, records)
+        table.extend(records)
+    if use_cache and any(cached.get(name, (None,))[0] != entry[0] for name, entry in entries.items()):
+        _write_cache(cache_path, {**cached, **entries})
+    return table
+
+
+def dedupe_by_id(table):
+    """index.ts 와 같이 id 기준 중복 제거 (앞쪽 우선) 한 뷰"""
+    seen = set()
+    keep = array('I')
+    for i, r in enumerate(table.records):
+        if r.id not in seen:
+            seen.add(r.id)
+            keep.append(i)
+    return CourseView(table, keep)
@@ -0,0 +1,274 @@
+"""엑셀/TS 비교 감시 모드.
+
+compare_all.py 와 같은 비교(시트 부분집합 <-> TS 파일)를 한 번 계산해 메모리에 두고,
+src/data/courses/*.ts 와 엑셀(xlsx 또는 excel_data.json)을 주기적으로 확인한다.
+바뀐 파일만 다시 파싱하고, 지문이 달라졌거나 새로 생기거나 사라진 id 만 다시 비교한다.
+--online 으로 원격강좌 목록을 주면 목록 <-> online.ts 비교도 같은 방식으로 유지한다 (online.py).
+
+표준 라이브러리만 쓰기 위해 inotify 대신 mtime/크기 폴링을 쓴다 (기본 0.5초).
+저장 도중의 파일(문법이 깨진 TS, 덜 써진 xlsx)은 오류를 출력하고 마지막으로 읽은 상태를 유지하며,
+파일이 다시 바뀌면 그때 다시 읽는다.
+
+코드쉐어/마이크로디그리처럼 TS 전체와 비교하는 항목은 그 시트에 없는 TS 과목이 전부 '추가'가
+되므로 추가는 세지 않고 누락과 차이만 본다.
+"""
+import os
+import time
+
+from .diff import diff_by_fingerprint
+from .online import ONLINE_FILE, ONLINE_SHEET, load_online
+from .records import normalize_id
+from .sheets import SHEET_NAMES, load_sheets, read_workbook_rows
+from .snapshot import Snapshot
+from .tsdata import TS_FILES, parse_ts_file
+
+# TS 파일을 직접 파싱해 들고 있으므로 __main__ 의 카탈로그가 필요 없다
+NEEDS_CATALOG = False
+
+# (이름, 시트, 시트 행 조건, TS 파일 — None 이면 TS 전체, 추가는 세지 않음) : compare_all.py 와 같은 구성
+COMPARISONS = [
+    ('교필', '교필', None, 'core.ts'),
+    ('교선-일반', '교선', lambda r: '교직' not in r.category, 'electives.ts'),
+    ('교선-교직', '교선', lambda r: '교직' in r.category, 'teaching.ts'),
+    ('전필', '전공', lambda r: r.category == '전필', 'major_required.ts'),
+    ('전선', '전공', lambda r: r.category == '전선', 'major_elective.ts'),
+    ('학기', '전공', lambda r: r.category == '학기', 'semester.ts'),
+    ('코드쉐어', '코드쉐어', None, None),
+    ('마이크로디그리', '마이크로디그리', None, None),
+]
+# 원격강좌 목록을 줄 때만 (online.py)
+ONLINE_COMPARISONS = [('온라인', ONLINE_SHEET, None, ONLINE_FILE)]
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def read_excel(path):
+    """xlsx 또는 excel_data.json -> 시트명 -> CourseTable"""
+    if path.endswith('.json'):
+        with Snapshot(path) as snap:
+            return load_sheets(snap)
+    return load_sheets(read_workbook_rows(path, SHEET_NAMES))
+
+
+class _Comparison:
+    """비교 하나의 현재 결과 (id 단위로 갱신)"""
+
+    def __init__(self, name, sheet, predicate, ts_file):
+        self.name = name
+        self.sheet = sheet
+        self.predicate = predicate
+        self.ts_file = ts_file
+        # TS 전체와 비교하면 시트에 없는 TS 과목이 모두 '추가'가 되므로 의미가 없다
+        self.counts_extra = ts_file is not None
+        self.missing = set()
+        self.extra = set()
+        self.diffs = {}
+
+    def excel_by_id(self, sheets):
+        result = {}
+        for r in sheets.get(self.sheet, ()):
+            if self.predicate is None or self.predicate(r):
+                result.setdefault(r.id, r)
+        return result
+
+    def update(self, excel_by_id, src_by_id, ids=None):
+        """ids 만 다시 비교해 결과에 반영 (None 이면 전체). 바뀐 id 목록을 반환"""
+        before = {cid: self._state(cid) for cid in ids} if ids is not None else None
+        if ids is None:
+            self.missing, self.extra, self.diffs = set(), set(), {}
+        else:
+            for cid in ids:
+                self.missing.discard(cid)
+                self.extra.discard(cid)
+                self.diffs.pop(cid, None)
+        fingerprints = {cid: r.fingerprint for cid, r in excel_by_id.items()}
+        result = diff_by_fingerprint(fingerprints, src_by_id, excel_by_id.__getitem__, ids)
+        self.missing |= result.missing
+        if self.counts_extra:
+            self.extra |= result.extra
+        self.diffs.update(result.diffs)
+        if before is None:
+            return []
+        return [cid for cid in sorted(ids) if self._state(cid) != before[cid]]
+
+    def _state(self, cid):
+        if cid in self.missing:
+            return ('누락',)
+        if cid in self.extra:
+            return ('추가',)
+        if cid in self.diffs:
+            return ('차이', tuple(self.diffs[cid]))
+        return None
+
+    def describe(self, cid):
+        state = self._state(cid)
+        if state is None:
+            return f"{cid}: 일치"
+        if state[0] == '차이':
+            return f"{cid}: {', '.join(state[1])}"
+        return f"{cid}: {state[0]}"
+
+    def summary(self):
+        if not self.counts_extra:
+            return f"누락 {len(self.missing)}, 차이 {len(self.diffs)} (TS 전체와 비교, 추가는 세지 않음)"
+        return f"누락 {len(self.missing)}, 추가 {len(self.extra)}, 차이 {len(self.diffs)}"
+
+
+class WatchState:
+    """파싱한 엑셀 시트와 TS 파일별 레코드, 비교 결과를 메모리에 유지"""
+
+    def __init__(self, excel_path, courses_dir, ts=None, online_path=None):
+        """ts 를 주면 (TS 파일명 -> 레코드 목록, 예: load_ts_courses(..).by_source()) 파싱하지 않고 쓴다.
+
+        online_path(원격강좌 목록 CSV/xlsx) 를 주면 '온라인' 비교(목록 <-> online.ts)도 함께 한다.
+        """
+        self.excel_path = excel_path
+        self.online_path = online_path
+        self.courses_dir = courses_dir
+        self.ts_paths = {name: os.path.join(courses_dir, name) for name in TS_FILES}
+        self.stats = {}
+        self.sheets = self._read_sheets()
+        for path in self._sheet_paths():
+            self.stats[path] = _stat(path)
+        self.ts = {}
+        for name, path in self.ts_paths.items():
+            if ts is not None:
+                self.ts[name] = list(ts.get(name, ()))
+            else:
+                self.ts[name] = parse_ts_file(path) if os.path.exists(path) else []
+            self.stats[path] = _stat(path)
+        comparisons = COMPARISONS + (ONLINE_COMPARISONS if online_path else [])
+        self.comparisons = [_Comparison(*c) for c in comparisons]
+        self._excel = {c.name: c.excel_by_id(self.sheets) for c in self.comparisons}
+        self._src = {}
+        for c in self.comparisons:
+            c.update(self._excel[c.name], self._src_by_id(c.ts_file))
+
+    def _sheet_paths(self):
+        return [self.excel_path] + ([self.online_path] if self.online_path else [])
+
+    def _read_sheets(self):
+        """엑셀 시트 + (있으면) 원격강좌 목록을 ONLINE_SHEET 시트로"""
+        sheets = read_excel(self.excel_path)
+        if self.online_path:
+            sheets[ONLINE_SHEET], _ = load_online(self.online_path)
+        return sheets
+
+    def _src_by_id(self, ts_file):
+        """정규화 id -> TS 레코드. TS 전체일 때는 TS_FILES 순서로 앞쪽 우선 (index.ts 와 같음)"""
+        by_id = self._src.get(ts_file)
+        if by_id is None:
+            by_id = {}
+            for name in ([ts_file] if ts_file else TS_FILES):
+                for r in self.ts.get(name, ()):
+                    by_id.setdefault(normalize_id(r.id), r)
+            self._src[ts_file] = by_id
+        return by_id
+
+    def changed_files(self):
+        changed = []
+        for path in self._sheet_paths() + list(self.ts_paths.values()):
+            st = _stat(path)
+            if st != self.stats.get(path):
+                self.stats[path] = st
+                changed.append(path)
+        return changed
+
+    def reload_ts(self, name):
+        """TS 파일 하나를 다시 파싱하고 영향 받은 비교를 갱신. (비교 이름, 바뀐 id 목록) 반환"""
+        path = self.ts_paths[name]
+        records = parse_ts_file(path) if os.path.exists(path) else []
+        old = {normalize_id(r.id): r.fingerprint for r in self.ts[name]}
+        new = {normalize_id(r.id): r.fingerprint for r in records}
+        ids = {cid for cid in old.keys() | new.keys() if old.get(cid) != new.get(cid)}
+        self.ts[name] = records
+        self._src.pop(name, None)
+        self._src.pop(None, None)
+        return self._update([c for c in self.comparisons if c.ts_file in (name, None)], ids)
+
+    def reload_excel(self):
+        self.sheets = self._read_sheets()
+        affected = []
+        ids = set()
+        for c in self.comparisons:
+            excel_by_id = c.excel_by_id(self.sheets)
+            old = self._excel[c.name]
+            changed = {cid for cid in old.keys() | excel_by_id.keys()
+                       if (old[cid].fingerprint if cid in old else None)
+                       != (excel_by_id[cid].fingerprint if cid in excel_by_id else None)}
+            self._excel[c.name] = excel_by_id
+            if changed:
+                affected.append(c)
+                ids |= changed
+        return self._update(affected, ids)
+
+    def _update(self, comparisons, ids):
+        results = []
+        for c in comparisons:
+            changed = c.update(self._excel[c.name], self._src_by_id(c.ts_file), ids)
+            results.append((c, changed))
+        return results
+
+    def poll(self):
+        """바뀐 파일을 처리하고 [(파일, [(비교, 바뀐 id 목록)], 오류 또는 None)] 반환.
+
+        읽지 못한 파일은 오류만 돌려주고 이전 상태를 그대로 둔다. mtime 은 이미 기록했으므로
+        같은 내용으로 계속 실패하지 않고, 파일이 다시 저장되면 다시 읽는다.
+        """
+        events = []
+        for path in self.changed_files():
+            try:
+                if path in (self.excel_path, self.online_path):
+                    results = self.reload_excel()
+                else:
+                    results = self.reload_ts(os.path.basename(path))
+            except Exception as e:  # 저장 도중의 파일 (TsParseError, BadZipFile, KeyError 등)
+                events.append((path, [], f"{type(e).__name__}: {e}"))
+            else:
+                events.append((path, results, None))
+        return events
+
+
+def print_summary(state):
+    for c in state.comparisons:
+        print(f"  {c.name:<10} {c.summary()}")
+
+
+def register(subparsers):
+    p = subparsers.add_parser('watch', help='엑셀/TS 파일 변경을 감시하며 바뀐 과목만 다시 비교')
+    p.add_argument('--excel', default='excel_data.json', help='수강편람 xlsx 또는 excel_data.json')
+    p.add_argument('--online', help='원격강좌 목록 (CSV/xlsx). 주면 online.ts 와도 비교')
+    p.add_argument('--interval', type=float, default=0.5, help='확인 간격 (초)')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    started = time.perf_counter()
+    state = WatchState(args.excel, args.courses_dir, online_path=args.online)
+    print(f"[감시 시작] {args.excel}, {args.courses_dir} ({time.perf_counter() - started:.2f}초)")
+    print_summary(state)
+    try:
+        while True:
+            time.sleep(args.interval)
+            started = time.perf_counter()
+            events = state.poll()
+            if not events:
+                continue
+            elapsed = time.perf_counter() - started
+            for path, results, error in events:
+                if error:
+                    print(f"\n[읽기 실패] {path}: {error} (이전 상태 유지, 다시 저장되면 재시도)")
+                    continue
+                print(f"\n[변경] {path} ({elapsed * 1000:.0f}ms)")
+                for c, ids in results:
+                    for cid in ids:
+                        print(f"  {c.name:<10} {c.describe(cid)}")
+            print_summary(state)
+    except KeyboardInterrupt:
+        return 0
@@ -0,0 +1,362 @@
+"""openpyxl 없이 xlsx 를 zip/XML 로 바로 읽는 스트리밍 리더.
+
+openpyxl 은 read_only 모드에서도 셀 객체를 만들고 모든 값을 형 변환한다. 수강편람 시트는
+문자열 셀만 필요하므로, xlsx(zip) 안의 sharedStrings.xml 과 시트 XML 을 iterparse 로
+일정한 크기로 나눠 파서에 넣고, 끝난 행만 문자열 리스트로 내보낸다 (요소 트리는 만들지 않음).
+시트 크기와 관계없이 메모리에는 공유 문자열 표와 읽는 중인 조각의 행들만 남는다.
+
+결과는 read_workbook_rows(openpyxl, data_only=True, read_only=True) 와 같게 맞춘다.
+  - 행 길이와 행 수는 <dimension> 기준 (빈 행/빈 셀은 '' 로 채우고, 범위 밖 셀은 버림)
+  - 숫자는 int/float 로 바꾼 뒤 str ('3', '3.0'), 불리언은 'True'/'False'
+  - 날짜 서식 숫자는 datetime/time/timedelta 로 바꾼 뒤 str
+columns 로 필요한 열 위치만 주면 나머지 셀은 값을 읽지 않고 '' 로 둔다. 열 위치가 헤더에 달려 있으면
+집합 대신 함수를 준다: 앞쪽 HEADER_SCAN_ROWS 행은 모든 열을 읽고, 그 행들로 함수를 불러 나머지 행의 열을 정한다.
+`python -m catalog xlsx check 파일.xlsx` 로 openpyxl 결과와 대조하고 속도를 비교한다.
+"""
+import datetime
+import re
+import time
+import zipfile
+from xml.etree.ElementTree import XMLParser, iterparse
+
+from .schema import HEADER_SCAN_ROWS
+
+MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+_ROW, _CELL, _VALUE = MAIN_NS + 'row', MAIN_NS + 'c', MAIN_NS + 'v'
+_SI, _T, _R, _IS = MAIN_NS + 'si', MAIN_NS + 't', MAIN_NS + 'r', MAIN_NS + 'is'
+_DIMENSION, _RPH = MAIN_NS + 'dimension', MAIN_NS + 'rPh'
+
+WINDOWS_EPOCH = datetime.datetime(1899, 12, 30)
+# 서식 코드 판정은 openpyxl.styles.numbers 의 is_date_format / is_timedelta_format 과 같은 규칙
+_FORMAT_LITERALS = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+_DATE_TOKENS = re.compile(r'(?<![_\\])[dmhysDMHYS]')
+_TIMEDELTA = re.compile(r'\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?', re.I)
+# 내장 서식 중 날짜/시간 판정에 필요한 것의 코드
+BUILTIN_FORMAT_CODES = {14: 'mm-dd-yy', 15: 'd-mmm-yy', 16: 'd-mmm', 17: 'mmm-yy', 18: 'h:mm AM/PM',
+                        19: 'h:mm:ss AM/PM', 20: 'h:mm', 21: 'h:mm:ss', 22: 'm/d/yy h:mm',
+                        45: 'mm:ss', 46: '[h]:mm:ss', 47: 'mmss.0'}
+
+
+_column_numbers = {}
+
+
+def column_index(ref):
+    """'AB12' -> 28 (1부터). 열 문자 -> 번호는 한 번만 계산한다"""
+    letters = ref.rstrip('0123456789')
+    n = _column_numbers.get(letters)
+    if n is None:
+        n = 0
+        for ch in letters:
+            n = n * 26 + ord(ch) - 64
+        _column_numbers[letters] = n
+    return n
+
+
+def _dimension_bounds(ref):
+    """'A1:M500' -> (최대 열, 최대 행). 'A1' 한 칸이어도 된다"""
+    last = ref.split(':')[-1]
+    digits = last.lstrip('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+    return column_index(last), int(digits)
+
+
+def _text(si):
+    """<si>/<is> 의 글자 (서식 run 포함, 윗주 rPh 제외)"""
+    parts = []
+    for child in si:
+        if child.tag == _T:
+            parts.append(child.text or '')
+        elif child.tag == _R:
+            t = child.find(_T)
+            if t is not None:
+                parts.append(t.text or '')
+    return ''.join(parts)
+
+
+def read_shared_strings(zf):
+    """sharedStrings.xml -> 문자열 목록"""
+    try:
+        source = zf.open('xl/sharedStrings.xml')
+    except KeyError:
+        return []
+    strings = []
+    with source:
+        for _, el in iterparse(source):
+            if el.tag == _SI:
+                strings.append(_text(el).replace('x005F_', ''))
+                el.clear()
+    return strings
+
+
+def _is_date_format(code):
+    return _DATE_TOKENS.search(_FORMAT_LITERALS.sub('', code.split(';')[0])) is not None
+
+
+def read_date_styles(zf):
+    """셀 스타일 번호 -> 'date' 또는 'timedelta' (styles.xml 의 cellXfs 순서, 날짜 서식만)"""
+    try:
+        source = zf.open('xl/styles.xml')
+    except KeyError:
+        return {}
+    custom = {}
+    styles = []
+    with source:
+        for _, el in iterparse(source):
+            if el.tag == MAIN_NS + 'numFmt':
+                custom[int(el.get('numFmtId'))] = el.get('formatCode', '')
+            elif el.tag == MAIN_NS + 'cellXfs':
+                styles = [int(xf.get('numFmtId', 0)) for xf in el]
+    kinds = {}
+    for i, fmt in enumerate(styles):
+        code = custom.get(fmt) if fmt in custom else BUILTIN_FORMAT_CODES.get(fmt)
+        if code and _is_date_format(code):
+            kinds[i] = 'timedelta' if _TIMEDELTA.search(code.split(';')[0]) else 'date'
+    return kinds
+
+
+def from_excel(value, kind='date'):
+    """엑셀 날짜 일련번호 -> datetime (하루 미만이면 time, 경과 시간 서식이면 timedelta).
+    openpyxl 의 from_excel 과 같은 규칙"""
+    if kind == 'timedelta':
+        td = datetime.timedelta(days=value)
+        if td.microseconds:
+            td = datetime.timedelta(seconds=td.total_seconds() // 1, microseconds=round(td.microseconds, -3))
+        return td
+    day, fraction = divmod(value, 1)
+    diff = datetime.timedelta(milliseconds=round(fraction * 86400 * 1000))
+    if 0 <= value < 1 and diff.days == 0:
+        seconds = diff.seconds
+        return datetime.time(seconds // 3600, seconds // 60 % 60, seconds % 60, diff.microseconds)
+    if 0 < value < 60:
+        day += 1
+    return WINDOWS_EPOCH + datetime.timedelta(days=day) + diff
+
+
+def sheet_paths(zf):
+    """시트명 -> zip 안 경로 (workbook.xml 의 시트 순서)"""
+    targets = {}
+    with zf.open('xl/_rels/workbook.xml.rels') as f:
+        for _, el in iterparse(f):
+            if el.tag == PKG_REL_NS + 'Relationship':
+                target = el.get('Target')
+                if target.startswith('/'):
+                    target = target[1:]
+                elif not target.startswith('xl/'):
+                    target = 'xl/' + target
+                targets[el.get('Id')] = target
+    paths = {}
+    with zf.open('xl/workbook.xml') as f:
+        for _, el in iterparse(f):
+            if el.tag == MAIN_NS + 'sheet':
+                paths[el.get('name')] = targets[el.get(REL_NS + 'id')]
+    return paths
+
+
+def _cell_value(kind, style, text, shared, date_styles):
+    """셀 하나의 문자열 값. text 는 <v> (inlineStr 이면 <is> 의 글자)"""
+    if kind == 'inlineStr':
+        return text
+    if not text:
+        return ''
+    if kind == 's':
+        return shared[int(text)]
+    if kind == 'n':
+        number = float(text) if '.' in text or 'e' in text or 'E' in text else int(text)
+        kind = date_styles.get(int(style or 0)) if date_styles else None
+        if kind:
+            return str(from_excel(number, kind))
+        return str(number)
+    if kind == 'b':
+        return str(bool(int(text)))
+    return text  # str(수식 결과), e(오류). d(ISO 날짜)는 원문 그대로
+
+
+class _SheetTarget:
+    """XMLParser 대상. 트리를 만들지 않고 <c>/<v> 만 따라가며 끝난 행을 rows 에 쌓는다.
+
+    iterparse 는 모든 요소마다 Element 를 만들고 이벤트를 돌려주므로, 셀이 수십만 개인 시트에서는
+    start/end 콜백만 받는 편이 두 배 이상 빠르다.
+    """
+
+    def __init__(self, shared, date_styles, columns):
+        self.shared = shared
+        self.date_styles = date_styles
+        self.choose = columns if callable(columns) else None
+        self.columns = None if self.choose else columns
+        self.head = []          # choose 를 부르기 전까지 읽은 (행 번호, [(열, 값)])
+        self.width = self.height = None
+        self.rows = []          # 아직 내보내지 않은 (행 번호, [(열, 값)], 마지막 열)
+        self.done = False       # dimension 범위를 넘는 행을 만남
+        self.row_no = 0
+        self.cells = None
+        self.col = 0
+        self.last = 0
+        self.kind = self.style = None
+        self.text = []          # 현재 셀의 <v> (inlineStr 이면 <t>) 글자 조각
+        self.collect = False    # 글자를 모으는 중
+        self.skip = False       # 값이 필요 없는 셀
+        self.phonetic = False   # <rPh> 안의 윗주 글자는 버린다
+
+    def start(self, tag, attrib):
+        if tag == _CELL:
+            ref = attrib.get('r')
+            self.col = col = column_index(ref) if ref else self.col + 1
+            self.kind = attrib.get('t', 'n')
+            self.style = attrib.get('s')
+            self.skip = bool(self.width and col > self.width) or \
+                (self.columns is not None and col - 1 not in self.columns)
+            self.text = []
+        elif tag == _VALUE:
+            self.collect = not self.skip and self.kind != 'inlineStr'
+        elif tag == _T:
+            self.collect = not self.skip and self.kind == 'inlineStr' and not self.phonetic
+        elif tag == _ROW:
+            r = attrib.get('r')
+            self.row_no = int(r) if r else self.row_no + 1
+            self.cells = []
+            self.col = self.last = 0
+        elif tag == _RPH:
+            self.phonetic = True
+        elif tag == _DIMENSION:
+            self.width, self.height = _dimension_bounds(attrib['ref'])
+
+    def data(self, text):
+        if self.collect:
+            self.text.append(text)
+
+    def end(self, tag):
+        if tag == _VALUE or tag == _T:
+            self.collect = False
+        elif tag == _CELL:
+            if not (self.width and self.col > self.width):
+                self.last = self.col
+            if not self.skip:
+                self.cells.append((self.col, _cell_value(self.kind, self.style, ''.join(self.text),
+                                                         self.shared, self.date_styles)))
+        elif tag == _ROW:
+            if self.height is not None and self.row_no > self.height:
+                self.done = True
+            elif not self.done:
+                self.rows.append((self.row_no, self.cells, self.last))
+                if self.choose is not None:
+                    self.head.append((self.row_no, self.cells))
+                    if self.row_no >= HEADER_SCAN_ROWS:
+                        self.resolve_columns()
+        elif tag == _RPH:
+            self.phonetic = False
+
+    def resolve_columns(self):
+        """앞쪽 행(헤더) -> 나머지 행에서 읽을 열. 함수가 None 을 주면 모든 열"""
+        rows = [[] for _ in range(HEADER_SCAN_ROWS)]
+        for row_no, cells in self.head:
+            if row_no <= HEADER_SCAN_ROWS:
+                rows[row_no - 1] = row = [''] * max(col for col, _ in cells) if cells else []
+                for col, value in cells:
+                    row[col - 1] = value
+        self.columns = self.choose(rows)
+        self.choose = self.head = None
+
+    def close(self):
+        pass
+
+
+def iter_sheet_rows(zf, path, shared, date_styles=None, columns=None, chunk_size=1 << 16):
+    """시트 XML 을 chunk_size 바이트씩 파서에 넣고, 끝난 행을 문자열 리스트로 내보낸다.
+
+    columns 는 읽을 열 위치(0부터) 집합, 또는 앞쪽 HEADER_SCAN_ROWS 행 -> 집합 함수. None 이면 모든 열.
+    """
+    target = _SheetTarget(shared, date_styles, columns)
+    parser = XMLParser(target=target)
+    counter = 1
+    empty = None
+    with zf.open(path) as source:
+        while not target.done:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                parser.close()
+            else:
+                parser.feed(chunk)
+            if empty is None and (target.rows or not chunk):
+                empty = [''] * target.width if target.width else []
+            for row_no, cells, last in target.rows:
+                if row_no < counter:  # 이미 지난 행 번호는 openpyxl 도 버린다
+                    continue
+                while counter < row_no:
+                    counter += 1
+                    yield list(empty)
+                counter += 1
+                row = list(empty) if target.width else [''] * last
+                for col, value in cells:
+                    row[col - 1] = value
+                yield row
+            target.rows.clear()
+            if not chunk:
+                break
+    if target.done:
+        # openpyxl 처럼 범위를 넘는 행이 있을 때만 남은 빈 행을 채운다
+        for _ in range(counter, target.height + 1):
+            yield list(empty)
+
+
+def read_workbook_rows(path, sheet_names=None, columns=None):
+    """sheets.read_workbook_rows 와 같은 결과 (시트명 -> 문자열 행 목록).
+
+    columns 는 시트명 -> 열 위치 집합 또는 함수 (iter_sheet_rows). 없는 시트는 모든 열을 읽는다.
+    """
+    with zipfile.ZipFile(path) as zf:
+        paths = sheet_paths(zf)
+        shared = read_shared_strings(zf)
+        date_styles = read_date_styles(zf)
+        result = {}
+        for name in sheet_names or paths:
+            if name not in paths:
+                raise KeyError(f"Worksheet {name} does not exist.")
+            cols = columns.get(name) if columns else None
+            result[name] = list(iter_sheet_rows(zf, paths[name], shared, date_styles, cols))
+    return result
+
+
+def compare_engines(path, sheet_names=None):
+    """(openpyxl 결과와 다른 시트 [(시트, 첫 차이 행 번호)], openpyxl 초, 스트리밍 초)"""
+    from . import sheets
+
+    started = time.perf_counter()
+    expected = sheets.read_workbook_rows(path, sheet_names, engine='openpyxl')
+    openpyxl_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    actual = read_workbook_rows(path, sheet_names)
+    stream_seconds = time.perf_counter() - started
+    mismatches = []
+    for name in expected.keys() | actual.keys():
+        want, have = expected.get(name), actual.get(name)
+        if want != have:
+            first = next((i for i, (a, b) in enumerate(zip(want or [], have or [])) if a != b),
+                         min(len(want or []), len(have or [])))
+            mismatches.append((name, first))
+    return sorted(mismatches), openpyxl_seconds, stream_seconds
+
+
+NEEDS_CATALOG = False
+
+
+def register(subparsers):
+    p = subparsers.add_parser('xlsx', help='openpyxl 없이 xlsx 를 스트리밍으로 읽는 리더 검증')
+    sub = p.add_subparsers(dest='xlsx_command', required=True)
+    check = sub.add_parser('check', help='openpyxl 결과와 같은지 대조하고 읽기 시간을 비교')
+    check.add_argument('path')
+    check.add_argument('--sheets', nargs='*', help='대조할 시트 (기본: 모든 시트)')
+    p.set_defaults(func=run)
+
+
+def run(args, catalog):
+    mismatches, openpyxl_seconds, stream_seconds = compare_engines(args.path, args.sheets or None)
+    print(f"openpyxl {openpyxl_seconds * 1000:,.0f}ms / 스트리밍 {stream_seconds * 1000:,.0f}ms "
+          f"({openpyxl_seconds / stream_seconds:.1f}배)")
+    if mismatches:
+        for name, row in mismatches:
+            print(f"  {name}: {row + 1}행부터 다름")
+        return 1
+    print("모든 시트 결과가 같습니다")
+    return 0
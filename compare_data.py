@@ -6,7 +6,6 @@ sys.stdout.reconfigure(encoding='utf-8')
 import re
 import os
 import json
-import openpyxl
 
 EXCEL_PATH = r'26-1 수강편람 (4차).xlsx'
 COURSES_DIR = r'src\data\courses'
@@ -190,6 +189,7 @@ def read_excel_data(wb):
     return all_courses
 
 def main():
+    import openpyxl  # 워크북을 읽을 때만 필요
     wb = openpyxl.load_workbook(EXCEL_PATH, data_only=True)
     excel_courses = read_excel_data(wb)
 
@@ -1,5 +1,6 @@
 import openpyxl
-import json
+
+from catalog.snapshot import write_snapshot
 
 wb = openpyxl.load_workbook(r"C:\Users\jaewo\Desktop\hnu-timetable\26-1 수강편람 (4차).xlsx", data_only=True)
 
@@ -12,8 +13,8 @@ for sheet_name in wb.sheetnames:
         rows.append([str(c) if c is not None else "" for c in row])
     result[sheet_name] = rows
 
-with open("excel_data.json", "w", encoding="utf-8") as f:
-    json.dump(result, f, ensure_ascii=False, indent=2)
+# excel_data.json 과 함께 시트/행 오프셋 인덱스(excel_data.index.json)를 기록
+write_snapshot(result, "excel_data.json")
 
 print("Done! Sheets:", list(result.keys()))
 for k, v in result.items():
@@ -9,6 +9,7 @@ import useAppStore from './stores/useAppStore.ts'
 import useTimetableStore from './stores/useTimetableStore.ts'
 import { type FilterState, type Course } from './types/index.ts'
 import { filterCourses, INITIAL_FILTER } from './utils/filterCourses.ts'
+import { loadCollegeIndex, type CollegeIndex } from './utils/collegeIndex.ts'
 import { loadTimetable, saveTimetable } from './utils/storage.ts'
 
 export default function App() {
@@ -55,10 +56,16 @@ export default function App() {
     []
   )
 
+  // 사전 계산된 과목별 단과대학 번호 (없으면 filterCourses 가 문자열을 정규화해 비교)
+  const [collegeIndex, setCollegeIndex] = useState<CollegeIndex | null>(null)
+  useEffect(() => {
+    loadCollegeIndex().then(setCollegeIndex)
+  }, [])
+
   // 필터 적용 후 강의 목록
   const filteredCourses = useMemo(
-    () => filterCourses(currentSemester.courses, filter),
-    [currentSemester, filter]
+    () => filterCourses(currentSemester.courses, filter, collegeIndex),
+    [currentSemester, filter, collegeIndex]
   )
 
   return (
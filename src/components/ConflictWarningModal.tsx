@@ -1,6 +1,7 @@
-import { useEffect, useRef } from 'react'
+import { useEffect, useRef, useState } from 'react'
 import { type Course } from '../types/index.ts'
 import { type ConflictInfo } from '../utils/detectConflict.ts'
+import { isSameSession, loadSessionIndex, type SessionIndex } from '../utils/sessionIndex.ts'
 import useTimetableStore from '../stores/useTimetableStore.ts'
 
 interface Props {
@@ -12,6 +13,11 @@ export default function ConflictWarningModal({ course: pending, onClose }: Props
   const selectedCourses = useTimetableStore((s) => s.selectedCourses)
   const forceAdd        = useTimetableStore((s) => s.forceAdd)
   const modalRef        = useRef<HTMLDivElement>(null)
+  // 코드쉐어로 묶인 같은 수업 분반 (sessions.json)
+  const [sessionIndex, setSessionIndex] = useState<SessionIndex | null>(null)
+  useEffect(() => {
+    loadSessionIndex().then(setSessionIndex)
+  }, [])
 
   // Esc 키 닫기 + Focus trap
   useEffect(() => {
@@ -94,6 +100,11 @@ export default function ConflictWarningModal({ course: pending, onClose }: Props
                 {courseNameMap.get(existingId) ?? existingId}
                 <span className="font-normal text-red-500 ml-1.5">({existingId})</span>
               </p>
+              {isSameSession(sessionIndex, pending.course.id, existingId) && (
+                <p className="mt-1 text-xs text-red-600">
+                  코드쉐어로 묶인 같은 수업입니다. 두 분반 중 하나만 신청하면 됩니다.
+                </p>
+              )}
 
               {/* 블록 단위 충돌 세부 정보 */}
               <div className="mt-1.5 space-y-1.5">
@@ -1,8 +1,9 @@
-import { Fragment, useMemo } from 'react'
+import { Fragment, useEffect, useMemo, useState } from 'react'
 import { type Course } from '../types/index.ts'
 import { getCourseColor } from '../utils/courseColors.ts'
 import useTimetableStore from '../stores/useTimetableStore.ts'
 import { computeAllConflicts } from '../utils/detectConflict.ts'
+import { createConflictHint, loadConflictIndex, type ConflictIndex } from '../utils/conflictIndex.ts'
 
 const DEFAULT_HEADERS = ['', '과목명', '이수구분', '학수번호', '분반', '학-강-실', '단과대학', '학과', '학년', '담당교수', '강의시간', '강의실']
 const ELECTIVE_HEADERS = ['', '과목명', '이수구분', '학수번호', '분반', '학-강-실', '담당교수', '강의시간', '강의실', '비고']
@@ -33,6 +34,15 @@ interface CourseListProps {
 export default function CourseList({ courses, onCourseClick, categories = [] }: CourseListProps) {
   const selectedCourses = useTimetableStore((s) => s.selectedCourses)
   const conflictCourseIds = useMemo(() => computeAllConflicts(selectedCourses), [selectedCourses])
+  // 선택한 강의와 시간이 겹치는 분반 (사전 계산된 충돌 인덱스 사용)
+  const [conflictIndex, setConflictIndex] = useState<ConflictIndex | null>(null)
+  useEffect(() => {
+    loadConflictIndex().then(setConflictIndex)
+  }, [])
+  const conflictsWithSelection = useMemo(
+    () => createConflictHint(conflictIndex, selectedCourses),
+    [conflictIndex, selectedCourses],
+  )
   const isCodeShare = categories.length === 1 && categories[0] === '코드쉐어'
   const isMicrodegree = categories.length === 1 && categories[0] === '마이크로디그리'
   const isElective = categories.length === 1 && (categories[0] === '교선' || categories[0] === '일선')
@@ -71,6 +81,7 @@ export default function CourseList({ courses, onCourseClick, categories = [] }:
               ) : courses.map((course, idx) => {
                 const color = getCourseColor(course.id)
                 const selected = selectedCourses.find(sc => sc.course.id === course.id)
+                const dimmed = !selected && conflictsWithSelection(course)
                 const prev = idx > 0 ? courses[idx - 1] : null
                 const showGroupHeader = !isMicrodegree && !isCodeShare && (!prev || prev.name !== course.name)
 
@@ -90,7 +101,8 @@ export default function CourseList({ courses, onCourseClick, categories = [] }:
                     {/* 과목 행 */}
                     <tr
                       className="hover:bg-slate-50 transition-colors cursor-pointer"
-                      style={{ borderBottom: '1px solid #f1f5f9' }}
+                      style={{ borderBottom: '1px solid #f1f5f9', opacity: dimmed ? 0.45 : 1 }}
+                      title={dimmed ? '선택한 강의와 시간이 겹칩니다' : undefined}
                       onClick={() => onCourseClick(course)}
                     >
                       {/* 선택 표시 */}
@@ -319,6 +331,7 @@ export default function CourseList({ courses, onCourseClick, categories = [] }:
         ) : courses.map((course) => {
           const selected = selectedCourses.find(sc => sc.course.id === course.id)
           const isConflict = conflictCourseIds.has(course.id)
+          const dimmed = !selected && conflictsWithSelection(course)
           
           // 시간 정보 생성
           const timeInfo = course.isTimeConfirmed && course.timeRaw
@@ -337,6 +350,7 @@ export default function CourseList({ courses, onCourseClick, categories = [] }:
               style={{
                 backgroundColor: selected ? selected.color + '10' : 'var(--card)',
                 border: selected ? `2px solid ${selected.color}` : '1px solid var(--border)',
+                opacity: dimmed ? 0.45 : 1,
               }}
             >
               {/* 과목명 */}
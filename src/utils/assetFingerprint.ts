@@ -0,0 +1,13 @@
+const encoder = new TextEncoder()
+
+/**
+ * public/data 자산의 과목별 지문 (catalog/records.py 의 asset_fingerprint 와 같은 FNV-1a 32비트, 16진수 8자리).
+ * 자산을 만든 뒤 바뀐 과목은 지문이 달라지므로 호출 측이 자산 대신 직접 계산한다.
+ */
+export function assetFingerprint(text: string): string {
+  let h = 0x811c9dc5
+  for (const byte of encoder.encode(text)) {
+    h = Math.imul(h ^ byte, 0x01000193) >>> 0
+  }
+  return h.toString(16).padStart(8, '0')
+}
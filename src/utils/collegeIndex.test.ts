@@ -0,0 +1,63 @@
+import { describe, it, expect } from 'vitest'
+import { decodeCollegeIndex } from './collegeIndex.ts'
+import { assetFingerprint } from './assetFingerprint.ts'
+import { filterCourses, INITIAL_FILTER } from './filterCourses.ts'
+import { type Course } from '../types/index.ts'
+
+/** 테스트용 최소 Course 팩토리 */
+function makeCourse(id: string, college: string): Course {
+  return {
+    id,
+    code: id.split('-')[0],
+    section: id.split('-')[1] ?? '01',
+    name: `과목-${id}`,
+    college,
+    department: '학과',
+    major: '전공',
+    year: '2',
+    credits: 3,
+    creditDetail: '3-3-0',
+    professors: ['교수A'],
+    category: '교필',
+    timeBlocks: [],
+    note: '',
+    isTimeConfirmed: true,
+  }
+}
+
+// 0: 스마트융합대학, 1: 생명ㆍ나노과학대학, 2: 린튼글로벌스쿨
+const INDEX = decodeCollegeIndex({
+  version: 2,
+  names: ['스마트융합대학', '생명ㆍ나노과학대학', '린튼글로벌스쿨'],
+  sections: { 'A-1': [0], 'B-1': [1, 2] },
+  fingerprints: { 'A-1': assetFingerprint('스마트융합대학'), 'B-1': assetFingerprint('') },
+})
+
+const filter = (colleges: string[]) => ({ ...INITIAL_FILTER, colleges })
+
+describe('filterCourses 단과대학 필터', () => {
+  // 인덱스의 번호가 문자열보다 우선한다 (B-1 의 college 문자열은 일부러 비워 둠)
+  const a = makeCourse('A-1', '스마트융합대학')
+  const b = makeCourse('B-1', '')
+  const c = makeCourse('C-1', '생명.나노과학대학, 린튼글로벌스쿨')
+
+  it('인덱스에 있는 강의는 단과대학 번호로 비교한다', () => {
+    expect(filterCourses([a, b], filter(['린튼글로벌스쿨']), INDEX)).toEqual([b])
+    expect(filterCourses([a, b], filter(['스마트융합대학', '생명ㆍ나노과학대학']), INDEX)).toEqual([a, b])
+  })
+
+  it('인덱스에 없는 강의는 구분자를 정규화해 비교한다', () => {
+    expect(filterCourses([c], filter(['생명ㆍ나노과학대학']), INDEX)).toEqual([c])
+    expect(filterCourses([c], filter(['스마트융합대학']), INDEX)).toEqual([])
+  })
+
+  it('인덱스를 만든 뒤 단과대학이 바뀐 강의는 문자열로 비교한다', () => {
+    const moved = makeCourse('A-1', '린튼글로벌스쿨')
+    expect(filterCourses([moved], filter(['린튼글로벌스쿨']), INDEX)).toEqual([moved])
+    expect(filterCourses([moved], filter(['스마트융합대학']), INDEX)).toEqual([])
+  })
+
+  it('인덱스가 없으면 모든 강의를 문자열로 비교한다', () => {
+    expect(filterCourses([a, b, c], filter(['린튼글로벌스쿨']))).toEqual([c])
+  })
+})
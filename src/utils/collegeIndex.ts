@@ -0,0 +1,58 @@
+import { type Course } from '../types/index.ts'
+import { assetFingerprint } from './assetFingerprint.ts'
+
+const ASSET_VERSION = 2
+
+/** public/data/colleges.json 형식 (`python -m catalog colleges emit` 으로 생성) */
+export interface CollegeIndexData {
+  version: number
+  names: string[]                       // COLLEGE_DEPARTMENTS 의 단과대학 (표준 표기)
+  sections: Record<string, number[]>    // courseId → 단과대학 번호 목록
+  fingerprints: Record<string, string>  // courseId → 만들 때의 단과대학 문자열 지문
+}
+
+export interface CollegeIndex {
+  numbers: Map<string, number>          // 단과대학명 → 번호
+  sections: Record<string, number[]>
+  fingerprints: Record<string, string>
+}
+
+export function decodeCollegeIndex(data: CollegeIndexData): CollegeIndex {
+  return {
+    numbers: new Map(data.names.map((name, i) => [name, i])),
+    sections: data.sections,
+    fingerprints: data.fingerprints,
+  }
+}
+
+const fingerprintCache = new WeakMap<Course, string>()
+
+function collegeFingerprint(course: Course): string {
+  let fp = fingerprintCache.get(course)
+  if (fp === undefined) {
+    fp = assetFingerprint(course.college)
+    fingerprintCache.set(course, fp)
+  }
+  return fp
+}
+
+/** 강의의 단과대학 번호 목록. 인덱스에 없거나 인덱스를 만든 뒤 단과대학이 바뀐 강의는 undefined */
+export function collegeNumbers(index: CollegeIndex | null, course: Course): number[] | undefined {
+  if (!index) return undefined
+  const numbers = index.sections[course.id]
+  if (numbers === undefined || index.fingerprints[course.id] !== collegeFingerprint(course)) return undefined
+  return numbers
+}
+
+let pending: Promise<CollegeIndex | null> | null = null
+
+/** 단과대학 인덱스를 한 번만 불러온다. 파일이 없거나 형식 버전이 다르면 null (호출 측은 문자열 정규화로 대체) */
+export function loadCollegeIndex(url = '/data/colleges.json'): Promise<CollegeIndex | null> {
+  if (!pending) {
+    pending = fetch(url)
+      .then(res => (res.ok ? res.json() as Promise<CollegeIndexData> : null))
+      .then(data => (data?.version === ASSET_VERSION ? decodeCollegeIndex(data) : null))
+      .catch(() => null)
+  }
+  return pending
+}
@@ -0,0 +1,101 @@
+import { describe, it, expect } from 'vitest'
+import { createConflictHint, decodeConflictIndex, timeFingerprint } from './conflictIndex.ts'
+import { type Course, type SelectedCourse, type TimeBlock } from '../types/index.ts'
+
+/** 테스트용 최소 Course 팩토리 */
+function makeCourse(id: string, timeBlocks: TimeBlock[], isTimeConfirmed = true): Course {
+  return {
+    id,
+    code: id.split('-')[0],
+    section: id.split('-')[1] ?? '01',
+    name: `과목-${id}`,
+    college: '대학',
+    department: '학과',
+    major: '전공',
+    year: '2',
+    credits: 3,
+    creditDetail: '3-3-0',
+    professors: ['교수A'],
+    category: '전필',
+    timeBlocks,
+    note: '',
+    isTimeConfirmed,
+  }
+}
+
+function sel(course: Course): SelectedCourse {
+  return { course, color: '#3b82f6' }
+}
+
+const MON_1: TimeBlock = { day: '월', startTime: '09:00', endTime: '09:50', room: 'R1', group: 0 }
+const MON_A: TimeBlock = { day: '월', startTime: '09:00', endTime: '10:15', room: 'R2', group: 0 }
+const TUE_1: TimeBlock = { day: '화', startTime: '09:00', endTime: '09:50', room: 'R1', group: 0 }
+
+// 패턴 0: 월1, 패턴 1: 월A, 패턴 2: 화1  (0↔1 충돌, 각 패턴은 자기 자신과 충돌)
+// base64: 0b011 = 'Aw==', 0b011 = 'Aw==', 0b100 = 'BA=='
+const fp = (blocks: TimeBlock[]) => timeFingerprint(makeCourse('FP-01', blocks))
+const INDEX = decodeConflictIndex({
+  version: 2,
+  patterns: 3,
+  sections: { 'A-01': 0, 'A-02': 0, 'B-01': 1, 'C-01': 2 },
+  fingerprints: { 'A-01': fp([MON_1]), 'A-02': fp([MON_1]), 'B-01': fp([MON_A]), 'C-01': fp([TUE_1]) },
+  adjacency: ['Aw==', 'Aw==', 'BA=='],
+})
+
+describe('createConflictHint', () => {
+  const a1 = makeCourse('A-01', [MON_1])
+  const a2 = makeCourse('A-02', [MON_1])
+  const b1 = makeCourse('B-01', [MON_A])
+  const c1 = makeCourse('C-01', [TUE_1])
+
+  it('선택한 강의와 겹치는 패턴의 분반은 true', () => {
+    const hint = createConflictHint(INDEX, [sel(a1)])
+    expect(hint(a2)).toBe(true)
+    expect(hint(b1)).toBe(true)
+    expect(hint(c1)).toBe(false)
+  })
+
+  it('이미 선택한 강의 자신은 false', () => {
+    const hint = createConflictHint(INDEX, [sel(a1)])
+    expect(hint(a1)).toBe(false)
+  })
+
+  it('선택이 없으면 모두 false', () => {
+    const hint = createConflictHint(INDEX, [])
+    expect([a1, a2, b1, c1].some(hint)).toBe(false)
+  })
+
+  it('인덱스에 없는 강의는 detectConflict로 판정', () => {
+    const custom = makeCourse('CUSTOM-001', [{ ...TUE_1, room: '' }])
+    const hint = createConflictHint(INDEX, [sel(custom)])
+    expect(hint(c1)).toBe(true)
+    expect(hint(a1)).toBe(false)
+
+    const newCourse = makeCourse('D-01', [MON_1])
+    expect(createConflictHint(INDEX, [sel(a1)])(newCourse)).toBe(true)
+  })
+
+  it('인덱스를 만든 뒤 시간이 바뀐 강의는 detectConflict로 판정', () => {
+    // C-01 이 인덱스에서는 화1 이지만 지금은 월1
+    const moved = makeCourse('C-01', [MON_1])
+    expect(createConflictHint(INDEX, [sel(a1)])(moved)).toBe(true)
+    expect(createConflictHint(INDEX, [sel(moved)])(b1)).toBe(true)
+    expect(createConflictHint(INDEX, [sel(moved)])(c1)).toBe(false)
+  })
+
+  it('지문은 catalog/conflicts.py 의 time_fingerprint 와 같다', () => {
+    expect(fp([MON_1])).toBe('57892484')
+  })
+
+  it('인덱스가 없으면 detectConflict로 대체', () => {
+    const hint = createConflictHint(null, [sel(a1)])
+    expect(hint(b1)).toBe(true)
+    expect(hint(c1)).toBe(false)
+  })
+
+  it('시간 미확정 강의는 false', () => {
+    const unconfirmed = makeCourse('A-02', [MON_1], false)
+    const hint = createConflictHint(INDEX, [sel(a1)])
+    expect(hint(unconfirmed)).toBe(false)
+  })
+})
@@ -0,0 +1,97 @@
+import { type Course, type SelectedCourse } from '../types/index.ts'
+import { assetFingerprint } from './assetFingerprint.ts'
+import { detectConflict } from './detectConflict.ts'
+
+const ASSET_VERSION = 2
+
+/** public/data/conflicts.json 형식 (`python -m catalog conflicts emit` 으로 생성) */
+export interface ConflictIndexData {
+  version: number
+  patterns: number                      // 시간 패턴 수
+  sections: Record<string, number>      // courseId → 시간 패턴 번호
+  fingerprints: Record<string, string>  // courseId → 만들 때의 timeFingerprint
+  adjacency: string[]                   // 패턴별로 겹치는 패턴 집합 (base64 비트셋)
+}
+
+export interface ConflictIndex {
+  sections: Record<string, number>
+  fingerprints: Record<string, string>
+  adjacency: Uint8Array[]
+}
+
+const fingerprintCache = new WeakMap<Course, string>()
+
+/** 시간 블록의 지문 (catalog/conflicts.py 의 time_fingerprint 와 같은 문자열로 계산) */
+export function timeFingerprint(course: Course): string {
+  let fp = fingerprintCache.get(course)
+  if (fp === undefined) {
+    fp = assetFingerprint(course.timeBlocks.map(b => `${b.day}${b.startTime}-${b.endTime}`).join(','))
+    fingerprintCache.set(course, fp)
+  }
+  return fp
+}
+
+/** 인덱스의 시간 패턴 번호. 인덱스에 없거나 인덱스를 만든 뒤 시간이 바뀐 강의는 undefined */
+function patternOf(index: ConflictIndex | null, course: Course): number | undefined {
+  if (!index) return undefined
+  const pattern = index.sections[course.id]
+  if (pattern === undefined || index.fingerprints[course.id] !== timeFingerprint(course)) return undefined
+  return pattern
+}
+
+function decodeBase64(text: string): Uint8Array {
+  const bin = atob(text)
+  const bytes = new Uint8Array(bin.length)
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i)
+  return bytes
+}
+
+export function decodeConflictIndex(data: ConflictIndexData): ConflictIndex {
+  return { sections: data.sections, fingerprints: data.fingerprints, adjacency: data.adjacency.map(decodeBase64) }
+}
+
+let pending: Promise<ConflictIndex | null> | null = null
+
+/** 충돌 인덱스를 한 번만 불러온다. 파일이 없거나 형식 버전이 다르면 null (호출 측은 detectConflict로 대체) */
+export function loadConflictIndex(url = '/data/conflicts.json'): Promise<ConflictIndex | null> {
+  if (!pending) {
+    pending = fetch(url)
+      .then(res => (res.ok ? res.json() as Promise<ConflictIndexData> : null))
+      .then(data => (data?.version === ASSET_VERSION ? decodeConflictIndex(data) : null))
+      .catch(() => null)
+  }
+  return pending
+}
+
+/**
+ * 선택된 강의와 시간이 겹치는 강의인지 판정하는 함수를 만든다.
+ * 인덱스에 있는 강의는 선택 강의들의 인접 비트셋 OR 결과에서 비트 하나만 확인하고,
+ * 인덱스에 없는 강의(직접 추가한 강의, 인덱스 생성 이후 추가되거나 시간이 바뀐 강의)만 detectConflict로 비교한다.
+ */
+export function createConflictHint(
+  index: ConflictIndex | null,
+  selectedCourses: SelectedCourse[],
+): (course: Course) => boolean {
+  const selectedIds = new Set(selectedCourses.map(sc => sc.course.id))
+  const unindexed: SelectedCourse[] = []
+  let union: Uint8Array | null = null
+
+  for (const sc of selectedCourses) {
+    const pattern = patternOf(index, sc.course)
+    if (index && pattern !== undefined && sc.course.isTimeConfirmed) {
+      const adj = index.adjacency[pattern]
+      union ??= new Uint8Array(adj.length)
+      for (let i = 0; i < adj.length; i++) union[i] |= adj[i]
+    } else {
+      unindexed.push(sc)
+    }
+  }
+
+  return (course: Course) => {
+    if (selectedIds.has(course.id) || !course.isTimeConfirmed) return false
+    const pattern = patternOf(index, course)
+    if (pattern === undefined) return detectConflict(course, selectedCourses).isConflict
+    if (union && (union[pattern >> 3] >> (pattern & 7)) & 1) return true
+    return unindexed.length > 0 && detectConflict(course, unindexed).isConflict
+  }
+}
@@ -1,14 +1,27 @@
 import { type Course, type FilterState } from '../types/index.ts'
+import { type CollegeIndex, collegeNumbers } from './collegeIndex.ts'
 
 /** 단과대학명의 구분자(·, ㆍ, .)를 통일하여 비교할 수 있도록 정규화 */
 function normalizeCollege(name: string): string {
   return name.replace(/[·ㆍ.]/g, '')
 }
 
-/** course.college가 쉼표로 복수 대학을 포함할 수 있으므로, 선택된 대학 중 하나라도 매칭되면 true */
-function matchesCollege(courseCollege: string, selectedColleges: string[]): boolean {
-  const courseColleges = courseCollege.split(',').map(c => normalizeCollege(c.trim()))
-  return selectedColleges.some(sel => courseColleges.includes(normalizeCollege(sel)))
+/**
+ * 선택된 대학 중 하나라도 course.college 에 있으면 true 를 돌려주는 판정 함수.
+ * 인덱스(colleges.json)에 있는 강의는 미리 정규화된 단과대학 번호로 비교하고,
+ * 인덱스에 없거나 인덱스를 만든 뒤 단과대학이 바뀐 강의만 쉼표로 나눈 단과대학명을 정규화해 비교한다.
+ */
+function createCollegeMatcher(selectedColleges: string[], index: CollegeIndex | null): (course: Course) => boolean {
+  const selectedKeys = selectedColleges.map(normalizeCollege)
+  const selectedNumbers = new Set(
+    selectedColleges.map(c => index?.numbers.get(c)).filter((n): n is number => n !== undefined),
+  )
+  return course => {
+    const numbers = collegeNumbers(index, course)
+    if (numbers) return numbers.some(n => selectedNumbers.has(n))
+    const courseColleges = course.college.split(',').map(c => normalizeCollege(c.trim()))
+    return selectedKeys.some(sel => courseColleges.includes(sel))
+  }
 }
 
 export const INITIAL_FILTER: FilterState = {
@@ -22,7 +35,8 @@ export const INITIAL_FILTER: FilterState = {
   timeConfirmedOnly: false,
 }
 
-export function filterCourses(courses: Course[], filter: FilterState): Course[] {
+export function filterCourses(courses: Course[], filter: FilterState, collegeIndex: CollegeIndex | null = null): Course[] {
+  const matchesCollege = filter.colleges.length > 0 ? createCollegeMatcher(filter.colleges, collegeIndex) : null
   return courses.filter(course => {
     if (filter.keyword) {
       const kw = filter.keyword.toLowerCase()
@@ -55,7 +69,7 @@ export function filterCourses(courses: Course[], filter: FilterState): Course[]
       if (!shouldInclude) return false
     }
     
-    if (filter.colleges.length > 0 && !matchesCollege(course.college, filter.colleges)) return false
+    if (matchesCollege && !matchesCollege(course)) return false
     if (filter.departments.length > 0 && !filter.departments.includes(course.department)) return false
     if (filter.years.length > 0) {
       const courseYears = course.year.split(',').map(y => y.trim())
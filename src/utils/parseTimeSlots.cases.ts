@@ -0,0 +1,52 @@
+import { type TimeBlock } from '../types/index.ts'
+
+export interface TimeSlotCase {
+  time: string
+  room: string
+  blocks: TimeBlock[]
+}
+
+/**
+ * 강의시간 파싱 대조 사례. parseTimeSlots.test.ts 와 파이썬 tests/test_timeslots.py
+ * (catalog/timeslots.py 의 parse_time_slots) 가 같은 사례를 읽어 두 파서가 같은 블록을 내는지 확인한다.
+ */
+export const TIME_SLOT_CASES: TimeSlotCase[] = [
+  {
+    time: '화3/금2,3',
+    room: '090411-0/090522-0',
+    blocks: [
+      { day: '화', startTime: '11:00', endTime: '11:50', room: '090411-0', group: 0 },
+      { day: '금', startTime: '10:00', endTime: '10:50', room: '090522-0', group: 1 },
+      { day: '금', startTime: '11:00', endTime: '11:50', room: '090522-0', group: 1 },
+    ],
+  },
+  // 요일 뒤 공백: parseInt(' 1') 은 1 (24220-1, 24222-1)
+  {
+    time: '목 1,2/금0,1',
+    room: '110303',
+    blocks: [
+      { day: '목', startTime: '09:00', endTime: '09:50', room: '110303', group: 0 },
+      { day: '목', startTime: '10:00', endTime: '10:50', room: '110303', group: 0 },
+      { day: '금', startTime: '08:00', endTime: '08:50', room: '110303', group: 1 },
+      { day: '금', startTime: '09:00', endTime: '09:50', room: '110303', group: 1 },
+    ],
+  },
+  // 소문자 영문 교시, 13교시를 넘는 숫자는 버림
+  {
+    time: '월a,수13,14',
+    room: '',
+    blocks: [
+      { day: '월', startTime: '09:00', endTime: '10:15', room: '미정', group: 0 },
+      { day: '수', startTime: '21:00', endTime: '21:50', room: '미정', group: 0 },
+    ],
+  },
+  {
+    time: '/월2',
+    room: '/090411-0',
+    blocks: [
+      { day: '월', startTime: '10:00', endTime: '10:50', room: '090411-0', group: 1 },
+    ],
+  },
+  { time: '미정', room: '미정', blocks: [] },
+  { time: '0', room: '', blocks: [] },
+]
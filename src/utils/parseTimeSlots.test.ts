@@ -1,5 +1,6 @@
 import { describe, it, expect } from 'vitest'
 import { parseTimeSlots } from './parseTimeSlots.ts'
+import { TIME_SLOT_CASES } from './parseTimeSlots.cases.ts'
 
 describe('parseTimeSlots', () => {
   // ── 1. 단일요일 + 숫자교시 연속 ──────────────────────────────
@@ -78,3 +79,9 @@ describe('parseTimeSlots', () => {
     expect(result[5]).toEqual({ day: '목', startTime: '21:00', endTime: '21:50', room: '101001-0', group: 0 })
   })
 })
+
+describe('parseTimeSlots 대조 사례 (catalog/timeslots.py 와 공유)', () => {
+  it.each(TIME_SLOT_CASES)('$time / $room', ({ time, room, blocks }) => {
+    expect(parseTimeSlots(time, room)).toEqual(blocks)
+  })
+})
@@ -0,0 +1,24 @@
+import { describe, it, expect } from 'vitest'
+import { decodeSessionIndex, isSameSession } from './sessionIndex.ts'
+
+const INDEX = decodeSessionIndex({
+  version: 1,
+  groups: [['21054-01', '25089-13'], ['23753-2', '23753-3']],
+})
+
+describe('isSameSession', () => {
+  it('같은 그룹의 분반은 같은 수업', () => {
+    expect(isSameSession(INDEX, '21054-01', '25089-13')).toBe(true)
+    expect(isSameSession(INDEX, '23753-3', '23753-2')).toBe(true)
+  })
+
+  it('다른 그룹이거나 그룹이 없는 분반은 다른 수업', () => {
+    expect(isSameSession(INDEX, '21054-01', '23753-2')).toBe(false)
+    expect(isSameSession(INDEX, '21054-01', '99999-01')).toBe(false)
+    expect(isSameSession(INDEX, '99999-01', '99999-02')).toBe(false)
+  })
+
+  it('인덱스가 없으면 항상 false', () => {
+    expect(isSameSession(null, '21054-01', '25089-13')).toBe(false)
+  })
+})
@@ -0,0 +1,33 @@
+/** public/data/sessions.json 형식 (`python -m catalog codeshare emit` 으로 생성) */
+export interface SessionIndexData {
+  version: number
+  groups: string[][]   // 같은 시간/강의실/교수로 한 교실에서 하는 코드쉐어 분반 묶음
+}
+
+/** courseId → 물리 수업 그룹 번호 */
+export type SessionIndex = Map<string, number>
+
+export function decodeSessionIndex(data: SessionIndexData): SessionIndex {
+  const index: SessionIndex = new Map()
+  data.groups.forEach((ids, g) => ids.forEach(id => index.set(id, g)))
+  return index
+}
+
+/** 두 분반이 같은 물리 수업(코드쉐어 묶음)인지 */
+export function isSameSession(index: SessionIndex | null, a: string, b: string): boolean {
+  const g = index?.get(a)
+  return g !== undefined && g === index?.get(b)
+}
+
+let pending: Promise<SessionIndex | null> | null = null
+
+/** 물리 수업 그룹을 한 번만 불러온다. 파일이 없으면 null (호출 측은 같은 수업 표시를 하지 않음) */
+export function loadSessionIndex(url = '/data/sessions.json'): Promise<SessionIndex | null> {
+  if (!pending) {
+    pending = fetch(url)
+      .then(res => (res.ok ? res.json() as Promise<SessionIndexData> : null))
+      .then(data => (data ? decodeSessionIndex(data) : null))
+      .catch(() => null)
+  }
+  return pending
+}
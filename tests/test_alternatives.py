@@ -0,0 +1,81 @@
+"""다른 분반 찾기(catalog/alternatives.py).
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import unittest
+
+from catalog import alternatives
+from catalog.alternatives import SectionIndex
+from catalog.records import CourseRecord, CourseTable
+from catalog.timeslots import parse_time_slots
+
+
+def section(sid, time_raw, name='채플', confirmed=True, code_share=None):
+    code, number = sid.split('-')
+    return CourseRecord(sid, code=code, section=number, name=name, time_raw=time_raw,
+                        time_blocks=tuple(parse_time_slots(time_raw, '')), is_time_confirmed=confirmed,
+                        is_code_share=code_share)
+
+
+RECORDS = [
+    section('13479-01', '화2'), section('13479-02', '화3'), section('13479-03', '목2'),
+    section('13479-04', '수2'), section('13479-05', '', confirmed=False),
+    section('11967-01', '화2,3', name='선형대수학'), section('11967-02', '월5,6', name='선형대수학'),
+    section('20981-01', '금1', name='영미문화', code_share=True),
+    section('25531-01', '금2', name='영미문화'), section('25531-02', '화3', name='영미문화'),
+]
+
+
+class SectionIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = SectionIndex.build(RECORDS)
+        self.catalog = CourseTable(RECORDS)
+
+    def test_sections_that_fit_ordered_by_change(self):
+        selection = [self.catalog.lookup('11967-01'), self.catalog.lookup('13479-01')]
+        found = [(a.record.id, a.new_days, a.moved_slots)
+                 for a in self.index.alternatives(selection, '13479')]
+        # 화2,3 은 선형대수학과 겹치고, 화요일이 아닌 분반은 새 등교 요일이 생긴다. 시간 미정은 맨 뒤
+        self.assertEqual(found, [('13479-03', 1, 10), ('13479-04', 1, 10), ('13479-05', 0, 0)])
+
+    def test_without_selection_every_section_fits(self):
+        self.assertEqual(len(self.index.alternatives([], '13479')), 5)
+        self.assertEqual(self.index.alternatives([], '99999'), [])
+
+    def test_codeshare_equivalents(self):
+        self.assertEqual(self.index.equivalent_codes('20981'), ('25531',))
+        self.assertEqual(self.index.equivalent_codes('25531'), ('20981',))
+        selection = [self.catalog.lookup('11967-01')]
+        plain = [a.record.id for a in self.index.alternatives(selection, '20981')]
+        shared = [a.record.id for a in self.index.alternatives(selection, '20981', include_equivalent=True)]
+        self.assertEqual(plain, ['20981-01'])
+        self.assertEqual(shared, ['20981-01', '25531-01'])
+
+
+class AlternativesCommandTest(unittest.TestCase):
+    def run_alternatives(self, argv):
+        parser = argparse.ArgumentParser()
+        alternatives.register(parser.add_subparsers())
+        args = parser.parse_args(['alternatives'] + argv)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = args.func(args, CourseTable(RECORDS))
+        return code, out.getvalue()
+
+    def test_lists_alternatives(self):
+        code, out = self.run_alternatives(['13479', '--selected', '11967-1', '13479-01'])
+        self.assertIsNone(code)
+        self.assertIn('13479 분반 5개 중 현재 선택과 겹치지 않는 분반 (3개)', out)
+        self.assertIn('새 요일 1, 새 시간 50분', out)
+        self.assertIn('시간 미정', out)
+
+    def test_unknown_ids(self):
+        self.assertEqual(self.run_alternatives(['99999'])[0], 1)
+        self.assertEqual(self.run_alternatives(['13479', '--selected', '99999-01'])[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""timeBlocks / timeRaw 일치 검사(catalog/blockcheck.py).
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from catalog import blockcheck
+from catalog.blockcheck import check_blocks, classify
+from catalog.records import CourseRecord, TimeBlock
+from catalog.timeslots import parse_time_slots
+
+TS_HEADER = "import { type Course } from '../../types/index.ts'\n\nexport const CORE_COURSES: Course[] = [\n"
+
+
+def ts_course(sid, time_raw, room_raw, blocks):
+    code, section = sid.split('-')
+    lines = ',\n'.join(f"      {{ day: '{d}', startTime: '{s}', endTime: '{e}', room: '{room}', group: {g} }}"
+                       for d, s, e, room, g in blocks)
+    return (f"  {{\n    id: '{sid}',\n    code: '{code}',\n    section: '{section}',\n    name: '과목{code}',\n"
+            f"    timeRaw: '{time_raw}',\n    roomRaw: '{room_raw}',\n    isTimeConfirmed: true,\n"
+            f"    timeBlocks: [\n{lines}\n    ],\n  }},\n")
+
+
+class ClassifyTest(unittest.TestCase):
+    def setUp(self):
+        self.derived = parse_time_slots('월1,2/수3', '060141/060142')
+
+    def test_kinds(self):
+        d = self.derived
+        self.assertIsNone(classify(tuple(d), d))
+        self.assertEqual(classify((d[0]._replace(end_time='10:15'), d[1], d[2]), d), 'time')
+        self.assertEqual(classify((d[0]._replace(room='060142'), d[1], d[2]), d), 'room')
+        self.assertEqual(classify((d[0]._replace(end_time='10:50'), d[2]), d), 'merged')
+        self.assertEqual(classify((d[2], d[0], d[1]), d), 'order')
+        self.assertEqual(classify((d[0], d[1], d[2]._replace(group=0)), d), 'group')
+        self.assertEqual(classify((), d), 'time')
+
+    def test_check_blocks_reuses_judgement(self):
+        stored = (TimeBlock('월', '09:00', '09:50', '060141', 0),)
+        records = [CourseRecord(f'1000{n}-1', time_raw='월2', room_raw='060141', time_blocks=stored)
+                   for n in range(3)]
+        records.append(CourseRecord('10009-1', time_raw='월1', room_raw='060141', time_blocks=stored))
+        issues = check_blocks(records)
+        self.assertEqual([(r.id, kind) for r, kind, _ in issues],
+                         [('10000-1', 'time'), ('10001-1', 'time'), ('10002-1', 'time')])
+        self.assertEqual(issues[0][2], parse_time_slots('월2', '060141'))
+
+
+class CheckBlocksCommandTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.tmp.name, 'core.ts'), 'w', encoding='utf-8') as f:
+            f.write(TS_HEADER)
+            f.write(ts_course('10000-1', '월1', '060141', [('월', '09:00', '09:50', '060141', 0)]))
+            f.write(ts_course('10001-1', '화1,2', '060141', [('화', '09:00', '10:50', '060141', 0)]))
+            f.write(ts_course('10002-1', '수1/목1', '060141', [('수', '09:00', '09:50', '060141', 0),
+                                                               ('목', '09:00', '09:50', '060141', 0)]))
+            f.write("]\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_check(self, argv):
+        parser = argparse.ArgumentParser()
+        blockcheck.register(parser.add_subparsers())
+        args = parser.parse_args(['check-blocks'] + argv)
+        args.courses_dir = self.tmp.name
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = args.func(args, None)
+        return code, out.getvalue()
+
+    def test_text_report(self):
+        code, out = self.run_check([])
+        self.assertEqual(code, 1)   # merged 는 기본 출력에 나오는 불일치
+        self.assertIn('검사한 과목: 3개, 불일치: 2개', out)
+        self.assertIn('[merged] 1개', out)
+        self.assertNotIn('[group]', out)
+        self.assertIn('[group]', self.run_check(['--all'])[1])
+
+    def test_json_report(self):
+        _, out = self.run_check(['--json'])
+        data = json.loads(out)
+        self.assertEqual(data['counts'], {'time': 0, 'room': 0, 'merged': 1, 'order': 0, 'group': 1})
+        self.assertEqual([(i['id'], i['kind']) for i in data['issues']], [('10001-1', 'merged'), ('10002-1', 'group')])
+
+
+if __name__ == '__main__':
+    unittest.main()
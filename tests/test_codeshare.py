@@ -0,0 +1,57 @@
+"""코드쉐어 물리 수업 묶기(catalog/codeshare.py).
+
+    python -m pytest tests
+"""
+import os
+import unittest
+
+from catalog.codeshare import SessionGroups
+from catalog.records import CourseRecord, TimeBlock
+from catalog.tsdata import load_ts_courses
+
+COURSES_DIR = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'courses')
+
+
+def course(sid, name, professor, day='화', start='09:00', end='10:15', room='050510-0', credit='3-3-0'):
+    code, section = sid.split('-')
+    return CourseRecord(sid, code=code, section=section, name=name, credit_detail=credit,
+                        professors=(professor,), time_raw=f"{day}1", room_raw=room,
+                        time_blocks=(TimeBlock(day, start, end, room, 0),), is_time_confirmed=True)
+
+
+class SessionGroupsTest(unittest.TestCase):
+    def test_same_course_same_slot_is_one_session(self):
+        sessions = SessionGroups.build([course('22437-67', '자기계발과미래설계', '고철웅'),
+                                        course('22437-125', '자기계발과 미래설계', '고 철웅')])
+        self.assertTrue(sessions.same_session('22437-67', '22437-125'))
+        self.assertEqual(sessions.canonical('22437-67'), '22437-125')
+
+    def test_different_course_same_slot_is_not_grouped(self):
+        sessions = SessionGroups.build([course('21054-01', '동아시아지역사', '이상훈'),
+                                        course('25089-13', '기업가정신', '이상훈')])
+        self.assertFalse(sessions.same_session('21054-01', '25089-13'))
+        self.assertEqual(sessions.groups, [])
+
+    def test_placeholder_professor_is_not_a_person(self):
+        sessions = SessionGroups.build([course('25525-75', '사고와글쓰기', '초빙-1'),
+                                        course('25525-76', '사고와글쓰기', '초빙-1')])
+        self.assertEqual(sessions.groups, [])
+
+    def test_same_id_in_several_lists_is_one_session(self):
+        # 10239-05 가 전공 시트와 코드쉐어 시트에 함께 나오는 경우
+        major = course('10239-05', '경영학원론', '서여주')
+        listed = course('10239-05', '경영학원론', '서여주')
+        other = course('10239-06', '경영학원론', '서여주', start='12:00', end='15:00', room='050505-0')
+        sessions = SessionGroups.build([major, listed, other])
+        self.assertTrue(sessions.same_session('10239-05', '10239-05'))
+        self.assertFalse(sessions.same_session('10239-05', '10239-06'))
+
+    def test_catalog_groups(self):
+        sessions = SessionGroups.build(load_ts_courses(COURSES_DIR, use_cache=False))
+        self.assertTrue(sessions.same_session('22437-67', '22437-125'))
+        for a, b in (('21054-01', '25089-13'), ('25525-75', '25595-37'), ('24191-1', '24194-01')):
+            self.assertFalse(sessions.same_session(a, b), (a, b))
+
+
+if __name__ == '__main__':
+    unittest.main()
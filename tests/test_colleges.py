@@ -0,0 +1,132 @@
+"""단과대학/학과 표준 사전 검증(catalog/colleges.py).
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from catalog import colleges
+from catalog.colleges import (MISMATCH, NONCANONICAL, UNKNOWN, CollegeDirectory, college_key,
+                              load_college_departments, validate)
+from catalog.records import CourseRecord, asset_fingerprint
+
+DICTIONARY = """/** 단과대학 → 학과 매핑 */
+export const COLLEGE_DEPARTMENTS: Record<string, string[]> = {
+  '스마트융합대학': [
+    '컴퓨터공학과',
+    '수학과',
+  ],
+  '생명ㆍ나노과학대학': ['간호학과', '화학과'],
+}
+"""
+TS_HEADER = "import { type Course } from '../../types/index.ts'\n\nexport const CORE_COURSES: Course[] = [\n"
+
+
+def course(sid, college, department):
+    code, section = sid.split('-')
+    return CourseRecord(sid, code=code, section=section, college=college, department=department)
+
+
+class CollegeDirectoryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'collegeDepartments.ts')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(DICTIONARY)
+        self.directory = CollegeDirectory.load(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_load(self):
+        self.assertEqual(load_college_departments(self.path),
+                         {'스마트융합대학': ('컴퓨터공학과', '수학과'), '생명ㆍ나노과학대학': ('간호학과', '화학과')})
+        self.assertEqual(college_key('생명.나노과학대학'), college_key('생명·나노 과학대학'))
+
+    def test_repo_dictionary(self):
+        directory = CollegeDirectory.load()
+        self.assertIn('스마트융합대학', directory.colleges)
+        self.assertEqual(directory.colleges_of['컴퓨터공학과'], ['스마트융합대학'])
+
+    def test_check_kinds(self):
+        check = self.directory.check
+        self.assertEqual(check('스마트융합대학', '컴퓨터공학과, 수학과'), [])
+        self.assertEqual(check('모든 대학', '모든 학과'), [])
+        [(field, _, kind, message)] = check('생명.나노과학대학', '')
+        self.assertEqual((field, kind), ('단과대학', NONCANONICAL))
+        self.assertIn("'생명ㆍ나노과학대학'", message)
+        self.assertEqual([p[2] for p in check('스마트융합대학', '우주공학과')], [UNKNOWN])
+        self.assertEqual([p[2] for p in check('스마트융합대학', '간호학과')], [MISMATCH])
+        # 여러 대학이 이어진 값에서는 학과가 그중 하나에 속하면 된다
+        self.assertEqual(check('스마트융합대학, 생명ㆍ나노과학대학', '간호학과'), [])
+        # 줄바꿈으로 이은 값은 ', ' 표준 표기와 다르다
+        self.assertEqual([p[2] for p in check('스마트융합대학\n\n생명ㆍ나노과학대학', '간호학과')], [NONCANONICAL])
+
+    def test_check_is_cached_per_value(self):
+        records = [course(f'1000{n}-01', '스마트융합대학', '간호학과') for n in range(5)]
+        found = validate(self.directory, [('TS core.ts', records)])
+        self.assertEqual(len(self.directory.checked), 1)
+        [(problem, places)] = found.items()
+        self.assertEqual(problem[2], MISMATCH)
+        self.assertEqual(len(places), 5)
+
+    def test_to_json(self):
+        data = self.directory.to_json([course('10000-01', '생명.나노과학대학, 스마트융합대학', ''),
+                                       course('10001-01', '없는대학', ''), course('10002-01', '', '')])
+        self.assertEqual(data['names'], ['스마트융합대학', '생명ㆍ나노과학대학'])
+        self.assertEqual(data['sections'], {'10000-01': [1, 0]})
+        self.assertEqual(data['fingerprints'], {'10000-01': asset_fingerprint('생명.나노과학대학, 스마트융합대학')})
+
+
+class CollegesCommandTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dictionary = os.path.join(self.tmp.name, 'collegeDepartments.ts')
+        with open(self.dictionary, 'w', encoding='utf-8') as f:
+            f.write(DICTIONARY)
+        self.courses = os.path.join(self.tmp.name, 'courses')
+        os.mkdir(self.courses)
+        with open(os.path.join(self.courses, 'core.ts'), 'w', encoding='utf-8') as f:
+            f.write(TS_HEADER)
+            f.write("  { id: '10000-01', code: '10000', college: '스마트융합대학', department: '컴퓨터공학과' },\n")
+            f.write("  { id: '10001-01', code: '10001', college: '생명.나노과학대학', department: '화학과' },\n")
+            f.write("  { id: '10002-01', code: '10002', college: '스마트융합대학', department: '화학과' },\n")
+            f.write("]\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_colleges(self, argv):
+        parser = argparse.ArgumentParser()
+        colleges.register(parser.add_subparsers())
+        args = parser.parse_args(['colleges', '--dictionary', self.dictionary] + argv)
+        args.courses_dir = self.courses
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = args.func(args, None)
+        return code, out.getvalue()
+
+    def test_check(self):
+        code, out = self.run_colleges(['check', '--no-excel'])
+        self.assertEqual(code, 1)
+        self.assertIn('검사: 3행, 서로 다른 값 3개, 문제 2종', out)
+        self.assertIn('[표기] 1종', out)
+        self.assertIn('[소속] 1종', out)
+        self.assertIn('TS core.ts 10002-01', out)
+
+    def test_emit(self):
+        path = os.path.join(self.tmp.name, 'data', 'colleges.json')
+        code, out = self.run_colleges(['emit', '--out', path])
+        self.assertEqual(code, 0)
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['sections'], {'10000-01': [0], '10001-01': [1], '10002-01': [0]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""분반 시간 충돌 인접 정보(catalog/conflicts.py).
+
+무작위 분반들에서 sweep 으로 만든 인접 정보를 마스크 전수 비교와 대조한다.
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from catalog import conflicts
+from catalog.conflicts import ConflictIndex, decode_bitset, encode_bitset
+from catalog.records import CourseRecord, CourseTable
+from catalog.timeslots import course_mask, parse_time_slots
+
+
+def section(sid, time_raw, confirmed=True):
+    code, number = sid.split('-')
+    return CourseRecord(sid, code=code, section=number, name=f'과목{code}', time_raw=time_raw,
+                        time_blocks=tuple(parse_time_slots(time_raw, '')), is_time_confirmed=confirmed)
+
+
+def random_sections(rng, n):
+    records = []
+    for i in range(n):
+        parts = []
+        for _ in range(rng.randint(1, 2)):
+            day = rng.choice('월화수')
+            if rng.random() < 0.3:
+                parts.append(day + rng.choice('ABCD'))
+            else:
+                first = rng.randint(1, 8)
+                parts.append(day + ','.join(str(p) for p in range(first, first + rng.randint(1, 3))))
+        records.append(section(f'{20000 + i}-1', '/'.join(parts), confirmed=rng.random() > 0.1))
+    return records
+
+
+class ConflictIndexTest(unittest.TestCase):
+    def test_matches_mask_comparison(self):
+        rng = random.Random(30)
+        for trial in range(10):
+            records = random_sections(rng, 60)
+            index = ConflictIndex.build(records)
+            with self.subTest(trial=trial):
+                for r in records:
+                    mask = course_mask(r)
+                    expected = sorted(o.id for o in records if o.id != r.id and mask & course_mask(o))
+                    self.assertEqual(sorted(index.conflicts(r.id)), expected)
+
+    def test_adjacent_periods_do_not_conflict(self):
+        index = ConflictIndex.build([section('10000-1', '월1'), section('10001-1', '월2'),
+                                     section('10002-1', '월A')])
+        self.assertEqual(index.conflicts('10000-1'), ['10002-1'])
+        self.assertEqual(sorted(index.conflicts('10002-1')), ['10000-1', '10001-1'])
+
+    def test_unconfirmed_section_has_no_conflicts(self):
+        index = ConflictIndex.build([section('10000-1', '월1'), section('10001-1', '월1', confirmed=False)])
+        self.assertEqual(index.conflicts('10001-1'), [])
+        self.assertEqual(index.conflicts('10000-1'), [])
+
+    def test_json_round_trip(self):
+        records = random_sections(random.Random(1), 40)
+        index = ConflictIndex.build(records)
+        loaded = ConflictIndex.from_json(json.loads(json.dumps(index.to_json())))
+        for r in records:
+            self.assertEqual(sorted(loaded.conflicts(r.id)), sorted(index.conflicts(r.id)))
+        self.assertEqual(loaded.fingerprints, index.fingerprints)
+
+    def test_bitset(self):
+        self.assertEqual(decode_bitset(encode_bitset({0, 3, 8, 17}, 18), 18), {0, 3, 8, 17})
+        self.assertEqual(decode_bitset(encode_bitset(set(), 0), 0), set())
+
+
+class ConflictsCommandTest(unittest.TestCase):
+    RECORDS = [section('10000-1', '월1'), section('10001-1', '월1,2'), section('10002-1', '화1')]
+
+    def run_conflicts(self, argv):
+        parser = argparse.ArgumentParser()
+        conflicts.register(parser.add_subparsers())
+        args = parser.parse_args(['conflicts'] + argv)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = args.func(args, CourseTable(self.RECORDS))
+        return code, out.getvalue()
+
+    def test_show(self):
+        code, out = self.run_conflicts(['show', '10000-01'])
+        self.assertIsNone(code)
+        self.assertIn('겹치는 분반 (1개)', out)
+        self.assertIn('10001-1', out)
+        self.assertEqual(self.run_conflicts(['show', '99999-1'])[0], 1)
+
+    def test_emit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data', 'conflicts.json')
+            _, out = self.run_conflicts(['emit', '--out', path])
+            with open(path, encoding='utf-8') as f:
+                index = ConflictIndex.from_json(json.load(f))
+        self.assertIn('분반 3개, 시간 패턴 3개', out)
+        self.assertEqual(index.conflicts('10001-1'), ['10000-1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
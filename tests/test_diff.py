@@ -0,0 +1,83 @@
+"""엑셀-TS 레코드 비교(catalog/diff.py)와 과목 지문.
+
+    python -m pytest tests
+"""
+import unittest
+
+from catalog.diff import diff_by_fingerprint, diff_views, field_changes
+from catalog.records import CourseRecord, CourseTable
+
+
+def course(sid, name='선형대수학I', time_raw='월1,2', room='090408', professors=('김교수',),
+           credit='3-3-0', **kwargs):
+    code, section = sid.split('-')
+    return CourseRecord(sid, code=code, section=section, name=name, time_raw=time_raw, room_raw=room,
+                        professors=professors, credit_detail=credit, **kwargs)
+
+
+class FingerprintTest(unittest.TestCase):
+    def test_normalized_fields_share_fingerprint(self):
+        base = course('11967-01')
+        self.assertEqual(base.fingerprint, course('11967-01', name='선형대수학Ⅰ').fingerprint)
+        self.assertEqual(course('11967-01', time_raw='월1/화2').fingerprint,
+                         course('11967-01', time_raw='월1,화2').fingerprint)
+        self.assertEqual(base.fingerprint, course('11967-01', professors=('김 교수',)).fingerprint)
+        for changed in (course('11967-01', room='090409'), course('11967-01', credit='3-2-1'),
+                        course('11967-01', time_raw='월1,3')):
+            self.assertNotEqual(base.fingerprint, changed.fingerprint)
+
+
+class FieldChangesTest(unittest.TestCase):
+    def test_reports_each_field(self):
+        changes = field_changes(course('11967-01', name='선형대수학II', room='090409', credit='3-2-1'),
+                                course('11967-01'))
+        self.assertEqual(changes, ["name: '선형대수학I'->'선형대수학II'", "roomRaw: '090408'->'090409'",
+                                   "creditDetail: '3-3-0'->'3-2-1'"])
+
+    def test_one_side_without_professor_is_not_a_change(self):
+        self.assertEqual(field_changes(course('11967-01', professors=()), course('11967-01')), [])
+        self.assertEqual(field_changes(course('11967-01', professors=('이교수',)), course('11967-01')),
+                         ["professor: '김교수'->'이교수'"])
+
+    def test_online_fields_only_when_excel_has_them(self):
+        src = course('90001-01', organizer='교수학습원격교육센터')
+        self.assertEqual(field_changes(course('90001-01'), src), [])
+        self.assertEqual(field_changes(course('90001-01', organizer='다른센터', capacity='40'), src),
+                         ["capacity: ''->'40'", "organizer: '교수학습원격교육센터'->'다른센터'"])
+
+
+class DiffViewsTest(unittest.TestCase):
+    def setUp(self):
+        self.excel = CourseTable([course('11967-01'), course('11967-02', room='090409'),
+                                  course('13479-01', name='채플'), course('20000-01', professors=())])
+        self.src = CourseTable([course('11967-1'), course('11967-2'), course('20000-1'),
+                                course('99999-1', name='TS 에만')])
+
+    def test_diff(self):
+        result = diff_views(self.excel, self.src)
+        self.assertEqual(result.missing, {'13479-01'})
+        self.assertEqual(result.extra, {'99999-01'})
+        self.assertEqual(result.diffs, [('11967-02', ["roomRaw: '090408'->'090409'"])])
+        # 지문은 다르지만 (교수명 한쪽 빈 값) 필드 비교에서는 같은 과목
+        self.assertEqual(result.unchanged, 2)
+
+    def test_only_given_ids(self):
+        result = diff_views(self.excel, self.src, ids=['11967-01', '13479-01'])
+        self.assertEqual((result.missing, result.extra, result.diffs, result.unchanged),
+                         ({'13479-01'}, set(), [], 1))
+
+    def test_reads_excel_record_only_when_fingerprint_differs(self):
+        excel_by_id = self.excel.by_id()
+        read = []
+
+        def excel_record(cid):
+            read.append(cid)
+            return excel_by_id[cid]
+
+        diff_by_fingerprint({cid: r.fingerprint for cid, r in excel_by_id.items()},
+                            self.src.by_id(normalize=True), excel_record)
+        self.assertEqual(read, ['11967-02', '20000-01'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Arrow/Parquet 내보내기(catalog/export.py). pyarrow 가 없으면 건너뛴다.
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from urllib.parse import quote
+
+from catalog import export
+from catalog.records import CourseRecord, CourseTable
+from catalog.timeslots import parse_time_slots
+
+try:
+    import pyarrow
+    import pyarrow.dataset as ds
+except ImportError:
+    pyarrow = None
+
+
+def course(sid, name, category, time_raw, room='060141', professors=('김교수',), microdegrees=()):
+    code, section = sid.split('-')
+    return CourseRecord(sid, code=code, section=section, name=name, category=category, credits=3,
+                        professors=professors, time_raw=time_raw, room_raw=room,
+                        time_blocks=tuple(parse_time_slots(time_raw, room)), is_time_confirmed=True,
+                        microdegree_names=microdegrees)
+
+
+CURRENT = [course('11967-01', '선형대수학', '전필', '화3,4'),
+           course('13479-01', '채플', '교필(문화)', '화2', professors=()),
+           course('20000-01', '자료구조', '전선', '월A/수A', professors=('김교수', '박교수'),
+                  microdegrees=('생성형AI',))]
+PREVIOUS = [course('11967-01', '선형대수학', '전필', '목3,4')]
+
+
+class CourseColumnsTest(unittest.TestCase):
+    def test_rows(self):
+        courses, blocks = export.course_columns([('2026-1', CURRENT), ('2025-2', PREVIOUS)])
+        self.assertEqual(courses['id'], ['11967-01', '13479-01', '20000-01', '11967-01'])
+        self.assertEqual(courses['category_group'], ['전필', '교필', '전선', '전필'])
+        self.assertEqual(courses['professors'][2], ['김교수', '박교수'])
+        self.assertEqual(courses['microdegree_names'][2], ['생성형AI'])
+        self.assertEqual(len(blocks['id']), 7)
+        self.assertEqual(blocks['id'][3:5], ['20000-01', '20000-01'])
+        self.assertEqual((blocks['start_minute'][3], blocks['end_minute'][3]), (9 * 60, 10 * 60 + 15))
+        self.assertEqual(blocks['semester'][-1], '2025-2')
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow 가 없습니다')
+class ExportTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_dictionary_columns(self):
+        course_table, block_table = export.build_tables([('2026-1', CURRENT)])
+        self.assertTrue(pyarrow.types.is_dictionary(course_table.schema.field('category').type))
+        self.assertTrue(pyarrow.types.is_dictionary(block_table.schema.field('day').type))
+        self.assertEqual(course_table.schema.field('credits').type, pyarrow.int8())
+        self.assertEqual(course_table.num_rows, 3)
+        self.assertEqual(block_table.num_rows, 5)
+
+    def test_partitioned_round_trip(self):
+        for fmt in sorted(export.FORMATS):
+            with self.subTest(format=fmt):
+                out = os.path.join(self.tmp.name, fmt)
+                tables = export.build_tables([('2026-1', CURRENT), ('2025-2', PREVIOUS)])
+                sizes = export.write_tables(*tables, out, fmt)
+                self.assertGreater(sizes['courses'], 0)
+                # 파티션 폴더 이름은 URL 인코딩된다 (category_group=%EC%A0%84%ED%95%84)
+                partition = os.path.join(out, 'courses', 'semester=2026-1', 'category_group=' + quote('전필'))
+                self.assertTrue(os.path.isdir(partition))
+                dataset = ds.dataset(os.path.join(out, 'time_blocks'), format=export.FORMATS[fmt],
+                                     partitioning='hive')
+                rows = dataset.to_table(filter=ds.field('semester') == '2025-2').to_pylist()
+                self.assertEqual([(r['id'], r['day'], r['start_time']) for r in rows],
+                                 [('11967-01', '목', '11:00'), ('11967-01', '목', '12:00')])
+
+    def test_command(self):
+        parser = argparse.ArgumentParser()
+        export.register(parser.add_subparsers())
+        out = os.path.join(self.tmp.name, 'export')
+        args = parser.parse_args(['export', '--out', out, '--semester', '2026-1'])
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            code = args.func(args, CourseTable(CURRENT))
+        self.assertEqual(code, 0)
+        self.assertIn('courses 3행', buf.getvalue())
+        self.assertIn('time_blocks 5행', buf.getvalue())
+        # 같은 폴더로 다시 내보내면 이번 카탈로그에 없는 파티션도 남지 않는다
+        with contextlib.redirect_stdout(io.StringIO()):
+            args.func(args, CourseTable(CURRENT[:1]))
+        table = ds.dataset(os.path.join(out, 'courses'), partitioning='hive').to_table()
+        self.assertEqual(table.column('id').to_pylist(), ['11967-01'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""위시리스트 시간표 조합 수 세기(catalog/feasible.py).
+
+작은 무작위 위시리스트에서 DP 결과를 분반 조합 전수 탐색과 비교하고,
+상태 한도를 넘겨 추정으로 바뀌었을 때 구간/상한이 정확한 값을 담는지 본다.
+
+    python -m pytest tests
+"""
+import itertools
+import random
+import unittest
+
+from catalog.feasible import (Course, chunk_upper_bound, components, count_feasible, order_courses,
+                              sample_count, wishlist_courses)
+from catalog.records import CourseRecord, CourseTable
+from catalog.timeslots import course_mask, parse_time_slots
+
+
+def section(sid, time_raw, confirmed=True):
+    code, number = sid.split('-')
+    return CourseRecord(sid, code=code, section=number, name=f'과목{code}', time_raw=time_raw,
+                        time_blocks=tuple(parse_time_slots(time_raw, '')), is_time_confirmed=confirmed)
+
+
+def random_wishlist(rng, n_courses, max_sections):
+    courses = []
+    for n in range(n_courses):
+        code = str(20000 + n)
+        sections = []
+        for s in range(rng.randint(1, max_sections)):
+            first = rng.randint(1, 6)
+            length = rng.randint(1, 2)
+            sections.append(section(f'{code}-{s + 1}', rng.choice('월화수') + ','.join(
+                str(p) for p in range(first, first + length)), confirmed=rng.random() > 0.05))
+        courses.append(Course(code, f'과목{code}', sections))
+    return courses
+
+
+def compatible(records):
+    mask = 0
+    for r in records:
+        m = course_mask(r)
+        if mask & m:
+            return False
+        mask |= m
+    return True
+
+
+def brute_force(courses):
+    return sum(1 for combo in itertools.product(*(c.sections for c in courses)) if compatible(combo))
+
+
+class ExactCountTest(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(20260302)
+        for trial in range(40):
+            courses = random_wishlist(rng, rng.randint(1, 6), 4)
+            with self.subTest(trial=trial):
+                result = count_feasible(courses)
+                expected = brute_force(courses)
+                self.assertTrue(result.exact)
+                self.assertEqual(result.count, expected)
+                self.assertEqual((result.low, result.high, result.upper), (expected,) * 3)
+                self.assertGreaterEqual(chunk_upper_bound(order_courses(courses), chunk_states=3), expected)
+
+    def test_reports_match_brute_force(self):
+        rng = random.Random(7)
+        for trial in range(15):
+            courses = random_wishlist(rng, 4, 3)
+            result = count_feasible(courses)
+            component_of = {c.key: group for group in components(courses) for c in group}
+            for c, report in zip(courses, result.reports):
+                # without 은 같은 연결 요소 안에서 c 를 뺀 조합 수다
+                others = [o for o in component_of[c.key] if o is not c]
+                with self.subTest(trial=trial, course=c.key):
+                    self.assertEqual(report.without, brute_force(others))
+                    live = sum(1 for s in c.sections
+                               if any(compatible(combo + (s,))
+                                      for combo in itertools.product(*(o.sections for o in others))))
+                    self.assertEqual(report.live_sections, live)
+
+    def test_no_combination(self):
+        courses = [Course('20000', 'A', [section('20000-1', '월1')]),
+                   Course('20001', 'B', [section('20001-1', '월1'), section('20001-2', '월1,2')])]
+        result = count_feasible(courses)
+        self.assertEqual(result.count, 0)
+        self.assertEqual([r.without for r in result.reports], [2, 1])
+        self.assertEqual([r.bottleneck for r in result.reports], [1.0, 1.0])
+
+
+class EstimateTest(unittest.TestCase):
+    def setUp(self):
+        self.courses = random_wishlist(random.Random(11), 6, 5)
+        self.exact = brute_force(self.courses)
+
+    def test_sampled_interval_contains_exact(self):
+        # deadline 0 이면 min_samples 까지만 뽑으므로 seed 가 같으면 결과도 같다
+        mean, error, samples = sample_count(order_courses(self.courses), random.Random(0), 0, min_samples=4096)
+        self.assertEqual(samples, 4096)
+        self.assertGreater(self.exact, 0)
+        self.assertLessEqual(mean - 1.96 * error, self.exact)
+        self.assertGreaterEqual(mean + 1.96 * error, self.exact)
+
+    def test_state_limit_switches_to_estimate(self):
+        result = count_feasible(self.courses, max_states=1, budget=0.2)
+        self.assertFalse(result.exact)
+        self.assertGreater(result.samples, 0)
+        self.assertLessEqual(result.low, result.count)
+        self.assertLessEqual(result.count, result.high)
+        self.assertLessEqual(result.high, result.upper)
+        self.assertGreaterEqual(result.upper, self.exact)
+
+
+class WishlistTest(unittest.TestCase):
+    def test_code_and_fixed_section(self):
+        catalog = CourseTable([section('13479-01', '화2'), section('13479-02', '목2'),
+                               section('11967-01', '화2')])
+        courses = wishlist_courses(catalog, ['13479', '11967-1'])
+        self.assertEqual([c.size for c in courses], [2, 1])
+        self.assertEqual(count_feasible(courses).count, 1)
+        with self.assertRaises(ValueError):
+            wishlist_courses(catalog, ['99999'])
+
+
+if __name__ == '__main__':
+    unittest.main()
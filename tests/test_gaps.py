@@ -0,0 +1,111 @@
+"""저장 시간표 빈 시간 추천(catalog/gaps.py).
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from catalog import gaps
+from catalog.gaps import PatternIndex, touching_edges
+from catalog.records import CourseRecord, CourseTable
+from catalog.timeslots import course_mask, parse_time_slots
+
+
+def section(sid, time_raw, category='전선', credits=3, confirmed=True):
+    code, number = sid.split('-')
+    return CourseRecord(sid, code=code, section=number, name=f'과목{code}', category=category,
+                        credits=credits, time_raw=time_raw, time_blocks=tuple(parse_time_slots(time_raw, '')),
+                        is_time_confirmed=confirmed)
+
+
+def literal(record):
+    """SavedTimetable 의 selectedCourses[].course 형태"""
+    return {'id': record.id, 'code': record.code, 'section': record.section, 'name': record.name,
+            'category': record.category, 'credits': record.credits, 'timeRaw': record.time_raw,
+            'isTimeConfirmed': record.is_time_confirmed,
+            'timeBlocks': [{'day': b.day, 'startTime': b.start_time, 'endTime': b.end_time,
+                            'room': b.room, 'group': b.group} for b in record.time_blocks]}
+
+
+RECORDS = [
+    section('10000-1', '월1'), section('10001-1', '월2'), section('10002-1', '월3'),
+    section('10003-1', '월A'), section('10004-1', '화2', category='교선', credits=2),
+    section('10005-1', '', confirmed=False), section('10005-2', '월2'),
+]
+
+
+class PatternIndexTest(unittest.TestCase):
+    def test_touching_edges(self):
+        busy = course_mask(RECORDS[0])
+        self.assertEqual(touching_edges(course_mask(RECORDS[1]), busy), 1)   # 쉬는 시간 10분
+        self.assertEqual(touching_edges(course_mask(RECORDS[2]), busy), 0)
+        # 월2 를 월1 과 월3 사이에 넣으면 앞뒤 두 경계가 붙는다
+        self.assertEqual(touching_edges(course_mask(RECORDS[1]), busy | course_mask(RECORDS[2])), 2)
+
+    def test_fitting_order(self):
+        index = PatternIndex.build(RECORDS)
+        busy = course_mask(RECORDS[0])
+        found = [(c.record.id, c.new_days, c.touching) for c in index.fitting(busy, exclude_codes={'10000'})]
+        self.assertEqual(found, [('10001-1', 0, 1), ('10005-2', 0, 1), ('10002-1', 0, 0), ('10004-1', 1, 0)])
+
+    def test_matches_mask_comparison(self):
+        rng = random.Random(32)
+        records = [section(f'{20000 + i}-1', rng.choice('월화수') + str(rng.randint(1, 9))) for i in range(50)]
+        index = PatternIndex.build(records)
+        for _ in range(20):
+            busy = 0
+            for r in rng.sample(records, 4):
+                busy |= course_mask(r)
+            expected = sorted(r.id for r in records if not course_mask(r) & busy)
+            self.assertEqual(sorted(c.record.id for c in index.fitting(busy)), expected)
+
+
+class FillCommandTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'saved.json')
+        timetables = [
+            {'id': 'a', 'name': '1안', 'updatedAt': '2026-02-01',
+             'selectedCourses': [{'course': literal(RECORDS[0])}]},
+            {'id': 'b', 'name': '2안', 'updatedAt': '2026-02-03',
+             'selectedCourses': [{'course': literal(RECORDS[0])}, {'course': literal(RECORDS[1])}]},
+        ]
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(timetables, f, ensure_ascii=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_fill(self, argv):
+        parser = argparse.ArgumentParser()
+        gaps.register(parser.add_subparsers())
+        args = parser.parse_args(['fill', self.path] + argv)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = args.func(args, CourseTable(RECORDS))
+        return code, out.getvalue()
+
+    def test_latest_timetable_by_default(self):
+        code, out = self.run_fill([])
+        self.assertIsNone(code)
+        self.assertIn("'2안' (2과목) 빈 시간에 들어가는 분반: 2개", out)
+        self.assertIn('10002-1', out)
+        self.assertNotIn('10005-2', out)
+
+    def test_named_timetable_and_filter(self):
+        _, out = self.run_fill(['--timetable', '1안', '--category', '교선'])
+        self.assertIn("'1안' (1과목) 빈 시간에 들어가는 분반: 1개", out)
+        self.assertIn('10004-1', out)
+
+    def test_unknown_timetable(self):
+        self.assertEqual(self.run_fill(['--timetable', '없음'])[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
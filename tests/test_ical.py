@@ -0,0 +1,189 @@
+"""iCalendar 일괄 내보내기(catalog/ical.py).
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from catalog import ical
+from catalog.ical import IcsWriter, Semester, escape_text, fold, recurrence
+from catalog.records import CourseRecord, CourseTable
+from catalog.timeslots import parse_time_slots
+
+STAMP = '20260101T000000Z'
+# 2026-03-02 는 월요일
+SEMESTER = Semester(datetime.date(2026, 3, 2), datetime.date(2026, 3, 20), [datetime.date(2026, 3, 9)])
+
+
+def section(sid, time_raw, room='N101', department='컴퓨터공학과', confirmed=True):
+    code, number = sid.split('-')
+    return CourseRecord(sid, code=code, section=number, name=f'과목{code}', department=department,
+                        professors=('홍길동',), category='전필', time_raw=time_raw,
+                        time_blocks=tuple(parse_time_slots(time_raw, room)), is_time_confirmed=confirmed)
+
+
+def literal(record):
+    """SavedTimetable 의 selectedCourses[].course 형태"""
+    return {'id': record.id, 'code': record.code, 'section': record.section, 'name': record.name,
+            'timeRaw': record.time_raw, 'isTimeConfirmed': record.is_time_confirmed,
+            'timeBlocks': [{'day': b.day, 'startTime': b.start_time, 'endTime': b.end_time,
+                            'room': b.room, 'group': b.group} for b in record.time_blocks]}
+
+
+def events(text):
+    """VEVENT 별 {속성: 값}"""
+    found, current = [], None
+    for line in text.replace('\r\n ', '').split('\r\n'):
+        if line == 'BEGIN:VEVENT':
+            current = {}
+        elif line == 'END:VEVENT':
+            found.append(current)
+            current = None
+        elif current is not None and ':' in line:
+            key, value = line.split(':', 1)
+            current[key] = value
+    return found
+
+
+RECORDS = [
+    section('10000-1', '월1,2'),
+    section('10001-1', '수3', room='S201', department='수학과'),
+    section('10002-1', '', confirmed=False),
+]
+
+
+class RecurrenceTest(unittest.TestCase):
+    def test_weekly_rule_and_holiday(self):
+        lines = recurrence(SEMESTER.key(), '월', '09:00', '10:50')
+        self.assertEqual(lines, (
+            'DTSTART;TZID=Asia/Seoul:20260302T090000',
+            'DTEND;TZID=Asia/Seoul:20260302T105000',
+            # 3월 20일 23:59:59 KST = 14:59:59 UTC
+            'RRULE:FREQ=WEEKLY;BYDAY=MO;UNTIL=20260320T145959Z',
+            'EXDATE;TZID=Asia/Seoul:20260309T090000',
+        ))
+        # 휴강일이 다른 요일이면 EXDATE 가 없고, 첫 수업은 그 주의 해당 요일
+        lines = recurrence(SEMESTER.key(), '수', '11:00', '11:50')
+        self.assertEqual(lines[0], 'DTSTART;TZID=Asia/Seoul:20260304T110000')
+        self.assertEqual(len(lines), 3)
+
+    def test_day_outside_semester(self):
+        short = Semester(datetime.date(2026, 3, 2), datetime.date(2026, 3, 3))
+        self.assertEqual(recurrence(short.key(), '금', '09:00', '09:50'), ())
+
+    def test_invalid_semester(self):
+        with self.assertRaises(ValueError):
+            Semester(datetime.date(2026, 6, 1), datetime.date(2026, 3, 2))
+
+
+class TextTest(unittest.TestCase):
+    def test_escape(self):
+        self.assertEqual(escape_text('a,b;c\\d\ne'), 'a\\,b\\;c\\\\d\\ne')
+
+    def test_fold_keeps_utf8(self):
+        line = 'SUMMARY:' + '가' * 40
+        folded = fold(line)
+        parts = folded.split('\r\n ')
+        self.assertGreater(len(parts), 1)
+        self.assertEqual(''.join(parts), line)
+        self.assertTrue(all(len(p.encode('utf-8')) <= 75 for p in parts))
+        self.assertEqual(fold('SUMMARY:짧은 줄'), 'SUMMARY:짧은 줄')
+
+
+class IcsWriterTest(unittest.TestCase):
+    def test_add_record(self):
+        f = io.StringIO()
+        writer = IcsWriter(f, '시간표, 1안', STAMP)
+        self.assertEqual(writer.add_record(RECORDS[0], SEMESTER), 2)  # 교시마다 블록 하나
+        self.assertEqual(writer.add_record(RECORDS[2], SEMESTER), 0)  # 시간 미확정
+        writer.close()
+        text = f.getvalue()
+        self.assertTrue(text.startswith('BEGIN:VCALENDAR\r\n'))
+        self.assertTrue(text.endswith('END:VCALENDAR\r\n'))
+        self.assertIn('X-WR-CALNAME:시간표\\, 1안\r\n', text)
+        event, second = events(text)
+        self.assertEqual(second['UID'], '10000-1-1-MO1000@hnu-timetable')
+        self.assertEqual(event['UID'], '10000-1-0-MO0900@hnu-timetable')
+        self.assertEqual(event['DTSTAMP'], STAMP)
+        self.assertEqual(event['SUMMARY'], '과목10000 (10000-1)')
+        self.assertEqual(event['LOCATION'], 'N101')
+        self.assertEqual(event['DESCRIPTION'], '홍길동 / 전필 / 월1\\,2')
+        self.assertEqual(event['DTEND;TZID=Asia/Seoul'], '20260302T095000')
+
+
+class CommandTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = os.path.join(self.tmp.name, 'ical')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_ical(self, argv):
+        parser = argparse.ArgumentParser()
+        ical.register(parser.add_subparsers())
+        args = parser.parse_args(['ical', '--start', '2026-03-02', '--end', '2026-03-20',
+                                  '--holiday', '2026-03-09', '--out', self.out] + argv)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = args.func(args, CourseTable(RECORDS))
+        return code, out.getvalue()
+
+    def read(self, name):
+        with open(os.path.join(self.out, name), 'r', encoding='utf-8', newline='') as f:
+            return f.read()
+
+    def test_sections(self):
+        code, out = self.run_ical(['sections'])
+        self.assertEqual(code, 0)
+        self.assertIn('.ics 3개, 반복 일정 3개', out)
+        self.assertEqual(sorted(os.listdir(self.out)), ['10000-1.ics', '10001-1.ics', '10002-1.ics'])
+        [event] = events(self.read('10001-1.ics'))
+        self.assertEqual(event['LOCATION'], 'S201')
+        self.assertEqual(event['RRULE'], 'FREQ=WEEKLY;BYDAY=WE;UNTIL=20260320T145959Z')
+        self.assertEqual(events(self.read('10002-1.ics')), [])
+
+    def test_sections_by_department(self):
+        code, out = self.run_ical(['sections', '--by', 'department'])
+        self.assertEqual(code, 0)
+        self.assertEqual(sorted(os.listdir(self.out)), ['수학과.ics', '컴퓨터공학과.ics'])
+        self.assertEqual(len(events(self.read('컴퓨터공학과.ics'))), 2)
+
+    def test_timetables_use_current_catalog(self):
+        # 저장 당시엔 화요일이었던 10000-1 이 지금 카탈로그에선 월요일이다
+        stale = literal(section('10000-1', '화1,2'))
+        saved = [{'id': 'a', 'name': '1안', 'selectedCourses': [{'course': stale}]},
+                 {'id': 'b', 'name': '1안', 'selectedCourses': [{'course': literal(RECORDS[1])}]}]
+        path = os.path.join(self.tmp.name, 'user.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(saved, f, ensure_ascii=False)
+        broken = os.path.join(self.tmp.name, 'broken.json')
+        with open(broken, 'w', encoding='utf-8') as f:
+            f.write('{')
+        code, out = self.run_ical(['timetables', path, broken])
+        self.assertEqual(code, 0)
+        self.assertIn('.ics 2개, 반복 일정 3개', out)
+        self.assertIn('[읽기 실패]', out)
+        # 같은 이름의 시간표는 번호를 붙여 따로 쓴다
+        self.assertEqual(sorted(os.listdir(self.out)), ['user-1안.ics', 'user-1안_2.ics'])
+        self.assertEqual([e['RRULE'].split(';')[1] for e in events(self.read('user-1안.ics'))],
+                         ['BYDAY=MO', 'BYDAY=MO'])
+
+    def test_invalid_semester(self):
+        parser = argparse.ArgumentParser()
+        ical.register(parser.add_subparsers())
+        args = parser.parse_args(['ical', '--start', '2026-06-01', '--end', '2026-03-02',
+                                  '--out', self.out, 'sections'])
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(args.func(args, CourseTable(RECORDS)), 2)
+        self.assertFalse(os.path.exists(self.out))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""마이크로디그리 소속 인덱스(catalog/microdegrees.py).
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from catalog import microdegrees
+from catalog.microdegrees import MicrodegreeIndex, diff_indexes, normalize_microdegree
+from catalog.records import CourseRecord, CourseTable
+from catalog.snapshot import write_snapshot
+
+MD_HEADER = ['마이크로디그리 명', '학수번호', '교과목명', '분반', '학-강-실', '학년', '이수구분', '담당교원',
+             '강의시간', '강의실', '비고']
+
+
+def course(sid, name, microdegree_names=()):
+    code, section = sid.split('-')
+    return CourseRecord(sid, code=code, section=section, name=name, category='전선', time_raw='월1',
+                        microdegree_names=microdegree_names)
+
+
+def md_row(microdegree, code, section, name):
+    return [microdegree, code, name, section, '3-3-0', '2', '전선', '김교수', '월1', '060141', '']
+
+
+TS_RECORDS = [
+    course('25001-1', '생성형AI기초', ('생성형AI 마이크로디그리',)),
+    course('25001-2', '생성형AI기초', ('생성형AI 마이크로디그리',)),
+    course('25002-01', '데이터시각화', ('생성형AI 마이크로디그리', '데이터ㆍ분석 마이크로디그리')),
+    course('25003-01', '통계학', ('데이터·분석 마이크로디그리',)),
+    course('10000-01', '채플'),
+]
+EXCEL_ROWS = [
+    md_row(' 생성형AI  마이크로디그리', '25001', '01', '생성형AI기초'),
+    md_row('생성형AI 마이크로디그리', '25001', '02', '생성형AI기초'),
+    md_row('데이터‧분석 마이크로디그리', '25002', '01', '데이터시각화'),
+    md_row('데이터·분석 마이크로디그리', '25004', '01', '머신러닝'),
+]
+
+
+class MicrodegreeIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = MicrodegreeIndex.build(TS_RECORDS)
+
+    def test_normalize(self):
+        self.assertEqual(normalize_microdegree(' 데이터ㆍ분석   마이크로디그리 '), '데이터·분석 마이크로디그리')
+
+    def test_members_and_reverse(self):
+        self.assertEqual(self.index.names, ['데이터·분석 마이크로디그리', '생성형AI 마이크로디그리'])
+        self.assertEqual(self.index.members('생성형AI  마이크로디그리'), ('25001-01', '25001-02', '25002-01'))
+        self.assertEqual(self.index.microdegrees_of('25002-1'),
+                         ('데이터·분석 마이크로디그리', '생성형AI 마이크로디그리'))
+        self.assertEqual(self.index.microdegrees_of('10000-01'), ())
+        self.assertEqual(self.index.counts()['생성형AI 마이크로디그리'], (3, 2))
+
+    def test_find_ignores_spaces(self):
+        self.assertEqual(self.index.find('생성형 AI'), ['생성형AI 마이크로디그리'])
+        self.assertEqual(len(self.index.find('마이크로디그리')), 2)
+        self.assertEqual(self.index.find('없음'), [])
+
+    def test_json_round_trip(self):
+        loaded = MicrodegreeIndex.from_json(json.loads(json.dumps(self.index.to_json())))
+        self.assertEqual(loaded.sections, self.index.sections)
+        self.assertEqual(loaded.by_section, self.index.by_section)
+
+    def test_diff(self):
+        other = MicrodegreeIndex.build(TS_RECORDS[:2] + [course('25002-01', '데이터시각화', ('생성형AI 마이크로디그리',))])
+        self.assertEqual(diff_indexes(self.index, other),
+                         [('25002-01', ['데이터·분석 마이크로디그리'], []),
+                          ('25003-01', ['데이터·분석 마이크로디그리'], [])])
+
+
+class MicrodegreesCommandTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.excel = os.path.join(self.tmp.name, 'excel_data.json')
+        write_snapshot({'마이크로디그리': [MD_HEADER] + EXCEL_ROWS}, self.excel)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_md(self, argv):
+        parser = argparse.ArgumentParser()
+        microdegrees.register(parser.add_subparsers())
+        args = parser.parse_args(['microdegrees', '--excel', self.excel] + argv)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = args.func(args, CourseTable(TS_RECORDS))
+        return code, out.getvalue()
+
+    def test_list_and_show(self):
+        code, out = self.run_md(['list'])
+        self.assertEqual(code, 0)
+        self.assertIn('마이크로디그리 2개, 분반 4개', out)
+        code, out = self.run_md(['show', '생성형AI'])
+        self.assertIn('[생성형AI 마이크로디그리] 분반 2개', out)
+        self.assertIn('25001-02   생성형AI기초', out)
+        _, out = self.run_md(['show', '데이터'])
+        self.assertIn('25004-01   (카탈로그에 없음)', out)
+        self.assertEqual(self.run_md(['show', '없음'])[0], 1)
+
+    def test_check(self):
+        code, out = self.run_md(['check'])
+        self.assertEqual(code, 1)
+        self.assertIn('엑셀/TS 소속이 다른 분반: 3개', out)
+        self.assertIn('25002-01   엑셀에 없음: 생성형AI 마이크로디그리', out)
+        self.assertIn('25004-01   TS 에 없음: 데이터·분석 마이크로디그리', out)
+
+    def test_emit_ts(self):
+        path = os.path.join(self.tmp.name, 'data', 'microdegrees.json')
+        code, out = self.run_md(['--ts', 'emit', '--out', path])
+        self.assertEqual(code, 0)
+        self.assertIn('마이크로디그리 2개, 분반 4개', out)
+        with open(path, encoding='utf-8') as f:
+            loaded = MicrodegreeIndex.from_json(json.load(f))
+        self.assertEqual(loaded.sections, MicrodegreeIndex.build(TS_RECORDS).sections)
+
+if __name__ == '__main__':
+    unittest.main()
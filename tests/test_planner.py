@@ -0,0 +1,142 @@
+"""학점 요건 시간표 조합 탐색(catalog/planner.py).
+
+작은 무작위 카탈로그에서 분기 한정 탐색의 최적 점수가 전수 탐색과 같은지 본다.
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import random
+import unittest
+
+from catalog import planner
+from catalog.planner import Planner, Target, parse_target
+from catalog.records import CourseRecord, CourseTable
+from catalog.timeslots import course_mask, parse_time_slots
+
+CATEGORIES = ('전필', '전선', '교선')
+
+
+def course(sid, category, credits, time_raw, department='경영학과'):
+    code, section = sid.split('-')
+    return CourseRecord(sid, code=code, section=section, name=f'과목{code}', department=department,
+                        category=category, credit_detail=f'{credits}-{credits}-0', credits=credits,
+                        time_raw=time_raw, time_blocks=tuple(parse_time_slots(time_raw, '')),
+                        is_time_confirmed=True)
+
+
+def random_catalog(rng, n_codes=7):
+    records = []
+    for n in range(n_codes):
+        category = rng.choice(CATEGORIES)
+        credits = rng.choice((1, 2, 3))
+        for s in range(rng.randint(1, 2)):
+            day = rng.choice('월화수')
+            first = rng.randint(1, 5)
+            periods = ','.join(str(p) for p in range(first, first + credits))
+            records.append(course(f'{20000 + n}-{s + 1}', category, credits, f'{day}{periods}'))
+    return records
+
+
+def brute_force_best(records, targets, max_credits):
+    """학수번호마다 분반 하나 또는 건너뛰기를 모두 시도한 최대 점수 (조합이 없으면 None)"""
+    by_code = {}
+    for r in records:
+        by_code.setdefault(r.code, [None]).append(r)
+    best = None
+    for choice in itertools.product(*by_code.values()):
+        chosen = [r for r in choice if r is not None]
+        if not valid(chosen, targets, max_credits):
+            continue
+        score = sum(r.credits for r in chosen)
+        best = score if best is None else max(best, score)
+    return best
+
+
+def valid(chosen, targets, max_credits):
+    mask = 0
+    for r in chosen:
+        m = course_mask(r)
+        if mask & m:
+            return False
+        mask |= m
+    if sum(r.credits for r in chosen) > max_credits:
+        return False
+    for t in targets:
+        hit = [r for r in chosen if t.category is None or r.category.startswith(t.category)]
+        amount = len(hit) if t.unit == 'sections' else sum(r.credits for r in hit)
+        if amount < t.amount:
+            return False
+    return True
+
+
+class PlannerTest(unittest.TestCase):
+    def test_parse_target(self):
+        self.assertEqual(parse_target('전필=9'), Target('전필', 9, 'credits'))
+        self.assertEqual(parse_target('교필(영성)=1개'), Target('교필(영성)', 1, 'sections'))
+        with self.assertRaises(ValueError):
+            parse_target('전필9')
+
+    def test_best_plan_matches_brute_force(self):
+        rng = random.Random(20260302)
+        for trial in range(30):
+            records = random_catalog(rng)
+            targets = [Target('전필', rng.choice((0, 2, 3, 4)), 'credits'),
+                       Target('교선', rng.choice((0, 1)), 'sections')]
+            max_credits = rng.choice((6, 9, 12))
+            with self.subTest(trial=trial):
+                plans, complete = Planner(records, targets, max_credits).search(k=3, time_budget=10)
+                self.assertTrue(complete)
+                expected = brute_force_best(records, targets, max_credits)
+                if expected is None:
+                    self.assertEqual(plans, [])
+                    continue
+                self.assertEqual(plans[0].score, expected)
+                for plan in plans:
+                    self.assertTrue(valid(plan.records, targets, max_credits))
+                    self.assertEqual(plan.credits, sum(r.credits for r in plan.records))
+                self.assertEqual([p.score for p in plans], sorted((p.score for p in plans), reverse=True))
+
+    def test_required_code_is_always_in_plan(self):
+        records = [course('13479-01', '교필(문화)', 0, '화2'), course('20000-1', '전필', 3, '화1,2,3'),
+                   course('20001-1', '전필', 3, '월1,2,3')]
+        plans, _ = Planner(records, [Target('전필', 3, 'credits')], 6, required=['13479']).search()
+        self.assertTrue(plans)
+        for plan in plans:
+            self.assertIn('13479-01', [r.id for r in plan.records])
+            self.assertNotIn('20000-1', [r.id for r in plan.records])
+
+
+class PlanCommandTest(unittest.TestCase):
+    def run_plan(self, argv, records):
+        parser = argparse.ArgumentParser()
+        planner.register(parser.add_subparsers())
+        args = parser.parse_args(['plan'] + argv)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = args.func(args, CourseTable(records))
+        return code, out.getvalue()
+
+    def test_need_category_outside_department_is_a_candidate(self):
+        records = [course('13479-01', '교필(문화)', 0, '화2', department=''),
+                   course('20000-1', '전필', 3, '월1,2,3', department='컴퓨터공학과, 산업경영공학과'),
+                   course('20001-1', '전필', 3, '수1,2,3', department='기계공학과'),
+                   course('20002-1', '전선', 3, '목1,2,3', department='기계공학과')]
+        code, out = self.run_plan(['--department', '컴퓨터공학과', '--need', '전필=6',
+                                   '--require', '13479', '--top', '1'], records)
+        self.assertEqual(code, None)
+        self.assertIn('20000-1', out)
+        self.assertIn('20001-1', out)
+        self.assertNotIn('20002-1', out)
+
+    def test_unreachable_need_reports_no_plan(self):
+        records = [course('20000-1', '전필', 3, '월1,2,3')]
+        code, out = self.run_plan(['--need', '전필=6'], records)
+        self.assertEqual(code, 1)
+        self.assertIn('요건을 만족하는 조합이 없습니다', out)
+
+
+if __name__ == '__main__':
+    unittest.main()
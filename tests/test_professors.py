@@ -0,0 +1,109 @@
+"""교수 인덱스와 부담/중복 배정(catalog/professors.py).
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import unittest
+
+from catalog import professors
+from catalog.professors import PERSON, UNIT, VACANCY, ProfessorIndex, professor_key, professor_keys
+from catalog.records import CourseRecord, CourseTable
+from catalog.timeslots import parse_time_slots
+
+
+def course(sid, name, professors, time_raw, room='060141'):
+    code, section = sid.split('-')
+    return CourseRecord(sid, code=code, section=section, name=name, credit_detail='3-3-0',
+                        professors=professors, time_raw=time_raw, room_raw=room,
+                        time_blocks=tuple(parse_time_slots(time_raw, room)), is_time_confirmed=True)
+
+
+RECORDS = [
+    course('11967-01', '선형대수학', ('김 교수',), '화1,2'),
+    course('11967-02', '선형대수학', ('김교수',), '목1,2', room='060142'),
+    # 코드쉐어: 다른 학수번호, 같은 과목/시간/강의실/교수 -> 한 수업
+    course('22437-67', '자기계발과미래설계', ('김교수',), '금1'),
+    course('22437-125', '자기계발과 미래설계', ('김교수',), '금1'),
+    # 같은 시간의 다른 과목 -> 중복 배정
+    course('20000-01', '자료구조', ('김교수',), '화2', room='090410'),
+    # 교수진이 같은 공동 강의끼리 겹침 -> 팀 겹침
+    course('21683-01', '캡스톤디자인', ('박교수, 이교수',), '수1,2', room='090320'),
+    course('21683-02', '캡스톤디자인', ('박교수', '이교수'), '수1,2', room='090321'),
+    course('13479-01', '채플', ('선교훈련팀',), '화2'),
+    course('13479-02', '채플', ('선교훈련팀',), '화2'),
+    course('25525-75', '사고와글쓰기', ('초빙-1',), '월1'),
+    course('25525-76', '사고와글쓰기', ('#N/A',), '월1'),
+]
+
+
+class ProfessorKeyTest(unittest.TestCase):
+    def test_kinds(self):
+        self.assertEqual(professor_key('마리나 위옹'), ('마리나위옹', PERSON))
+        self.assertEqual(professor_key('선교훈련팀'), ('선교훈련팀', UNIT))
+        self.assertEqual(professor_key('취업창업처5'), ('취업창업처', UNIT))
+        self.assertEqual(professor_key('초빙-1'), ('초빙-1', VACANCY))
+        self.assertEqual(professor_key('채용예정 신임교원'), ('채용예정신임교원', VACANCY))
+        for empty in ('', '0', '#N/A', '미정', ' '):
+            self.assertIsNone(professor_key(empty))
+
+    def test_keys_split_cells(self):
+        self.assertEqual(professor_keys(RECORDS[5]), [('박교수', PERSON), ('이교수', PERSON)])
+        self.assertEqual(professor_keys(RECORDS[10]), [])
+
+
+class ProfessorIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = ProfessorIndex.build(RECORDS)
+
+    def test_load(self):
+        kim = self.index.get('김 교수')
+        self.assertEqual(kim.sections, ['11967-01', '11967-02', '22437-67', '22437-125', '20000-01'])
+        # 화1,2 + 목1,2 + 금1 (코드쉐어 한 번) + 화2 = 6교시
+        self.assertEqual(kim.minutes, 6 * 50)
+        self.assertEqual(kim.day_string(), '화목금')
+        self.assertEqual(kim.rooms, {'060141', '060142', '090410'})
+        self.assertEqual(self.index.get('박교수').team, 2)
+        self.assertEqual(self.index.get('박교수').rooms, {'090320', '090321'})
+        self.assertEqual([e.name for e in self.index.load()], ['김교수', '박교수', '이교수'])
+        self.assertEqual(sorted((e.kind, e.name) for e in self.index.placeholders()),
+                         [(UNIT, '선교훈련팀'), (VACANCY, '초빙-1')])
+
+    def test_clashes(self):
+        clashes, team = self.index.clashes()
+        self.assertEqual(clashes, [('김교수', '11967-01', '20000-01')])
+        self.assertEqual(team, [(('박교수', '이교수'), '21683-01', '21683-02')])
+
+
+class ProfessorsCommandTest(unittest.TestCase):
+    def run_professors(self, argv):
+        parser = argparse.ArgumentParser()
+        professors.register(parser.add_subparsers())
+        args = parser.parse_args(['professors'] + argv)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = args.func(args, CourseTable(RECORDS))
+        return code, out.getvalue()
+
+    def test_load(self):
+        code, out = self.run_professors(['load', '--top', '1'])
+        self.assertEqual(code, 0)
+        self.assertIn('교수 3명, 기관/미정 이름 2개', out)
+        self.assertIn('김교수', out)
+        self.assertNotIn('박교수', out)
+        self.assertIn('[기관] 선교훈련팀', out)
+
+    def test_show_and_clashes(self):
+        code, out = self.run_professors(['show', '김 교수'])
+        self.assertEqual(code, 0)
+        self.assertIn('김교수 (교수): 분반 5개 (공동 0), 주간 5.0h, 요일 화목금', out)
+        self.assertEqual(self.run_professors(['show', '없는교수'])[0], 1)
+        code, out = self.run_professors(['clashes'])
+        self.assertEqual(code, 1)
+        self.assertIn('[교수 중복 배정] 1건', out)
+        self.assertIn('[팀 겹침] 교수진이 같은 공동 강의 1쌍', out)
+
+
+if __name__ == '__main__':
+    unittest.main()
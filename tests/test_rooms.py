@@ -0,0 +1,86 @@
+"""강의실 점유 인덱스(catalog/rooms.py).
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from catalog import rooms
+from catalog.records import CourseRecord, CourseTable
+from catalog.rooms import RoomIndex, load_rooms_asset, split_rooms
+from catalog.timeslots import parse_time_slots, range_mask
+
+
+def course(sid, time_raw, room_raw):
+    code, section = sid.split('-')
+    return CourseRecord(sid, code=code, section=section, name='과목', credit_detail='3-3-0',
+                        professors=('홍길동',), time_raw=time_raw, room_raw=room_raw,
+                        time_blocks=tuple(parse_time_slots(time_raw, room_raw)),
+                        is_time_confirmed=True)
+
+
+class SplitRoomsTest(unittest.TestCase):
+    def test_split(self):
+        self.assertEqual(split_rooms('090320,090410'), ['090320', '090410'])
+        self.assertEqual(split_rooms('560705 / 560402'), ['560705', '560402'])
+        self.assertEqual(split_rooms('060335-0'), ['060335'])
+        self.assertEqual(split_rooms('미정'), [])
+        self.assertEqual(split_rooms(''), [])
+
+
+class RoomIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = RoomIndex.build([course('14314-6', '월2,3/화7', '090320,090410'),
+                                      course('14314-7', '수1', '090520-0')])
+
+    def test_comma_joined_room_occupies_each_room(self):
+        self.assertEqual(self.index.rooms(), ['090320', '090410', '090520'])
+        monday = range_mask('월', 10 * 60, 11 * 60)
+        self.assertEqual(self.index.free_rooms(monday), ['090520'])
+        self.assertEqual(self.index.occupants('090410', monday), [('월', '10:00', '10:50')])
+
+    def test_free_rooms(self):
+        wednesday = range_mask('수', 9 * 60, 10 * 60)
+        self.assertEqual(self.index.free_rooms(wednesday), ['090320', '090410'])
+        self.assertEqual(self.index.free_rooms(wednesday, building='09'), ['090320', '090410'])
+
+    def test_json_round_trip(self):
+        self.assertEqual(RoomIndex.from_json(self.index.to_json()).masks, self.index.masks)
+
+
+class CommandTest(unittest.TestCase):
+    RECORDS = [course('14314-6', '월2,3/화7', '090320,090410'), course('14314-7', '수1', '090520-0'),
+               course('14314-8', '월2', '060335')]
+
+    def run_rooms(self, argv):
+        parser = argparse.ArgumentParser()
+        rooms.register(parser.add_subparsers())
+        args = parser.parse_args(['rooms'] + argv)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            args.func(args, CourseTable(self.RECORDS))
+        return out.getvalue()
+
+    def test_free(self):
+        self.assertEqual(self.run_rooms(['free', '월2']).splitlines(), ['월2 빈 강의실 (1개):', '  090520'])
+        self.assertEqual(self.run_rooms(['free', '수1', '--building', '09']).splitlines(),
+                         ['수1 빈 강의실 (2개):', '  090320', '  090410'])
+
+    def test_util(self):
+        lines = self.run_rooms(['util', '--top', '2']).splitlines()
+        self.assertEqual([line.split()[0] for line in lines], ['090320', '090410'])
+        self.assertEqual(self.run_rooms(['util', '--building', '06']).split()[0], '060335')
+
+    def test_emit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data', 'rooms.json')
+            self.assertEqual(self.run_rooms(['emit', '--out', path]), f"{path}: 강의실 4개\n")
+            self.assertEqual(load_rooms_asset(path).masks, RoomIndex.build(self.RECORDS).masks)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""시트 헤더 컬럼 추론(catalog/schema.py).
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from catalog import schema
+from catalog.schema import SchemaError, infer_columns, header_signature, sheet_schema
+from catalog.sheets import SHEET_COLUMNS, parse_sheet
+from catalog.snapshot import Snapshot, write_snapshot
+
+EXCEL_PATH = os.path.join(os.path.dirname(__file__), '..', 'excel_data.json')
+
+GYOPIL_HEADER = ['과목명', '이수구분', '학수번호', '분반', '학점-강의-실습', '단과대학', '[학부]학과',
+                 '수강대상 학년', '담당교수', '강의시간', '강의실']
+GYOPIL_ROW = ['채플', '교필(문화)', '13479', '01', 'P-1-0', '모든 대학', '모든 학과', '1', '선교훈련팀',
+              '화2', '060141(성지관)']
+
+
+def moved(row):
+    """강의시간/강의실을 앞으로 옮기고 모르는 열을 하나 끼운 순서"""
+    return row[9:11] + ['메모'] + row[:9]
+
+
+class SheetSchemaTest(unittest.TestCase):
+    def test_repo_snapshot_matches_expected_layout(self):
+        with Snapshot(EXCEL_PATH) as snap:
+            for name, expected in SHEET_COLUMNS.items():
+                with self.subTest(sheet=name):
+                    result = sheet_schema(name, snap[name][:5], expected)
+                    self.assertEqual(result.changes, [])
+                    self.assertEqual(result.columns, expected['columns'])
+
+    def test_header_signature_ignores_spaces_and_trailing_blanks(self):
+        self.assertEqual(header_signature([' 과목 명', '학수번호', None, '']), ('과목명', '학수번호'))
+        self.assertIs(infer_columns(('과목명', '학수번호')), infer_columns(('과목명', '학수번호')))
+
+    def test_moved_columns(self):
+        rows = [['2026학년도 1학기'], moved(GYOPIL_HEADER), moved(GYOPIL_ROW)]
+        result = sheet_schema('교필', rows, SHEET_COLUMNS['교필'])
+        self.assertEqual(result.header_row, 1)
+        self.assertEqual(result.unknown, ('메모',))
+        self.assertEqual(result.columns['time_raw'], 0)
+        self.assertIn('time_raw: 9 -> 0', result.changes)
+        [record] = parse_sheet('교필', rows)
+        [expected] = parse_sheet('교필', [[], GYOPIL_HEADER, GYOPIL_ROW])
+        self.assertEqual(record.fingerprint, expected.fingerprint)
+        self.assertEqual((record.id, record.time_raw, record.room_raw), ('13479-01', '화2', '060141(성지관)'))
+
+    def test_without_header_uses_fixed_columns(self):
+        result = sheet_schema('교필', [GYOPIL_ROW], SHEET_COLUMNS['교필'])
+        self.assertIsNone(result.header_row)
+        self.assertEqual(result.columns, SHEET_COLUMNS['교필']['columns'])
+        with self.assertRaises(SchemaError):
+            sheet_schema('교필', [GYOPIL_ROW])
+
+    def test_missing_required_column(self):
+        with self.assertRaises(SchemaError):
+            sheet_schema('교필', [GYOPIL_HEADER[1:]], SHEET_COLUMNS['교필'])
+
+
+class SchemaCommandTest(unittest.TestCase):
+    def run_schema(self, sheets):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'excel_data.json')
+            write_snapshot(sheets, path)
+            parser = argparse.ArgumentParser()
+            schema.register(parser.add_subparsers())
+            args = parser.parse_args(['schema', '--excel', path])
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                code = args.func(args, None)
+        return code, out.getvalue()
+
+    def test_reports_changes_and_missing_sheets(self):
+        code, out = self.run_schema({'교필': [moved(GYOPIL_HEADER), moved(GYOPIL_ROW)]})
+        self.assertEqual(code, 1)
+        self.assertIn('[교필] 헤더 0행: time_raw=0, room_raw=1', out)
+        self.assertIn('알 수 없는 헤더: 메모', out)
+        self.assertIn('위치 변경: time_raw: 9 -> 0', out)
+        self.assertIn('[교선] 시트가 없습니다', out)
+
+    def test_repo_snapshot_is_clean(self):
+        with open(EXCEL_PATH, encoding='utf-8') as f:
+            sheets = json.load(f)
+        code, out = self.run_schema({name: rows[:3] for name, rows in sheets.items()})
+        self.assertEqual(code, 0)
+        self.assertNotIn('위치 변경', out)
+
+
+if __name__ == '__main__':
+    unittest.main()
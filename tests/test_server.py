@@ -0,0 +1,133 @@
+"""카탈로그 질의 서비스(catalog/server.py).
+
+    python -m pytest tests
+"""
+import asyncio
+import json
+import unittest
+
+from catalog.records import CourseRecord, CourseTable
+from catalog.server import CatalogIndex, CatalogService, handle_connection
+from catalog.timeslots import course_mask, parse_period_query, parse_time_slots
+
+
+def course(sid, name, time_raw, room, category='전선', year='2', credits=3, professors=('김교수',)):
+    code, section = sid.split('-')
+    return CourseRecord(sid, code=code, section=section, name=name, category=category, year=year,
+                        credits=credits, professors=professors, time_raw=time_raw, room_raw=room,
+                        time_blocks=tuple(parse_time_slots(time_raw, room)), is_time_confirmed=True)
+
+
+RECORDS = [
+    course('11967-01', '선형대수학', '화3,4', '060335-0', category='전필'),
+    course('11967-02', '선형대수학', '목3,4', '060335'),
+    course('13479-01', '채플', '화2', '060141', category='교필(문화)', year='1,2,3,4', credits=0,
+           professors=('선교훈련팀',)),
+    course('14314-06', '글쓰기', '월2,3/화7', '090320,090410', category='교필', year='1', professors=('이교수',)),
+    course('20000-01', '자료구조', '화4,5', '090410', year='2,3', professors=('김교수', '박교수')),
+]
+
+
+class CatalogServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.service = CatalogService(CatalogIndex(CourseTable(RECORDS)), cache_size=4)
+
+    def get(self, target):
+        status, body = self.service.respond(target)
+        return status, json.loads(body)
+
+    def ids(self, target):
+        status, data = self.get(target)
+        self.assertEqual(status, 200, data)
+        return [c['id'] for c in data['courses']]
+
+    def test_search_filters(self):
+        self.assertEqual(self.ids('/search?q=선형'), ['11967-01', '11967-02'])
+        self.assertEqual(self.ids('/search?category=교필'), ['13479-01', '14314-06'])
+        self.assertEqual(self.ids('/search?category=전필&category=교필'), ['11967-01', '13479-01', '14314-06'])
+        self.assertEqual(self.ids('/search?year=3&credits=3'), ['20000-01'])
+        self.assertEqual(self.ids('/search?professor=박교수'), ['20000-01'])
+        self.assertEqual(self.ids('/search?room=060335'), ['11967-01', '11967-02'])
+        # 쉼표로 이어진 강의실은 각 강의실로 찾는다
+        self.assertEqual(self.ids('/search?room=090320'), ['14314-06'])
+        self.assertEqual(self.ids('/search?room=090410'), ['14314-06', '20000-01'])
+        self.assertEqual(self.ids('/search?when=화3-5'), ['11967-01', '20000-01'])
+        self.assertEqual(self.ids('/search?limit=2'), ['11967-01', '11967-02'])
+        self.assertEqual(self.get('/search?limit=2')[1]['total'], 5)
+
+    def test_when_matches_mask_comparison(self):
+        for query in ('월1-3', '화2', '화3-7', '목A', '금1-9'):
+            mask = parse_period_query(query)
+            expected = sorted(r.id for r in RECORDS if course_mask(r) & mask)
+            self.assertEqual(self.ids(f'/search?when={query}'), expected)
+
+    def test_course_and_conflicts(self):
+        self.assertEqual(self.get('/course?id=11967-1')[1]['course']['name'], '선형대수학')
+        self.assertIsNone(self.get('/course?id=99999-01')[1]['course'])
+        self.assertEqual(self.get('/conflicts?id=11967-01')[1]['conflicts'], ['20000-01'])
+        self.assertEqual(self.get('/conflicts?id=14314-06')[1]['conflicts'], [])
+        self.assertEqual(self.get('/conflicts?ids=11967-01,13479-01,20000-01,99999-01')[1],
+                         {'conflicts': [['11967-01', '20000-01']], 'missing': ['99999-01']})
+        self.assertEqual(self.get('/conflicts?ids=13479-01&ids=14314-06')[1]['conflicts'], [])
+
+    def test_free_rooms(self):
+        self.assertEqual(self.get('/rooms/free?when=화3')[1]['rooms'], ['060141', '090320', '090410'])
+        self.assertEqual(self.get('/rooms/free?when=화7&building=09')[1]['rooms'], [])
+
+    def test_errors(self):
+        self.assertEqual(self.get('/nope')[0], 404)
+        for target in ('/search?limit=0', '/search?credits=x', '/search?when=화99',
+                       '/course', '/conflicts', '/rooms/free'):
+            with self.subTest(target=target):
+                status, data = self.get(target)
+                self.assertEqual(status, 400)
+                self.assertIn('error', data)
+
+    def test_cache(self):
+        first = self.service.respond('/search?year=2&q=선형')
+        self.assertIs(self.service.respond('/search?q=선형&year=2'), first)
+        for n in range(5):
+            self.service.respond(f'/course?id={n}')
+        stats = self.get('/stats')[1]['cache']
+        self.assertEqual((stats['size'], stats['hits'], stats['misses']), (4, 1, 6))
+
+
+class HttpTest(unittest.TestCase):
+    def exchange(self, payload):
+        """서버를 띄우고 payload 를 보낸 뒤 연결이 닫힐 때까지 받은 바이트"""
+        service = CatalogService(CatalogIndex(CourseTable(RECORDS)))
+
+        async def go():
+            server = await asyncio.start_server(lambda r, w: handle_connection(service, r, w), '127.0.0.1', 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                writer.write(payload)
+                await writer.drain()
+                data = await asyncio.wait_for(reader.read(), 5)
+                writer.close()
+                return data
+
+        return asyncio.run(go())
+
+    def test_keep_alive_then_close(self):
+        data = self.exchange(b'GET /course?id=13479-01 HTTP/1.1\r\nHost: x\r\n\r\n'
+                             b'HEAD /stats HTTP/1.1\r\nConnection: close\r\n\r\n')
+        first, second = data.split(b'HTTP/1.1 ')[1:]
+        self.assertTrue(first.startswith(b'200 OK'))
+        self.assertIn(b'Connection: keep-alive', first)
+        self.assertIn('채플'.encode('utf-8'), first)
+        self.assertIn(b'Connection: close', second)
+        self.assertTrue(second.endswith(b'\r\n\r\n'))   # HEAD 는 본문이 없다
+
+    def test_rejects_other_methods_and_bad_length(self):
+        data = self.exchange(b'POST /search HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}'
+                             b'GET /stats HTTP/1.1\r\nContent-Length: -1\r\n\r\n')
+        first, second = data.split(b'HTTP/1.1 ')[1:]
+        self.assertTrue(first.startswith(b'405'))
+        self.assertTrue(second.startswith(b'400'))
+        self.assertIn(b'Connection: close', second)
+
+
+if __name__ == '__main__':
+    unittest.main()
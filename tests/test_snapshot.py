@@ -0,0 +1,61 @@
+"""excel_data.json 지연 로딩(catalog/snapshot.py).
+
+    python -m pytest tests
+"""
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from catalog.snapshot import Snapshot, index_path_for, write_snapshot
+
+SHEETS = {
+    '기타': [['한 칸', 1, 2.5, True, None]],
+    '빈 시트': [],
+    '메모': [['가', '나'], ['다']],
+}
+
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'excel_data.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_matches_json_dump(self):
+        write_snapshot(SHEETS, self.path)
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), json.dumps(SHEETS, ensure_ascii=False, indent=2))
+        with Snapshot(self.path) as snap:
+            self.assertEqual(snap.sheet_names, list(SHEETS))
+            self.assertEqual(snap['메모'][1], ['다'])
+            self.assertEqual(list(snap['기타']), SHEETS['기타'])
+            self.assertEqual(snap['메모'][0:2], SHEETS['메모'])
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['excel_data.index.json', 'excel_data.json'])
+
+    def test_interrupted_write_keeps_previous_files(self):
+        write_snapshot(SHEETS, self.path)
+        with open(index_path_for(self.path), 'rb') as f:
+            index = f.read()
+        with mock.patch('catalog.snapshot.os.replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                write_snapshot({'메모': [['바뀜']]}, self.path)
+        with open(index_path_for(self.path), 'rb') as f:
+            self.assertEqual(f.read(), index)
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['excel_data.index.json', 'excel_data.json'])
+        with Snapshot(self.path) as snap:
+            self.assertEqual(list(snap['메모']), SHEETS['메모'])
+
+    def test_stale_index_is_rebuilt(self):
+        write_snapshot(SHEETS, self.path)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'메모': [['새 행']]}, f, ensure_ascii=False, indent=2)
+        with Snapshot(self.path) as snap:
+            self.assertEqual(list(snap['메모']), [['새 행']])
+
+
+if __name__ == '__main__':
+    unittest.main()
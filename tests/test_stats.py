@@ -0,0 +1,88 @@
+"""카탈로그 통계(catalog/stats.py). numpy 가 없으면 건너뛴다.
+
+    python -m pytest tests
+"""
+import argparse
+import contextlib
+import io
+import json
+import unittest
+
+from catalog import stats
+from catalog.records import CourseRecord, CourseTable
+from catalog.timeslots import parse_time_slots
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def course(sid, category, credits, time_raw, college='공과대학', confirmed=True):
+    code, section = sid.split('-')
+    return CourseRecord(sid, code=code, section=section, name=f'과목{code}', college=college,
+                        category=category, credits=credits, time_raw=time_raw,
+                        time_blocks=tuple(parse_time_slots(time_raw, '')), is_time_confirmed=confirmed)
+
+
+RECORDS = [
+    course('10000-1', '전필', 3, '월1,2/수1'),
+    course('10001-1', '교필(문화)', 0, '월1'),
+    course('10002-1', '교선', 2, '화A', college='인문대학'),
+    course('10003-1', '전필', 3, '월1', confirmed=False),
+    course('10004-1', '전선', 3, ''),
+]
+
+
+@unittest.skipIf(numpy is None, 'numpy 가 없습니다')
+class StatsReportTest(unittest.TestCase):
+    def setUp(self):
+        self.data = stats.report([CourseTable(RECORDS)])
+
+    def test_day_period_heatmap(self):
+        monday = self.data['dayPeriod']['월']
+        self.assertEqual(monday['1'], 2)   # 시간 미확정 분반은 빠진다
+        self.assertEqual(monday['2'], 1)
+        self.assertEqual(self.data['dayPeriod']['수']['1'], 1)
+        # 화A (09:00~10:15) 는 50분제 1, 2교시에 걸친다
+        self.assertEqual(self.data['dayPeriod']['화']['1'], 1)
+        self.assertEqual(self.data['dayPeriod']['화']['2'], 1)
+        self.assertEqual(sum(sum(p.values()) for p in self.data['dayPeriod'].values()), 6)
+
+    def test_credit_distribution(self):
+        self.assertEqual(self.data['sections'], 5)
+        self.assertEqual(self.data['creditsByCategory'],
+                         {'전필': {'3': 2}, '교필': {'0': 1}, '교선': {'2': 1}, '전선': {'3': 1}})
+
+    def test_block_kinds_by_college(self):
+        self.assertEqual(self.data['blockKindsByCollege']['공과대학'], {'50분': 4, '75분': 0, '기타': 0})
+        self.assertEqual(self.data['blockKindsByCollege']['인문대학'], {'50분': 0, '75분': 1, '기타': 0})
+
+    def test_several_semesters(self):
+        data = stats.report([CourseTable(RECORDS, semester='26-1'), CourseTable(RECORDS[:2], semester='25-2')])
+        self.assertEqual(data['semesters'], {'26-1': 5, '25-2': 2})
+        self.assertEqual(data['dayPeriod']['월']['1'], 4)
+
+
+@unittest.skipIf(numpy is None, 'numpy 가 없습니다')
+class StatsCommandTest(unittest.TestCase):
+    def run_stats(self, argv):
+        parser = argparse.ArgumentParser()
+        stats.register(parser.add_subparsers())
+        args = parser.parse_args(['stats'] + argv)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            args.func(args, CourseTable(RECORDS))
+        return out.getvalue()
+
+    def test_json_output(self):
+        self.assertEqual(json.loads(self.run_stats(['--json'])), stats.report([CourseTable(RECORDS)]))
+
+    def test_text_output(self):
+        out = self.run_stats([])
+        self.assertIn('분반 수: 5', out)
+        self.assertIn('[이수구분별 학점 분포]', out)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""강의시간 파싱(catalog/timeslots.py)과 앱 파서(src/utils/parseTimeSlots.ts) 대조.
+
+두 파서는 src/utils/parseTimeSlots.cases.ts 의 같은 사례를 읽는다 (앱 쪽은 parseTimeSlots.test.ts).
+
+    python -m pytest tests
+"""
+import os
+import unittest
+
+from catalog.timeslots import blocks_mask, parse_time_slots, period_time
+from catalog.tsdata import parse_ts_const
+
+CASES_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'utils', 'parseTimeSlots.cases.ts')
+
+
+def load_cases():
+    with open(CASES_PATH, encoding='utf-8') as f:
+        return parse_ts_const(f.read(), 'TIME_SLOT_CASES')
+
+
+class ParseTimeSlotsTest(unittest.TestCase):
+    def test_shared_cases(self):
+        cases = load_cases()
+        self.assertTrue(cases)
+        for case in cases:
+            with self.subTest(time=case['time'], room=case['room']):
+                got = [{'day': b.day, 'startTime': b.start_time, 'endTime': b.end_time,
+                        'room': b.room, 'group': b.group}
+                       for b in parse_time_slots(case['time'], case['room'])]
+                self.assertEqual(got, case['blocks'])
+
+    def test_period_like_parse_int(self):
+        self.assertEqual(period_time(' 1'), ('09:00', '09:50'))
+        self.assertEqual(period_time('2교시'), ('10:00', '10:50'))
+        self.assertIsNone(period_time('-1'))
+        self.assertIsNone(period_time('14'))
+        self.assertEqual(period_time('b'), period_time('B'))
+
+    def test_adjacent_blocks_do_not_overlap(self):
+        first = blocks_mask(parse_time_slots('월1', ''))
+        self.assertFalse(first & blocks_mask(parse_time_slots('월2', '')))
+        self.assertTrue(first & blocks_mask(parse_time_slots('월A', '')))
+
+
+if __name__ == '__main__':
+    unittest.main()
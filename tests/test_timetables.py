@@ -0,0 +1,79 @@
+"""저장 시간표 일괄 분석(catalog/timetables.py).
+
+    python -m pytest tests
+"""
+import json
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+from catalog.records import CourseRecord, TimeBlock
+from catalog.timetables import analyze_file, catalog_summary, count_capped
+
+MON_1 = TimeBlock('월', '09:00', '09:50', '060141', 0)
+MON_A = TimeBlock('월', '09:00', '10:15', '060142', 0)
+
+CATALOG = catalog_summary([
+    CourseRecord('11967-01', time_blocks=(MON_1,), is_time_confirmed=True),
+    CourseRecord('13479-01', time_blocks=(MON_A,), is_time_confirmed=True),
+])
+
+
+def saved(*courses):
+    return {'id': 't', 'name': '시간표', 'selectedCourses': [{'course': c} for c in courses]}
+
+
+def block(b):
+    return {'day': b.day, 'startTime': b.start_time, 'endTime': b.end_time}
+
+
+class AnalyzeFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, data):
+        path = os.path.join(self.tmp.name, f'{len(os.listdir(self.tmp.name))}.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        return path
+
+    def test_counts_demand_and_conflicts(self):
+        good = saved({'id': '11967-01', 'timeBlocks': [block(MON_1)]},
+                     {'id': '13479-01', 'timeBlocks': [block(MON_1)]},
+                     {'id': 'CUSTOM-001', 'timeBlocks': [block(MON_A)]})
+        result = analyze_file(self.write([good]), CATALOG)
+        self.assertEqual(result['demand'], Counter({'11967-01': 1, '13479-01': 1}))
+        self.assertEqual(result['changed'], Counter({'13479-01': 1}))
+        self.assertEqual(result['conflicts'], Counter({('11967-01', '13479-01'): 1}))
+        self.assertEqual(result['otherConflicts'], 2)
+        self.assertEqual(result['missing'], Counter({'CUSTOM-001': 1}))
+
+    def test_bad_timetables_are_skipped(self):
+        good = saved({'id': '11967-01', 'timeBlocks': [block(MON_1)]})
+        no_day = saved({'id': 'CUSTOM-001', 'timeBlocks': [{'startTime': '09:00', 'endTime': '10:00'}]})
+        result = analyze_file(self.write([1, saved(2), no_day, good]), CATALOG)
+        self.assertIsNone(result['error'])
+        self.assertEqual(result['timetables'], 1)
+        self.assertEqual(result['badTimetables'], 3)
+        self.assertEqual(len(result['errors']), 3)
+        self.assertEqual(result['demand'], Counter({'11967-01': 1}))
+
+    def test_unreadable_file(self):
+        self.assertIsNotNone(analyze_file(self.write(5), CATALOG)['error'])
+        path = os.path.join(self.tmp.name, 'broken.json')
+        with open(path, 'w') as f:
+            f.write('[{')
+        self.assertIsNotNone(analyze_file(path, CATALOG)['error'])
+
+    def test_missing_ids_are_capped(self):
+        counter = Counter()
+        self.assertEqual(count_capped(counter, ['a', 'b', 'c', 'a'], 2), 1)
+        self.assertEqual(counter, Counter({'a': 2, 'b': 1}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""엑셀/TS 비교 감시 모드(catalog/watch.py).
+
+임시 폴더에 excel_data.json 과 core.ts 를 만들고, 파일을 바꿀 때마다 poll 이
+바뀐 과목만 다시 비교하는지 본다.
+
+    python -m pytest tests
+"""
+import os
+import tempfile
+import unittest
+
+from catalog.snapshot import write_snapshot
+from catalog.watch import WatchState
+
+HEADER = ['과목명', '이수구분', '학수번호', '분반', '학점-강의-실습', '단과대학', '[학부]학과',
+          '수강대상 학년', '담당교수', '강의시간', '강의실']
+TS_HEADER = "import { type Course } from '../../types/index.ts'\n\nexport const CORE_COURSES: Course[] = [\n"
+
+
+def excel_row(code, section, time_raw, room):
+    return ['채플', '교필(문화)', code, section, 'P-1-0', '모든 대학', '모든 학과', '1', '선교훈련팀',
+            time_raw, room]
+
+
+def ts_course(code, section, time_raw, room):
+    return (f"  {{ id: '{code}-{section}', code: '{code}', section: '{section}', name: '채플', "
+            f"creditDetail: 'P-1-0', professors: ['선교훈련팀'], timeRaw: '{time_raw}', roomRaw: '{room}' }},\n")
+
+
+class WatchStateTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.saves = 0
+        self.excel = os.path.join(self.tmp.name, 'excel_data.json')
+        self.courses = os.path.join(self.tmp.name, 'courses')
+        os.mkdir(self.courses)
+        self.core = os.path.join(self.courses, 'core.ts')
+        self.write_excel([excel_row('13479', '01', '화2', '060141'), excel_row('13479', '02', '화3', '060141'),
+                          excel_row('13479', '03', '목2', '060141')])
+        self.write_ts(ts_course('13479', '01', '화2', '060141') + ts_course('13479', '02', '화3', '060142')
+                      + ts_course('13479', '04', '금2', '060141'))
+        self.state = WatchState(self.excel, self.courses)
+        self.core_cmp = self.state.comparisons[0]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_excel(self, rows):
+        write_snapshot({'교필': [HEADER] + rows}, self.excel)
+        self.touch(self.excel)
+
+    def write_ts(self, body):
+        with open(self.core, 'w', encoding='utf-8') as f:
+            f.write(TS_HEADER + body + ']\n')
+        self.touch(self.core)
+
+    def touch(self, path):
+        # 같은 크기로 빠르게 다시 써도 mtime 이 달라지게 저장할 때마다 1초씩 민다
+        self.saves += 1
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + self.saves * 1_000_000_000))
+
+    def test_initial_comparison(self):
+        self.assertEqual(self.core_cmp.name, '교필')
+        self.assertEqual(self.core_cmp.missing, {'13479-03'})
+        self.assertEqual(self.core_cmp.extra, {'13479-04'})
+        self.assertEqual(self.core_cmp.diffs, {'13479-02': ["roomRaw: '060142'->'060141'"]})
+        self.assertEqual(self.state.poll(), [])
+
+    def test_ts_change_updates_only_changed_ids(self):
+        self.write_ts(ts_course('13479', '01', '화2', '060141') + ts_course('13479', '02', '화3', '060141')
+                      + ts_course('13479', '03', '목2', '060141'))
+        [(path, results, error)] = self.state.poll()
+        self.assertEqual((path, error), (self.core, None))
+        changed = dict((c.name, ids) for c, ids in results)
+        self.assertEqual(changed['교필'], ['13479-02', '13479-03', '13479-04'])
+        self.assertEqual((self.core_cmp.missing, self.core_cmp.extra, self.core_cmp.diffs), (set(), set(), {}))
+        self.assertEqual(self.core_cmp.describe('13479-02'), '13479-02: 일치')
+
+    def test_broken_ts_keeps_previous_state(self):
+        with open(self.core, 'w', encoding='utf-8') as f:
+            f.write(TS_HEADER + ts_course('13479', '01', '화2', '060141') + "  { id: '13479-05', name: \n")
+        self.touch(self.core)
+        [(path, results, error)] = self.state.poll()
+        self.assertEqual(results, [])
+        self.assertIsNotNone(error)
+        self.assertEqual(self.core_cmp.extra, {'13479-04'})
+        self.assertEqual(self.state.poll(), [])
+
+    def test_excel_change(self):
+        self.write_excel([excel_row('13479', '01', '화4', '060141'), excel_row('13479', '02', '화3', '060142')])
+        [(path, results, error)] = self.state.poll()
+        self.assertEqual((path, error), (self.excel, None))
+        self.assertEqual(dict((c.name, ids) for c, ids in results)['교필'], ['13479-01', '13479-02', '13479-03'])
+        self.assertEqual(self.core_cmp.missing, set())
+        self.assertEqual(self.core_cmp.diffs, {'13479-01': ["timeRaw: '화2'->'화4'"]})
+        self.assertEqual(self.core_cmp.summary(), '누락 0, 추가 1, 차이 1')
+
+
+if __name__ == '__main__':
+    unittest.main()
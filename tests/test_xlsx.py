@@ -0,0 +1,84 @@
+"""스트리밍 xlsx 리더(catalog/xlsx.py)와 openpyxl 결과 대조.
+
+테스트 안에서 openpyxl 로 작은 수강편람을 만들고, 두 엔진으로 읽은 행과 레코드가 같은지 본다.
+
+    python -m pytest tests
+"""
+import datetime
+import os
+import tempfile
+import unittest
+
+import openpyxl
+
+from catalog import sheets, xlsx
+from catalog.records import CourseRecord
+
+GYOPIL_HEADER = ['과목명', '이수구분', '학수번호', '분반', '학점-강의-실습', '단과대학', '[학부]학과',
+                 '수강대상 학년', '담당교수', '강의시간', '강의실', '수강인원', '개설일']
+# 기대 위치(SHEET_COLUMNS)와 다른 열 순서 + 파싱에 쓰지 않는 열
+MAJOR_HEADER = ['학수번호', '분반', '단과대학', '학부/학과', '전공', '학년', '과목 명', '이수구분', '학점',
+                '담당교수', '메모', '강의시간', '강의실', '비고']
+
+
+def build_workbook(path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = '교필'
+    ws.append(['2026학년도 1학기 교양필수'])
+    ws.append([])
+    ws.append(GYOPIL_HEADER)
+    for n in range(20):
+        ws.append([f'채플{n}', '교필', 10000 + n, n % 3 + 1, '0.5-1-0', '모든 대학', None, 1 + n % 4,
+                   '선교훈련팀' if n % 2 else '정종진, 이형우', f'화{n % 9 + 1}', '060141(성지관)',
+                   40 + n, datetime.datetime(2026, 3, 2)])
+        if n == 12:
+            ws.append(GYOPIL_HEADER)  # 중간에 반복되는 헤더
+    ws = wb.create_sheet('전공')
+    ws.append(MAJOR_HEADER)
+    for n in range(15):
+        ws.append([20000 + n, '01', '스마트융합대학', '컴퓨터공학부', None, 2, f'자료구조{n}', '전필', 3.0,
+                   '김교수', f'메모{n}', '월1,2', '090408-0', None if n % 2 else '영어강의'])
+    wb.create_sheet('기타').append(['한 칸', 1, 2.5, True, None, datetime.date(2026, 3, 2)])
+    wb.save(path)
+
+
+def record_values(tables):
+    return {name: [tuple(getattr(r, f) for f in CourseRecord.__slots__) for r in table]
+            for name, table in tables.items()}
+
+
+class StreamReaderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, '수강편람.xlsx')
+        build_workbook(cls.path)
+        cls.expected = sheets.read_workbook_rows(cls.path, engine='openpyxl')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_all_columns_match_openpyxl(self):
+        self.assertEqual(xlsx.read_workbook_rows(self.path), self.expected)
+
+    def test_projected_records_match_openpyxl(self):
+        actual = sheets.read_workbook_rows(self.path, engine='stream')
+        self.assertEqual(record_values(sheets.load_sheets(actual)),
+                         record_values(sheets.load_sheets(self.expected)))
+        self.assertEqual(len(actual['교필']), len(self.expected['교필']))
+        self.assertEqual(actual['기타'], self.expected['기타'])
+
+    def test_projection_skips_unused_columns(self):
+        actual = sheets.read_workbook_rows(self.path, engine='stream')
+        # 헤더를 찾는 앞쪽 행은 모두 읽고, 그 아래는 파싱에 쓰는 열만 읽는다
+        self.assertEqual(actual['전공'][0], self.expected['전공'][0])
+        last, want = actual['전공'][-1], self.expected['전공'][-1]
+        self.assertEqual(last[MAJOR_HEADER.index('메모')], '')
+        self.assertEqual(last[MAJOR_HEADER.index('강의시간')], want[MAJOR_HEADER.index('강의시간')])
+        self.assertEqual(actual['교필'][-1][GYOPIL_HEADER.index('개설일')], '')
+
+
+if __name__ == '__main__':
+    unittest.main()
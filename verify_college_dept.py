@@ -2,14 +2,13 @@
 엑셀 전공 시트의 college/department/major 와
 코드 내 과목 데이터의 college/department/major 를 비교하여 불일치를 찾는 스크립트
 """
-import json
 import re
 import os
 
-# 1) 엑셀 데이터 로드
-with open("excel_data.json", "r", encoding="utf-8") as f:
-    excel_data = json.load(f)
+from catalog.snapshot import Snapshot
 
+# 1) 엑셀 데이터 로드 (전공 시트만 읽음)
+excel_data = Snapshot("excel_data.json")
 major_rows = excel_data.get("전공", [])
 # header: ['단과대학', '학부/학과', '전공', '학년', '학수번호', '분반', '과목 명', '이수구분', '학점', '담당교수', '강의시간', '강의실', '비고']
 # idx:      0           1            2       3       4           5
@@ -1,8 +1,9 @@
-import json, re, os
+import re, os
 
-with open("excel_data.json", "r", encoding="utf-8") as f:
-    excel_data = json.load(f)
+from catalog.snapshot import Snapshot
 
+# 전공 시트만 읽는다 (excel_data.index.json 의 오프셋 사용)
+excel_data = Snapshot("excel_data.json")
 major_rows = excel_data["전공"]
 excel_map = {}
 for row in major_rows[2:]: